@@ -18,4 +18,9 @@ class Attack(Component):
         self.attack_range = attack_range
         self.attack_speed = attack_speed
         self.attack_target: int | None = None
-        self.attack_cooldown = 0.0
+        # The simulation time (GameState.timers.now) of the next attack
+        self.ready_at = 0.0
+        # The AISystem think slot this unit last acquired targets in. None
+        # means "think on the next AI update" (new units, or units woken up
+        # by taking damage).
+        self.think_slot: int | None = None
@@ -1,2 +1,62 @@
 class Component:
-    """A base class for all components in the ECS."""
+    """A base class for all components in the ECS.
+
+    Once added to an entity, a component can report to its GameState:
+
+    * A component that only needs per-tick work in some states (or that
+      other code looks up by state, like selection) names a GameState
+      active set in ACTIVE_SET and overrides is_active. The setters of the
+      fields is_active depends on call _changed, which adds the entity to
+      the set or drops it, so the system owning the set only visits the
+      entities with work to do.
+    * A component whose changes other systems want to hear about names a
+      change channel in CHANGE_CHANNEL. GameState records its addition and
+      removal there, and _changed records every write to a tracked field, so
+      consumers can ask which entities changed since a given version.
+    """
+
+    # The name of the GameState active set tracking this component, if any
+    ACTIVE_SET: str | None = None
+    # The name of the GameState change channel recording this component's
+    # changes, if any
+    CHANGE_CHANNEL: str | None = None
+
+    _game_state = None
+    _active: set[int] | None = None
+    _entity_id: int | None = None
+
+    def track(self, game_state, entity_id: int | None = None) -> None:
+        """Starts reporting to a GameState, or stops if game_state is None.
+
+        Args:
+            game_state: The GameState of the entity, or None to stop.
+            entity_id: The ID of the entity the component belongs to.
+        """
+        if self._active is not None:
+            self._active.discard(self._entity_id)
+        self._game_state = game_state
+        self._entity_id = entity_id
+        self._active = game_state.get_active_entities(self.ACTIVE_SET) if game_state and self.ACTIVE_SET else None
+        self._update_activity()
+
+    def is_active(self) -> bool:
+        """Returns whether the entity belongs in the ACTIVE_SET."""
+        return False
+
+    def _changed(self) -> None:
+        """Reports that a tracked field was written."""
+        game_state = self._game_state
+        if game_state is None:
+            return
+        self._update_activity()
+        game_state.component_changed(self._entity_id, self)
+
+    def _update_activity(self) -> None:
+        """Adds the entity to the active set or drops it."""
+        active = self._active
+        if active is None:
+            return
+        if self.is_active():
+            active.add(self._entity_id)
+        else:
+            active.discard(self._entity_id)
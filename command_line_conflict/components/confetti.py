@@ -1,13 +0,0 @@
-from .base import Component
-
-
-class Confetti(Component):
-    """A component that represents a confetti effect."""
-
-    def __init__(self, lifetime: float):
-        """Initializes the Confetti component.
-
-        Args:
-            lifetime: The duration of the confetti effect in seconds.
-        """
-        self.lifetime = lifetime
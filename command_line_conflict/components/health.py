@@ -4,8 +4,16 @@ from .base import Component
 class Health(Component):
     """
     A component that gives an entity health.
+
+    The entity is in the "health" active set while the HealthSystem has
+    something to do for it: it is dead, or damaged and regenerating. Changes
+    of hp, max_hp and health_regen_rate are recorded on the "health" change
+    channel.
     """
 
+    ACTIVE_SET = "health"
+    CHANGE_CHANNEL = "health"
+
     def __init__(self, hp: int, max_hp: int, health_regen_rate: float = 0.0):
         """Initializes the Health component.
 
@@ -14,6 +22,42 @@ class Health(Component):
             max_hp: The maximum health of the entity.
             health_regen_rate: The rate at which the entity regenerates health.
         """
-        self.hp = hp
-        self.max_hp = max_hp
-        self.health_regen_rate = health_regen_rate
+        self._max_hp = max_hp
+        self._health_regen_rate = health_regen_rate
+        self._hp = hp
+
+    @property
+    def hp(self) -> float:
+        """The current health of the entity."""
+        return self._hp
+
+    @hp.setter
+    def hp(self, value: float) -> None:
+        if value != self._hp:
+            self._hp = value
+            self._changed()
+
+    @property
+    def max_hp(self) -> int:
+        """The maximum health of the entity."""
+        return self._max_hp
+
+    @max_hp.setter
+    def max_hp(self, value: int) -> None:
+        if value != self._max_hp:
+            self._max_hp = value
+            self._changed()
+
+    @property
+    def health_regen_rate(self) -> float:
+        """The rate at which the entity regenerates health."""
+        return self._health_regen_rate
+
+    @health_regen_rate.setter
+    def health_regen_rate(self, value: float) -> None:
+        if value != self._health_regen_rate:
+            self._health_regen_rate = value
+            self._changed()
+
+    def is_active(self) -> bool:
+        return self._hp <= 0 or (self._hp < self._max_hp and self._health_regen_rate > 0)
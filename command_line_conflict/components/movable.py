@@ -2,7 +2,14 @@ from .base import Component
 
 
 class Movable(Component):
-    """A component that allows an entity to move."""
+    """A component that allows an entity to move.
+
+    The entity is in the "movement" active set while it has a path or a
+    target it has not arrived at. The MovementSystem marks it arrived once
+    it has nowhere left to go; a new path or target clears the mark.
+    """
+
+    ACTIVE_SET = "movement"
 
     def __init__(self, speed: float, can_fly: bool = False, intelligent: bool = True):
         """Initializes the Movable component.
@@ -13,6 +20,7 @@ class Movable(Component):
             intelligent: Whether the entity uses intelligent pathfinding to
                          avoid other units.
         """
+        self._arrived = False
         self.speed = speed
         self.target_x: float | None = None
         self.target_y: float | None = None
@@ -21,9 +29,58 @@ class Movable(Component):
         self.intelligent = intelligent
         self.hold_position: bool = False
 
-        # Optimization: Throttling for pathfinding failures
-        self.path_retry_timer: float = 0.0
+        # Optimization: Throttling for pathfinding failures. The simulation
+        # time (GameState.timers.now) of the next pathfinding attempt.
+        self.path_retry_at: float = 0.0
 
         # For non-intelligent units: ensure we only ping the player once
         # per stuck event instead of every frame.
         self.stuck_notified: bool = False
+
+    @property
+    def target_x(self) -> float | None:
+        """The x-coordinate the entity is heading to."""
+        return self._target_x
+
+    @target_x.setter
+    def target_x(self, value: float | None) -> None:
+        self._target_x = value
+        self._arrived = False
+        self._changed()
+
+    @property
+    def target_y(self) -> float | None:
+        """The y-coordinate the entity is heading to."""
+        return self._target_y
+
+    @target_y.setter
+    def target_y(self, value: float | None) -> None:
+        self._target_y = value
+        self._arrived = False
+        self._changed()
+
+    @property
+    def path(self) -> list[tuple[int, int]]:
+        """The cells left to walk through, next one first."""
+        return self._path
+
+    @path.setter
+    def path(self, value: list[tuple[int, int]]) -> None:
+        self._path = value
+        self._arrived = False
+        self._changed()
+
+    @property
+    def arrived(self) -> bool:
+        """Whether the entity reached its target and has nothing left to do until it gets a new one."""
+        return self._arrived
+
+    @arrived.setter
+    def arrived(self, value: bool) -> None:
+        self._arrived = value
+        self._changed()
+
+    def is_active(self) -> bool:
+        if self._arrived:
+            return False
+        return bool(self._path) or (self._target_x is not None and self._target_y is not None)
@@ -2,7 +2,12 @@ from .base import Component
 
 
 class Player(Component):
-    """A component that identifies an entity as belonging to a player."""
+    """A component that identifies an entity as belonging to a player.
+
+    Changes of ownership are recorded on the "owner" change channel.
+    """
+
+    CHANGE_CHANNEL = "owner"
 
     def __init__(self, player_id: int, is_human: bool = False):
         """Initializes the Player component.
@@ -11,5 +16,16 @@ class Player(Component):
             player_id: The ID of the player.
             is_human: True if the player is human-controlled.
         """
-        self.player_id = player_id
+        self._player_id = player_id
         self.is_human = is_human
+
+    @property
+    def player_id(self) -> int:
+        """The ID of the player owning the entity."""
+        return self._player_id
+
+    @player_id.setter
+    def player_id(self, value: int) -> None:
+        if value != self._player_id:
+            self._player_id = value
+            self._changed()
@@ -2,7 +2,14 @@ from .base import Component
 
 
 class Position(Component):
-    """A component that gives an entity a position in the world."""
+    """A component that gives an entity a position in the world.
+
+    Move entities with GameState.update_entity_position, which keeps the
+    spatial map up to date and records cell changes on the "position"
+    change channel.
+    """
+
+    CHANGE_CHANNEL = "position"
 
     def __init__(self, x: float, y: float):
         """Initializes the Position component.
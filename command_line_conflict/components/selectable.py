@@ -4,8 +4,29 @@ from .base import Component
 class Selectable(Component):
     """
     A component that makes an entity selectable by the player.
+
+    Selected entities are in the "selected" active set, which GameState
+    exposes as get_selected_entities. Changes of is_selected are recorded on
+    the "selection" change channel.
     """
 
+    ACTIVE_SET = "selected"
+    CHANGE_CHANNEL = "selection"
+
     def __init__(self):
         """Initializes the Selectable component."""
-        self.is_selected = False
+        self._is_selected = False
+
+    @property
+    def is_selected(self) -> bool:
+        """Whether the entity is currently selected."""
+        return self._is_selected
+
+    @is_selected.setter
+    def is_selected(self, value: bool) -> None:
+        if value != self._is_selected:
+            self._is_selected = value
+            self._changed()
+
+    def is_active(self) -> bool:
+        return self._is_selected
@@ -4,8 +4,12 @@ from .base import Component
 class Vision(Component):
     """
     A component that gives an entity vision.
+
+    Gaining or losing it is recorded on the "vision" change channel.
     """
 
+    CHANGE_CHANNEL = "vision"
+
     def __init__(self, vision_range: int):
         """Initializes the Vision component.
 
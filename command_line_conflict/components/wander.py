@@ -2,7 +2,12 @@ from .base import Component
 
 
 class Wander(Component):
-    """A component that causes an entity to wander randomly."""
+    """A component that causes an entity to wander randomly.
+
+    While tracked by a GameState, the entity has a "wander" timer on the
+    simulation clock, started when the component is added and cancelled
+    when it is removed. The WanderSystem only visits the expired ones.
+    """
 
     def __init__(self, wander_radius: int = 5, move_interval: float = 3.0):
         """Initializes the Wander component.
@@ -13,4 +18,12 @@ class Wander(Component):
         """
         self.wander_radius = wander_radius
         self.move_interval = move_interval
-        self.time_since_last_move = 0.0
+
+    def track(self, game_state, entity_id: int | None = None) -> None:
+        """Starts the entity's wander timer, or cancels it if game_state is None."""
+        if self._game_state is not None:
+            self._game_state.timers.cancel("wander", self._entity_id)
+        super().track(game_state, entity_id)
+        if game_state is not None:
+            # A new wanderer rests for a full interval before its first move.
+            game_state.timers.schedule(self.move_interval, "wander", entity_id)
@@ -17,11 +17,40 @@ SCREEN = {
 
 # The size of each grid cell in pixels.
 GRID_SIZE = 20
-# The target frames per second for the game.
+# The target frames per second for rendering. 0 renders uncapped.
 FPS = 60
+# How many fixed-size simulation ticks run per second, independent of FPS.
+SIMULATION_TICK_RATE = 30
+# The most simulation ticks a single rendered frame may catch up on. If the
+# game falls further behind, the extra time is dropped to avoid a spiral.
+MAX_SIMULATION_STEPS_PER_FRAME = 5
+# The most pixels of pre-rendered map background chunks kept in memory; the
+# least recently drawn are dropped beyond it. Also the largest range overlay.
+MAX_STATIC_MAP_LAYER_PIXELS = 4096 * 4096
+# Frames whose changed areas cover more than this fraction of the screen
+# flip the whole display instead of updating only those areas.
+DIRTY_RECTS_MAX_SCREEN_FRACTION = 0.5
+# The most floating texts and click ripples on screen at once. When a pool
+# is full, the oldest effect is recycled.
+MAX_FLOATING_TEXTS = 128
+MAX_CLICK_EFFECTS = 16
+# The most cosmetic particles (e.g. hit confetti) alive at once.
+MAX_PARTICLES = 1024
+# The most corpses on the ground at once; the oldest makes room when full.
+MAX_CORPSES = 1024
+# The most entities each change channel of GameState remembers. Beyond it,
+# the oldest half is forgotten and readers that fell behind them rebuild.
+MAX_CHANGE_RECORDS = 10000
+# Damage numbers for the same target within this many milliseconds are
+# merged into a single, growing number.
+DAMAGE_NUMBER_COALESCE_MS = 300
 # The speed of the camera movement.
 CAMERA_SPEED = 10
 
+# How many times per second an idle AI unit re-runs target acquisition.
+# Lower values trade reaction time for throughput; 0 disables throttling.
+AI_THINK_RATE = 8
+
 # A dictionary mapping player IDs to their colors.
 PLAYER_COLORS = {
     0: (128, 128, 128),  # Grey (Neutral)
@@ -0,0 +1,101 @@
+import numpy as np
+
+from . import config
+
+
+class CorpseLayer:
+    """The corpses dead units leave on the ground.
+
+    Corpses are not entities: a unit is removed as soon as it dies and only
+    its cell, glyph and age are kept here, so the dead cost nothing in the
+    spatial map, occupancy checks or entity iteration. Corpses fade out in
+    FADE_STEPS steps; the version only changes when a corpse is added,
+    reaches its next fade step or disappears, which lets the renderer bake
+    them into the ground layer and redraw only the cells that changed.
+
+    Live corpses are packed at the front of preallocated arrays, oldest
+    first.
+    """
+
+    FADE_STEPS = 4
+
+    def __init__(self, capacity: int | None = None):
+        """Initializes an empty CorpseLayer.
+
+        Args:
+            capacity: The most corpses on the ground at once; when full, the
+                oldest corpse makes room for the new one. Defaults to
+                config.MAX_CORPSES.
+        """
+        self.capacity = capacity if capacity is not None else config.MAX_CORPSES
+        self.x = np.zeros(self.capacity, dtype=np.int32)
+        self.y = np.zeros(self.capacity, dtype=np.int32)
+        # Code point of the glyph the unit was drawn with
+        self.icon = np.zeros(self.capacity, dtype=np.uint32)
+        self.age = np.zeros(self.capacity)
+        # 0 while fully opaque, up to FADE_STEPS - 1 just before disappearing
+        self.stage = np.zeros(self.capacity, dtype=np.uint8)
+        self.count = 0
+        self.version = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, x: float, y: float, icon: str) -> None:
+        """Leaves a corpse on the cell containing (x, y).
+
+        Args:
+            x: The X coordinate on the grid.
+            y: The Y coordinate on the grid.
+            icon: The glyph the unit was drawn with.
+        """
+        if self.count >= self.capacity:
+            self._compact(np.arange(self.count) > 0)
+        i = self.count
+        self.x[i] = int(x)
+        self.y[i] = int(y)
+        self.icon[i] = ord(icon[0]) if icon else ord(" ")
+        self.age[i] = 0.0
+        self.stage[i] = 0
+        self.count += 1
+        self.version += 1
+
+    def update(self, dt: float, lifetime: float) -> None:
+        """Ages every corpse by dt seconds, fading and removing the old ones.
+
+        Args:
+            dt: The time elapsed since the last update.
+            lifetime: How long a corpse stays on the ground, in seconds.
+        """
+        n = self.count
+        if not n:
+            return
+        age = self.age[:n]
+        age += dt
+        stage = np.minimum(age * self.FADE_STEPS // lifetime, self.FADE_STEPS - 1).astype(np.uint8)
+        keep = age < lifetime
+        faded = not np.array_equal(stage, self.stage[:n])
+        self.stage[:n] = stage
+        if not keep.all():
+            self._compact(keep)
+        elif not faded:
+            return
+        self.version += 1
+
+    def entries(self) -> list[tuple[int, int, str, int]]:
+        """Returns an (x, y, icon, stage) tuple per corpse, oldest first."""
+        n = self.count
+        return [
+            (x, y, chr(icon), stage)
+            for x, y, icon, stage in zip(
+                self.x[:n].tolist(), self.y[:n].tolist(), self.icon[:n].tolist(), self.stage[:n].tolist()
+            )
+        ]
+
+    def _compact(self, keep: np.ndarray) -> None:
+        """Drops the corpses whose keep flag is False, preserving the order of the rest."""
+        n = self.count
+        kept = int(np.count_nonzero(keep))
+        for values in (self.x, self.y, self.icon, self.age, self.stage):
+            values[:kept] = values[:n][keep]
+        self.count = kept
@@ -36,6 +36,7 @@ class SceneManager:
             "defeat": DefeatScene(game),
         }
         self.current_scene = self.scenes["menu"]
+        self._last_drawn_scene = None
         log.debug("SceneManager initialized with scenes: %s", list(self.scenes.keys()))
 
     def switch_to(self, scene_name, reset: bool = True):
@@ -76,20 +77,56 @@ class SceneManager:
         self.current_scene.handle_event(event)
 
     def update(self, dt):
-        """Updates the current scene.
+        """Advances the current scene by one simulation tick.
+
+        Only scenes that declare FIXED_STEP run on simulation ticks; the
+        others (menus, the editor...) update once per frame in frame_update.
 
         Args:
-            dt: The time elapsed since the last frame.
+            dt: The fixed simulation time step.
         """
-        self.current_scene.update(dt)
+        if getattr(self.current_scene, "FIXED_STEP", False) is True:
+            self.current_scene.update(dt)
+
+    def frame_update(self, dt):
+        """Runs the current scene's per-frame logic.
 
-    def draw(self, screen):
+        Scenes that are not fixed-step simulations get their update() here,
+        with the real frame time, so their animations stay as smooth as the
+        frame rate. Simulations run their frame_update hook, if any.
+
+        Args:
+            dt: The time elapsed since the last rendered frame.
+        """
+        if getattr(self.current_scene, "FIXED_STEP", False) is not True:
+            self.current_scene.update(dt)
+            return
+        frame_update = getattr(self.current_scene, "frame_update", None)
+        if frame_update:
+            frame_update(dt)
+
+    def draw(self, screen, alpha: float = 1.0):
         """Draws the current scene to the screen.
 
+        Scenes may return the list of rects that changed since their previous
+        frame; returning None means the whole screen may have changed.
+
         Args:
             screen: The pygame screen surface to draw on.
+            alpha: How far the frame is between the last two simulation
+                ticks (0.0 to 1.0), used to interpolate entity positions.
+
+        Returns:
+            The changed rects, or None if the whole screen must be updated.
         """
-        self.current_scene.draw(screen)
+        if hasattr(self.current_scene, "interpolation_alpha"):
+            self.current_scene.interpolation_alpha = alpha
+        dirty_rects = self.current_scene.draw(screen)
+        if self.current_scene is not self._last_drawn_scene:
+            # The display still shows the previous scene.
+            self._last_drawn_scene = self.current_scene
+            return None
+        return dirty_rects
 
 
 class Game:
@@ -111,6 +148,11 @@ class Game:
         log.debug(f"Screen created with resolution: {config.SCREEN['width']}x{config.SCREEN['height']}")
         self.clock = pygame.time.Clock()
         self.running = True
+        # Set when the next frame must update the whole display, e.g. after
+        # the window was uncovered or resized.
+        self.full_update_pending = True
+        self._last_screen_size = None
+        self._dev_console_was_visible = False
 
         # Prefer the bundled DejaVu font for rendering path arrows
         font_dir = Path(__file__).resolve().parent / "fonts"
@@ -156,8 +198,15 @@ class Game:
         self.dev_console = DeveloperConsole(config.SCREEN["width"], config.SCREEN["height"], self.font)
 
     def run(self) -> None:
-        """Starts and runs the main game loop."""
+        """Starts and runs the main game loop.
+
+        The simulation advances in fixed steps of 1 / SIMULATION_TICK_RATE
+        seconds, independent of the render frame rate. Frames that fall
+        between two ticks are drawn with entity positions interpolated.
+        """
         log.info("Game starting...")
+        sim_dt = 1.0 / config.SIMULATION_TICK_RATE
+        accumulator = 0.0
         while self.running:
             dt = self.clock.tick(config.FPS) / 1000.0
             profiler.record_frame(dt)
@@ -167,24 +216,70 @@ class Game:
                 if event.type == pygame.QUIT:
                     log.info("Quit event received. Stopping game loop...")
                     self.running = False
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self.full_update_pending = True
 
                 # Let dev console consume events first (e.g., toggling)
                 if getattr(config, "DEV_MODE", False) and self.dev_console.handle_event(event):
                     continue
 
                 self.scene_manager.handle_event(event)
-            self.scene_manager.update(dt)
-            self.scene_manager.draw(self.screen)
+
+            self.scene_manager.frame_update(dt)
+            accumulator += dt
+            steps = 0
+            while accumulator >= sim_dt and steps < config.MAX_SIMULATION_STEPS_PER_FRAME:
+                self.scene_manager.update(sim_dt)
+                accumulator -= sim_dt
+                steps += 1
+            if accumulator >= sim_dt:
+                # Too far behind (e.g. a long stall): drop the backlog rather
+                # than spending every following frame catching up.
+                log.debug(f"Simulation fell behind; dropping {accumulator:.3f}s")
+                accumulator %= sim_dt
+
+            dirty_rects = self.scene_manager.draw(self.screen, accumulator / sim_dt)
 
             if getattr(config, "DEV_MODE", False):
                 self.dev_console.draw(self.screen)
+                if self.dev_console.is_visible != self._dev_console_was_visible:
+                    self._dev_console_was_visible = self.dev_console.is_visible
+                    dirty_rects = None
+                elif self.dev_console.is_visible and dirty_rects is not None:
+                    dirty_rects = dirty_rects + [self.dev_console.surface.get_rect()]
 
-            pygame.display.flip()
+            self._present(dirty_rects)
 
         profiler.flush()
         log.info("Game loop finished. Quitting...")
         pygame.quit()
 
+    def _present(self, dirty_rects) -> None:
+        """Pushes the frame to the display.
+
+        Only the dirty rects are copied when they cover a small part of the
+        screen; otherwise (or when a full update is pending) the whole
+        display is flipped.
+
+        Args:
+            dirty_rects: The rects that changed this frame, or None if the
+                whole screen may have changed.
+        """
+        screen_width, screen_height = self.screen.get_size()
+        if (screen_width, screen_height) != self._last_screen_size:
+            self._last_screen_size = (screen_width, screen_height)
+            self.full_update_pending = True
+
+        if dirty_rects is not None and not self.full_update_pending:
+            dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+            if dirty_area <= screen_width * screen_height * config.DIRTY_RECTS_MAX_SCREEN_FRACTION:
+                if dirty_rects:
+                    pygame.display.update(dirty_rects)
+                return
+
+        self.full_update_pending = False
+        pygame.display.flip()
+
 
 def main(game_map: Map | None = None) -> None:
     """Initializes and runs the game.
@@ -2,7 +2,6 @@
 
 from . import config
 from .components.attack import Attack
-from .components.confetti import Confetti
 from .components.detection import Detection
 from .components.factory import Factory
 from .components.flee import Flee
@@ -11,7 +10,6 @@ from .components.movable import Movable
 from .components.player import Player
 from .components.position import Position
 from .components.renderable import Renderable
-from .components.resource_deposit import ResourceDeposit
 from .components.selectable import Selectable
 from .components.unit_identity import UnitIdentity
 from .components.vision import Vision
@@ -73,24 +71,6 @@ def create_wildlife(game_state: GameState, x: float, y: float) -> int:
     return entity_id
 
 
-def create_confetti(game_state: GameState, x: float, y: float) -> int:
-    """Creates a new confetti effect.
-    Args:
-        game_state: The current state of the game.
-        x: The x-coordinate where the effect will be created.
-        y: The y-coordinate where the effect will be created.
-    Returns:
-        The entity ID of the newly created effect.
-    """
-    entity_id = game_state.create_entity()
-    if config.DEBUG:
-        log.debug(f"Created confetti (ID: {entity_id}) at ({x}, {y})")
-    game_state.add_component(entity_id, Position(x, y))
-    game_state.add_component(entity_id, Renderable(icon="*"))
-    game_state.add_component(entity_id, Confetti(lifetime=0.5))
-    return entity_id
-
-
 def create_rover(game_state: GameState, x: float, y: float, player_id: int, is_human: bool = False) -> int:
     """Creates a new rover unit.
     Args:
@@ -296,24 +276,3 @@ UNIT_NAME_TO_FACTORY = {
     "immortal": create_immortal,
     "extractor": create_extractor,
 }
-
-
-def create_scrap(game_state: GameState, x: float, y: float, amount: int = 50) -> int:
-    """Creates a scrap entity that can be harvested by players.
-
-    Args:
-        game_state: The current state of the game.
-        x: The x-coordinate where the scrap will be created.
-        y: The y-coordinate where the scrap will be created.
-        amount: The amount of scrap resources this entity holds.
-    Returns:
-        The entity ID of the newly created scrap.
-    """
-    entity_id = game_state.create_entity()
-    if config.DEBUG:
-        log.debug(f"Created scrap (ID: {entity_id}) at ({x}, {y}) with amount {amount}")
-    game_state.add_component(entity_id, Position(x, y))
-    game_state.add_component(entity_id, Renderable(icon="$", color=(255, 215, 0)))  # Gold color
-    game_state.add_component(entity_id, UnitIdentity(name="scrap"))
-    game_state.add_component(entity_id, ResourceDeposit(amount=amount))
-    return entity_id
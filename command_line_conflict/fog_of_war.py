@@ -1,23 +1,38 @@
+from typing import Iterable
+
+import numpy as np
 import pygame
 
 from . import config
 from .logger import log
+from .visibility import VisibilityGrid
 
 
 class FogOfWar:
     """Manages the fog of war overlay, revealing the map based on unit vision.
 
-    Optimized to use a persistent texture and differential updates.
+    The cell states come from a VisibilityGrid, either the fog's own or one
+    maintained by GameState; only the area changed since the last sync is
+    rewritten in the texture's alpha channel, through pygame.surfarray. The
+    texture is scaled to the screen for a window a few tiles larger than the
+    view, and the part under the camera is blitted from it; panning costs a
+    single blit until the view leaves that margin, the fog changes or the
+    zoom does.
     """
 
-    HIDDEN = 0
-    EXPLORED = 1
-    VISIBLE = 2
+    HIDDEN = VisibilityGrid.HIDDEN
+    EXPLORED = VisibilityGrid.EXPLORED
+    VISIBLE = VisibilityGrid.VISIBLE
+
+    # How many tiles the cached overlay extends past each side of the view.
+    OVERLAY_MARGIN = 8
 
     # Colors for the fog texture
     COLOR_HIDDEN = (0, 0, 0, 255)
     COLOR_EXPLORED = (0, 0, 0, 180)
     COLOR_VISIBLE = (0, 0, 0, 0)
+    # Texture alpha indexed by cell state; the color channels stay black.
+    _ALPHA_BY_STATE = np.array([COLOR_HIDDEN[3], COLOR_EXPLORED[3], COLOR_VISIBLE[3]], dtype=np.uint8)
 
     def __init__(self, width: int, height: int):
         """Initializes the FogOfWar system.
@@ -28,90 +43,68 @@ class FogOfWar:
         """
         self.width = width
         self.height = height
-        # Logic grid
-        self.grid = [[self.HIDDEN for _ in range(width)] for _ in range(height)]
+        self.visibility = VisibilityGrid(width, height)
+        self._synced_version: int | None = 0
 
         # Visual texture (1 pixel per tile)
         self.fog_texture = pygame.Surface((width, height), pygame.SRCALPHA)
         self.fog_texture.fill(self.COLOR_HIDDEN)
 
-        self.visible_cells: set[tuple[int, int]] = set()
-        self._vision_cache: dict[int, list[tuple[int, int]]] = {}
-        self._last_vision_sources: set[tuple[int, int, int]] = set()
+        # Incremented whenever the fog texture changes.
+        self.version = 0
+        self._overlay: pygame.Surface | None = None
+        self._overlay_key: tuple | None = None
+        # The (x0, y0, x1, y1) tiles the cached overlay covers, with a camera
+        self._overlay_window: tuple[int, int, int, int] | None = None
         log.info(f"Initialized FogOfWar with grid size {width}x{height}")
 
-    def _get_vision_offsets(self, radius: int) -> list[tuple[int, int]]:
-        if radius not in self._vision_cache:
-            offsets = []
-            r2 = radius * radius
-            for dy in range(-radius, radius + 1):
-                for dx in range(-radius, radius + 1):
-                    if dx * dx + dy * dy <= r2:
-                        offsets.append((dx, dy))
-            self._vision_cache[radius] = offsets
-        return self._vision_cache[radius]
-
-    def update(self, units: list) -> None:
+    @property
+    def grid(self) -> np.ndarray:
+        """The HIDDEN/EXPLORED/VISIBLE state of each cell, indexed [y][x]."""
+        return self.visibility.grid
+
+    @property
+    def visible(self) -> np.ndarray:
+        """Whether each cell is currently seen, indexed [y][x]."""
+        return self.visibility.visible
+
+    def update(self, sources: Iterable[tuple[float, float, int]]) -> None:
         """Updates the fog of war based on unit positions and vision.
 
         Args:
-            units: A list of unit objects that have vision. Each unit must have
-                   x, y, and vision_range attributes.
+            sources: An (x, y, vision_range) tuple per unit with vision.
         """
-        # Optimization: Check if vision sources have changed
-        # We care about integer grid coordinates and vision range.
-        # This reduces update cost from O(N*R^2) to O(N) when units are stationary.
-        current_sources = set()
-        for unit in units:
-            current_sources.add((int(unit.x), int(unit.y), int(unit.vision_range)))
-
-        if current_sources == self._last_vision_sources:
-            return
-
-        self._last_vision_sources = current_sources
+        self.visibility.update(sources)
+        self.sync()
 
-        # Calculate currently visible cells
-        current_visible = set()
+    def sync(self, visibility: VisibilityGrid | None = None) -> None:
+        """Brings the fog texture up to date with a visibility grid.
 
-        for unit in units:
-            ux, uy = int(unit.x), int(unit.y)
-            vision_range = int(unit.vision_range)
-
-            offsets = self._get_vision_offsets(vision_range)
-
-            for dx, dy in offsets:
-                x, y = ux + dx, uy + dy
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    current_visible.add((x, y))
-
-        # Determine what changed
-        to_explore = self.visible_cells - current_visible
-        to_reveal = current_visible - self.visible_cells
+        Args:
+            visibility: The grid to show from now on, e.g. one maintained by
+                GameState. Defaults to the grid the fog already shows.
+        """
+        if visibility is not None and visibility is not self.visibility:
+            self.visibility = visibility
+            self._synced_version = None
 
-        # If nothing changed, we are done
-        if not to_explore and not to_reveal:
+        version = self.visibility.version
+        if version == self._synced_version:
             return
+        # Only the area touched since the last sync needs to be rewritten
+        area = None if self._synced_version is None else self.visibility.changed_area_since(self._synced_version)
+        x0, y0, x1, y1 = area or (0, 0, self.width, self.height)
+        self._synced_version = version
 
-        # Update grid and texture
-        # Using PixelArray for faster pixel access
+        # Push the new alpha values to the texture in one array copy
         try:
-            px = pygame.PixelArray(self.fog_texture)
-
-            for x, y in to_explore:
-                self.grid[y][x] = self.EXPLORED
-                px[x, y] = self.COLOR_EXPLORED  # type: ignore
-
-            for x, y in to_reveal:
-                self.grid[y][x] = self.VISIBLE
-                px[x, y] = self.COLOR_VISIBLE  # type: ignore
-
-            # No need to explicitly delete px, context manager or del works
-            del px
+            pixels = pygame.surfarray.pixels_alpha(self.fog_texture)
+            pixels[x0:x1, y0:y1] = self._ALPHA_BY_STATE[self.grid[y0:y1, x0:x1]].T
+            del pixels
         except Exception as e:  # pylint: disable=broad-except
             log.error(f"Error updating fog texture: {e}")
 
-        # Update state
-        self.visible_cells = current_visible
+        self.version += 1
 
     def draw(self, screen: pygame.Surface, camera=None) -> None:
         """Draws the fog of war overlay onto the screen.
@@ -134,12 +127,6 @@ class FogOfWar:
             zoom = camera.zoom
             scaled_tile_size = grid_size * zoom
 
-            # Map top-left on screen
-            # map_screen_x = -camera.x * scaled_tile_size
-            # map_screen_y = -camera.y * scaled_tile_size
-
-            # Better: Subsurface the visible part of the texture, then scale it.
-
             start_x = int(camera.x)
             start_y = int(camera.y)
             # Add buffer
@@ -159,26 +146,39 @@ class FogOfWar:
             if w <= 0 or h <= 0:
                 return
 
-            # Extract source patch
-            sub = self.fog_texture.subsurface((start_x, start_y, w, h))
-
-            # Target size
-            target_w = int(w * scaled_tile_size)
-            target_h = int(h * scaled_tile_size)
-
-            # Scale
-            try:
-                scaled = pygame.transform.smoothscale(sub, (target_w, target_h))
-            except (pygame.error, ValueError):
-                # Fallback if smoothscale fails (e.g. wrong bit depth)
-                scaled = pygame.transform.scale(sub, (target_w, target_h))
-
-            # Blit position
-            # (start_x - camera.x) * scaled_tile_size
+            key = (self.version, zoom, screen_w, screen_h)
+            window = self._overlay_window
+            if (
+                key != self._overlay_key
+                or window is None
+                or not (window[0] <= start_x and window[1] <= start_y and end_x <= window[2] and end_y <= window[3])
+            ):
+                # Scale a window reaching OVERLAY_MARGIN tiles past the view,
+                # so the next pans are served from the same overlay.
+                margin = self.OVERLAY_MARGIN
+                window = (
+                    max(0, start_x - margin),
+                    max(0, start_y - margin),
+                    min(self.width, end_x + margin),
+                    min(self.height, end_y + margin),
+                )
+                x0, y0, x1, y1 = window
+                sub = self.fog_texture.subsurface((x0, y0, x1 - x0, y1 - y0))
+                self._overlay = self._scale(sub, int((x1 - x0) * scaled_tile_size), int((y1 - y0) * scaled_tile_size))
+                self._overlay_key = key
+                self._overlay_window = window
+
+            # The part of the overlay under the view, blitted at the camera offset
+            area = pygame.Rect(
+                int((start_x - window[0]) * scaled_tile_size),
+                int((start_y - window[1]) * scaled_tile_size),
+                int(w * scaled_tile_size),
+                int(h * scaled_tile_size),
+            )
             pos_x = (start_x - camera.x) * scaled_tile_size
             pos_y = (start_y - camera.y) * scaled_tile_size
 
-            screen.blit(scaled, (pos_x, pos_y))
+            screen.blit(self._overlay, (pos_x, pos_y), area)
 
         else:
             # Full map fit to screen? Or just scale by grid size?
@@ -186,8 +186,18 @@ class FogOfWar:
             target_w = self.width * grid_size
             target_h = self.height * grid_size
 
-            try:
-                scaled = pygame.transform.smoothscale(self.fog_texture, (target_w, target_h))
-            except (pygame.error, ValueError):
-                scaled = pygame.transform.scale(self.fog_texture, (target_w, target_h))
-            screen.blit(scaled, (0, 0))
+            key = (self.version, None, target_w, target_h)
+            if key != self._overlay_key:
+                self._overlay = self._scale(self.fog_texture, target_w, target_h)
+                self._overlay_key = key
+                self._overlay_window = None
+            screen.blit(self._overlay, (0, 0))
+
+    @staticmethod
+    def _scale(surf: pygame.Surface, target_w: int, target_h: int) -> pygame.Surface:
+        """Scales part of the fog texture to screen size, smoothing tile edges."""
+        try:
+            return pygame.transform.smoothscale(surf, (target_w, target_h))
+        except (pygame.error, ValueError):
+            # Fallback if smoothscale fails (e.g. wrong bit depth)
+            return pygame.transform.scale(surf, (target_w, target_h))
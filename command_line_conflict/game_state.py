@@ -1,9 +1,22 @@
 from typing import Any, Optional
 
 from . import config
+from .components.base import Component
+from .components.health import Health
+from .components.player import Player
 from .components.position import Position
+from .components.selectable import Selectable
+from .components.unit_identity import UnitIdentity
+from .corpses import CorpseLayer
 from .logger import log
 from .maps.base import Map
+from .particles import ParticleEmitter
+from .timers import TimerWheel
+from .triggers import TriggerEvent, TriggerZones
+from .visibility import VisibilityGrid
+
+# The components that decide whether and how an entity is counted in the census
+CENSUS_COMPONENTS = (Player, Health, UnitIdentity)
 
 
 class GameState:
@@ -26,8 +39,45 @@ class GameState:
         self.spatial_map: dict[tuple[int, int], set[int]] = {}
         # Component index for O(1) entity lookup by component type
         self.component_index: dict[type, set[int]] = {}
+        # Entities whose components currently need per-tick work, by the
+        # ACTIVE_SET name of the component. Kept up to date by the components.
+        self.active_sets: dict[str, set[int]] = {}
+        # Incremented on every change recorded with mark_changed
+        self.change_version = 0
+        # The entities changed on each change channel, mapped to the version
+        # of their latest change and ordered oldest change first.
+        self._changes: dict[str, dict[int, int]] = {}
+        # The latest change version each channel has forgotten records of
+        self._changes_floor: dict[str, int] = {}
+        # How many units (entities with a Player and Health) each
+        # (player_id, is_human, unit type) has, and the key each is counted
+        # under. Kept up to date as the components come and go.
+        self.census: dict[tuple[int, bool, str | None], int] = {}
+        self._census_keys: dict[int, tuple[int, bool, str | None]] = {}
+        # Numbered control groups by (player_id, group number). Entities are
+        # not removed from them when they die; recalling a group drops them.
+        self.control_groups: dict[tuple[int, int], set[int]] = {}
         # Resource tracker mapping player_id to scrap count
         self.resources: dict[int, int] = {1: 0, 2: 0}
+        # Scrap piles by cell. They are not entities, so they cost nothing
+        # in the spatial map, occupancy checks or entity iteration. Each pile
+        # is a "scrap" trigger zone.
+        self.scrap: dict[tuple[int, int], int] = {}
+        # Cells that raise enter/leave events, fed by the spatial map updates
+        self.triggers = TriggerZones()
+        # Where entities that moved during the current simulation tick were
+        # when it started. The renderer interpolates between these and the
+        # current positions when frames fall between two ticks.
+        self.previous_positions: dict[int, tuple[float, float]] = {}
+        # What each player can see, maintained by the VisionSystem.
+        self.visibility: dict[int, VisibilityGrid] = {}
+        # Cosmetic particles, kept out of the entity tables.
+        self.particles = ParticleEmitter()
+        # What is left of dead units, kept out of the entity tables.
+        self.corpses = CorpseLayer()
+        # The simulation clock. Systems schedule their timers on it instead of
+        # counting down a timer per entity every tick.
+        self.timers = TimerWheel(1.0 / config.SIMULATION_TICK_RATE)
 
     def _add_to_spatial_map(self, entity_id: int, x: int, y: int) -> None:
         pos = (x, y)
@@ -42,6 +92,30 @@ class GameState:
             if not self.spatial_map[pos]:
                 del self.spatial_map[pos]
 
+    def _leave_cell(self, entity_id: int, cell: tuple[int, int]) -> None:
+        if cell in self.triggers:
+            self.triggers.fire(TriggerZones.LEAVE, entity_id, cell)
+
+    def begin_tick(self) -> None:
+        """Marks the start of a simulation tick.
+
+        Forgets the previous positions recorded during the last tick, so
+        only entities that move during this one are interpolated.
+        """
+        self.previous_positions.clear()
+
+    def get_visibility(self, player_id: int) -> VisibilityGrid:
+        """Returns a player's visibility grid, creating an all-hidden one on first use.
+
+        Args:
+            player_id: The ID of the player.
+        """
+        visibility = self.visibility.get(player_id)
+        if visibility is None:
+            visibility = VisibilityGrid(self.map.width, self.map.height)
+            self.visibility[player_id] = visibility
+        return visibility
+
     def add_event(self, event: dict) -> None:
         """Adds an event to the event queue.
 
@@ -78,6 +152,9 @@ class GameState:
             component: The component instance to add.
         """
         component_type = type(component)
+        replaced = self.entities[entity_id].get(component_type)
+        if replaced is not None and replaced is not component:
+            self._untrack(entity_id, replaced)
         self.entities[entity_id][component_type] = component
 
         # Update component index
@@ -86,7 +163,16 @@ class GameState:
         self.component_index[component_type].add(entity_id)
 
         if isinstance(component, Position):
-            self._add_to_spatial_map(entity_id, int(component.x), int(component.y))
+            cell = (int(component.x), int(component.y))
+            self._add_to_spatial_map(entity_id, *cell)
+            if cell in self.triggers:
+                self.triggers.fire(TriggerZones.ENTER, entity_id, cell)
+        if isinstance(component, Component):
+            component.track(self, entity_id)
+            if component.CHANGE_CHANNEL:
+                self.mark_changed(component.CHANGE_CHANNEL, entity_id)
+        if component_type in CENSUS_COMPONENTS:
+            self._recount(entity_id)
         if config.DEBUG:
             log.debug(f"Added component {component_type.__name__} to entity {entity_id}")
 
@@ -114,6 +200,176 @@ class GameState:
         """
         return self.component_index.get(component_type, set())
 
+    def get_active_entities(self, name: str) -> set[int]:
+        """Returns the entities in an active set.
+
+        Components with an ACTIVE_SET add their entity to the set of that
+        name while their system has work to do for them, and drop it once it
+        hasn't. The set is live: iterate over a copy if the loop changes the
+        tracked fields.
+
+        Args:
+            name: The ACTIVE_SET name, e.g. "health" or "movement".
+        """
+        active = self.active_sets.get(name)
+        if active is None:
+            active = self.active_sets[name] = set()
+        return active
+
+    def mark_changed(self, channel: str, entity_id: int) -> None:
+        """Records that an entity changed on a change channel.
+
+        Components record their own changes on their CHANGE_CHANNEL: being
+        added or removed, and writes to the fields they track. Consumers
+        remember change_version and later ask changed_since for what changed
+        after it, instead of re-reading every entity.
+
+        Args:
+            channel: The change channel, e.g. "position" or "health".
+            entity_id: The ID of the entity that changed.
+        """
+        self.change_version += 1
+        changes = self._changes.get(channel)
+        if changes is None:
+            changes = self._changes[channel] = {}
+        # Re-inserting keeps the dict ordered by version.
+        changes.pop(entity_id, None)
+        changes[entity_id] = self.change_version
+        if len(changes) > config.MAX_CHANGE_RECORDS:
+            # Forget the oldest half, so compacting stays amortized O(1).
+            records = list(changes.items())
+            half = len(records) // 2
+            self._changes_floor[channel] = records[half - 1][1]
+            self._changes[channel] = dict(records[half:])
+
+    def changed_since(self, channel: str, version: int) -> list[int] | None:
+        """Returns the entities that changed on a change channel after a version.
+
+        Runs in time proportional to the number of changed entities. Removed
+        entities are included; they are no longer in entities. A channel
+        remembers at most config.MAX_CHANGE_RECORDS entities, so a reader that
+        fell further behind gets None and must re-read every entity.
+
+        Args:
+            channel: The change channel, e.g. "position" or "health".
+            version: A change_version read earlier.
+
+        Returns:
+            The IDs of the changed entities, oldest change first, or None if
+            records from after the version have been forgotten.
+        """
+        if version < self._changes_floor.get(channel, 0):
+            return None
+        changes = self._changes.get(channel)
+        if not changes:
+            return []
+        changed = []
+        for entity_id, changed_version in reversed(changes.items()):
+            if changed_version <= version:
+                break
+            changed.append(entity_id)
+        changed.reverse()
+        return changed
+
+    def get_selected_entities(self) -> set[int]:
+        """Returns the IDs of the selected entities, of every player.
+
+        The set is live, maintained by Selectable.is_selected: iterate over a
+        copy if the loop changes the selection.
+        """
+        return self.get_active_entities(Selectable.ACTIVE_SET)
+
+    def get_entities_in_rect(self, x0: int, y0: int, x1: int, y1: int) -> list[int]:
+        """Returns the IDs of the entities on the cells of a grid rectangle.
+
+        Walks whichever is smaller: the cells of the rectangle or the
+        occupied cells of the spatial map.
+
+        Args:
+            x0: The x-coordinate of one corner cell.
+            y0: The y-coordinate of one corner cell.
+            x1: The x-coordinate of the opposite corner cell, inclusive.
+            y1: The y-coordinate of the opposite corner cell, inclusive.
+        """
+        x0, x1 = sorted((x0, x1))
+        y0, y1 = sorted((y0, y1))
+        spatial_map = self.spatial_map
+        entity_ids: list[int] = []
+        if (x1 - x0 + 1) * (y1 - y0 + 1) <= len(spatial_map):
+            for y in range(y0, y1 + 1):
+                for x in range(x0, x1 + 1):
+                    cell = spatial_map.get((x, y))
+                    if cell:
+                        entity_ids.extend(cell)
+        else:
+            for (x, y), cell in spatial_map.items():
+                if x0 <= x <= x1 and y0 <= y <= y1:
+                    entity_ids.extend(cell)
+        return entity_ids
+
+    def component_changed(self, entity_id: int, component: Component) -> None:
+        """Reacts to a write to a field a tracked component reports.
+
+        Args:
+            entity_id: The ID of the entity the component belongs to.
+            component: The component that changed.
+        """
+        if component.CHANGE_CHANNEL:
+            self.mark_changed(component.CHANGE_CHANNEL, entity_id)
+        if isinstance(component, Player):
+            self._recount(entity_id)
+
+    def count_units(self, player_id: int | None = None, unit_type: str | None = None, is_human: bool | None = None) -> int:
+        """Returns how many units match the given filters.
+
+        A unit is an entity with a Player and a Health component; its type is
+        the name of its UnitIdentity. The counts are kept up to date as
+        components are added and removed and as ownership changes, so this
+        only sums the few (player, type) counters instead of scanning the
+        entities.
+
+        Args:
+            player_id: Only count the units of this player.
+            unit_type: Only count the units of this type, e.g. "chassis".
+            is_human: Only count human-controlled (True) or other (False)
+                units.
+
+        Returns:
+            The number of matching units.
+        """
+        return sum(
+            count
+            for (key_player_id, key_is_human, key_unit_type), count in self.census.items()
+            if (player_id is None or key_player_id == player_id)
+            and (unit_type is None or key_unit_type == unit_type)
+            and (is_human is None or key_is_human == is_human)
+        )
+
+    def _recount(self, entity_id: int) -> None:
+        """Moves an entity to the census key matching its current components."""
+        old_key = self._census_keys.pop(entity_id, None)
+        if old_key is not None:
+            self.census[old_key] -= 1
+            if not self.census[old_key]:
+                del self.census[old_key]
+
+        components = self.entities.get(entity_id)
+        if not components or Health not in components:
+            return
+        player = components.get(Player)
+        if not player:
+            return
+        identity = components.get(UnitIdentity)
+        key = (player.player_id, player.is_human, identity.name if identity else None)
+        self._census_keys[entity_id] = key
+        self.census[key] = self.census.get(key, 0) + 1
+
+    def _untrack(self, entity_id: int, component) -> None:
+        if isinstance(component, Component):
+            component.track(None)
+            if component.CHANGE_CHANNEL:
+                self.mark_changed(component.CHANGE_CHANNEL, entity_id)
+
     def remove_component(self, entity_id: int, component_type) -> None:
         """Removes a component from an entity.
 
@@ -130,7 +386,11 @@ class GameState:
 
             if isinstance(component, Position):
                 self._remove_from_spatial_map(entity_id, int(component.x), int(component.y))
+                self._leave_cell(entity_id, (int(component.x), int(component.y)))
+            self._untrack(entity_id, component)
             del self.entities[entity_id][component_type]
+            if component_type in CENSUS_COMPONENTS:
+                self._recount(entity_id)
             if config.DEBUG:
                 log.debug(f"Removed component {component_type.__name__} from entity {entity_id}")
 
@@ -142,14 +402,18 @@ class GameState:
         """
         if entity_id in self.entities:
             # Update component index
-            for component_type in self.entities[entity_id]:
+            for component_type, component in self.entities[entity_id].items():
                 if component_type in self.component_index:
                     self.component_index[component_type].discard(entity_id)
+                self._untrack(entity_id, component)
 
             position = self.entities[entity_id].get(Position)
             if position:
                 self._remove_from_spatial_map(entity_id, int(position.x), int(position.y))
+                self._leave_cell(entity_id, (int(position.x), int(position.y)))
+            self.previous_positions.pop(entity_id, None)
             del self.entities[entity_id]
+            self._recount(entity_id)
             if config.DEBUG:
                 log.debug(f"Removed entity {entity_id}")
 
@@ -163,16 +427,79 @@ class GameState:
         """
         position = self.get_component(entity_id, Position)
         if position:
+            if entity_id not in self.previous_positions:
+                self.previous_positions[entity_id] = (position.x, position.y)
+
             old_ix, old_iy = int(position.x), int(position.y)
             new_ix, new_iy = int(x), int(y)
 
             if old_ix != new_ix or old_iy != new_iy:
                 self._remove_from_spatial_map(entity_id, old_ix, old_iy)
                 self._add_to_spatial_map(entity_id, new_ix, new_iy)
+                self.mark_changed(Position.CHANGE_CHANNEL, entity_id)
+                # Optimization: trigger zones are only checked when an entity
+                # crosses into another cell, never per zone or per frame.
+                triggers = self.triggers
+                if (old_ix, old_iy) in triggers:
+                    triggers.fire(TriggerZones.LEAVE, entity_id, (old_ix, old_iy))
+                if (new_ix, new_iy) in triggers:
+                    triggers.fire(TriggerZones.ENTER, entity_id, (new_ix, new_iy))
 
             position.x = x
             position.y = y
 
+    def add_trigger(self, x: int, y: int, event_type: str) -> None:
+        """Registers a cell as a trigger zone.
+
+        Entities entering or leaving the cell raise event_type events, which
+        the interested system collects with pop_trigger_events. Entities
+        already on the cell count as entering it.
+
+        Args:
+            x: The x-coordinate.
+            y: The y-coordinate.
+            event_type: The type of the events the cell raises.
+        """
+        self.triggers.add((x, y), event_type, self.spatial_map.get((x, y), ()))
+
+    def remove_trigger(self, x: int, y: int, event_type: str) -> None:
+        """Unregisters a trigger zone cell added with add_trigger."""
+        self.triggers.remove((x, y), event_type)
+
+    def pop_trigger_events(self, event_type: str) -> list[TriggerEvent]:
+        """Returns and forgets the enter/leave events raised for an event type, oldest first."""
+        return self.triggers.pop(event_type)
+
+    def add_scrap(self, x: float, y: float, amount: int) -> None:
+        """Drops scrap on the cell containing (x, y), adding to any pile already there.
+
+        A new pile registers its cell as a "scrap" trigger zone, so entities
+        already standing on it count as entering it.
+
+        Args:
+            x: The x-coordinate.
+            y: The y-coordinate.
+            amount: The amount of scrap to drop.
+        """
+        cell = (int(x), int(y))
+        if cell not in self.scrap:
+            self.scrap[cell] = 0
+            self.add_trigger(*cell, "scrap")
+        self.scrap[cell] += amount
+        if config.DEBUG:
+            log.debug(f"Dropped {amount} scrap at {cell}")
+
+    def take_scrap(self, x: int, y: int) -> int:
+        """Removes the scrap pile on a cell.
+
+        Returns:
+            The amount of scrap the pile held, or 0 if there was none.
+        """
+        if (x, y) not in self.scrap:
+            return 0
+        self.remove_trigger(x, y, "scrap")
+        return self.scrap.pop((x, y))
+
     def get_entities_at_position(self, x: int, y: int) -> list[int]:
         """Returns a list of entity IDs at a given position.
 
@@ -193,37 +520,19 @@ class GameState:
                 (e.g., the entity moving).
 
         Returns:
-            True if the position is occupied by a blocking entity, False otherwise.
+            True if the position is occupied by another entity, False otherwise.
         """
         entities = self.spatial_map.get((x, y))
         if not entities:
             return False
-
-        from .components.dead import Dead
-        from .components.resource_deposit import ResourceDeposit
-
-        for eid in entities:
-            if exclude_entity_id is not None and eid == exclude_entity_id:
-                continue
-            # Ignore dead units and resource deposits
-            if not self.get_component(eid, Dead) and not self.get_component(eid, ResourceDeposit):
-                return True
-
-        return False
+        if exclude_entity_id is None:
+            return True
+        return len(entities) > 1 or exclude_entity_id not in entities
 
     def get_blocking_obstacles(self) -> dict[tuple[int, int], set[int]]:
-        """Returns a filtered version of spatial_map containing only blocking entities."""
-        from .components.dead import Dead
-        from .components.resource_deposit import ResourceDeposit
-
-        blocking = {}
-        for pos, entities in self.spatial_map.items():
-            # Check if there is any blocking entity in this cell
-            has_blocking = False
-            for eid in entities:
-                if not self.get_component(eid, Dead) and not self.get_component(eid, ResourceDeposit):
-                    has_blocking = True
-                    break
-            if has_blocking:
-                blocking[pos] = entities
-        return blocking
+        """Returns the cells holding blocking entities, mapped to their entity IDs.
+
+        Scrap and corpses are not entities, so every entity blocks and this is
+        the spatial map itself; callers must not modify it.
+        """
+        return self.spatial_map
@@ -17,6 +17,9 @@ class Map:
         width: The width of the map in grid cells.
         height: The height of the map in grid cells.
         walls: A set of (x, y) tuples representing wall locations.
+        epoch: Incremented whenever the walls change, so renderers can cache
+            anything derived from them. Mutate walls through add_wall and
+            remove_wall to keep it current.
     """
 
     MAX_MAP_DIMENSION = 256  # Security limit to prevent DoS via memory exhaustion
@@ -39,6 +42,7 @@ class Map:
         self.width = width
         self.height = height
         self.walls: set[Tuple[int, int]] = set()
+        self.epoch = 0
 
     def add_wall(self, x: int, y: int) -> None:
         """Adds a wall at the specified coordinates.
@@ -49,6 +53,18 @@ class Map:
         """
         if 0 <= x < self.width and 0 <= y < self.height:
             self.walls.add((x, y))
+            self.epoch += 1
+
+    def remove_wall(self, x: int, y: int) -> None:
+        """Removes the wall at the specified coordinates, if any.
+
+        Args:
+            x: The x-coordinate of the wall.
+            y: The y-coordinate of the wall.
+        """
+        if (x, y) in self.walls:
+            self.walls.remove((x, y))
+            self.epoch += 1
 
     def is_blocked(self, x: int, y: int) -> bool:
         """Checks if a tile is blocked by a wall.
@@ -247,6 +263,7 @@ class Map:
                     continue
 
         m.walls = walls
+        m.epoch += 1
         return m
 
     def save_to_file(self, filename: str) -> None:
@@ -0,0 +1,71 @@
+import numpy as np
+
+from . import config
+
+
+class ParticleEmitter:
+    """Short-lived cosmetic particles, such as the confetti of ranged hits.
+
+    Particles are not entities: they never enter GameState.entities, the
+    spatial map or the component index, and do not count towards
+    MAX_ENTITIES. Live particles are packed at the front of preallocated
+    arrays, so aging and removing them are a few whole-array operations.
+    """
+
+    def __init__(self, capacity: int | None = None):
+        """Initializes an empty ParticleEmitter.
+
+        Args:
+            capacity: The most particles alive at once; further emissions
+                are dropped until some expire. Defaults to
+                config.MAX_PARTICLES.
+        """
+        self.capacity = capacity if capacity is not None else config.MAX_PARTICLES
+        self.x = np.zeros(self.capacity)
+        self.y = np.zeros(self.capacity)
+        self.lifetime = np.zeros(self.capacity)
+        # Index into the renderer's palette
+        self.color = np.zeros(self.capacity, dtype=np.uint8)
+        self.count = 0
+        self._emitted = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def emit(self, x: float, y: float, lifetime: float) -> bool:
+        """Adds a particle.
+
+        Args:
+            x: The X coordinate on the grid.
+            y: The Y coordinate on the grid.
+            lifetime: How long the particle lives, in seconds.
+
+        Returns:
+            False if the emitter is full and the particle was dropped.
+        """
+        if self.count >= self.capacity:
+            return False
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.lifetime[i] = lifetime
+        # Consecutive particles cycle through the palette
+        self.color[i] = self._emitted % 256
+        self._emitted += 1
+        self.count += 1
+        return True
+
+    def update(self, dt: float) -> None:
+        """Ages every particle by dt seconds and removes the expired ones."""
+        n = self.count
+        if not n:
+            return
+        lifetime = self.lifetime[:n]
+        lifetime -= dt
+        keep = lifetime > 0
+        if keep.all():
+            return
+        kept = int(np.count_nonzero(keep))
+        for values in (self.x, self.y, self.lifetime, self.color):
+            values[:kept] = values[:n][keep]
+        self.count = kept
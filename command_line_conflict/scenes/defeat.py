@@ -19,6 +19,10 @@ class DefeatScene(BaseEndScene):
 
         Args:
             screen: The pygame screen to draw on.
+
+        Returns:
+            The screen areas that changed since the previous frame: only the
+            pulsing instructions, as the rest of the scene is static.
         """
         screen.fill((0, 0, 0))
         text = self.font.render("Defeat!", True, (255, 255, 255))
@@ -37,3 +41,4 @@ class DefeatScene(BaseEndScene):
             )
         )
         screen.blit(instruction_text, instruction_rect)
+        return [instruction_rect]
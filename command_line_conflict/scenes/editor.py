@@ -7,6 +7,7 @@ from command_line_conflict.camera import Camera
 from command_line_conflict.logger import log
 from command_line_conflict.maps.base import Map
 from command_line_conflict.ui.file_dialog import FileDialog
+from command_line_conflict.utils.dirty_areas import DirtyAreas
 
 
 class EditorScene:
@@ -53,6 +54,11 @@ class EditorScene:
         self.file_dialog = None
         self.mouse_pos = (0, 0)
         self.hover_grid_pos = None
+        # What the previous frame showed, for reporting changed areas
+        self._dirty_areas = DirtyAreas()
+        self._last_view: tuple | None = None
+        # Cells whose walls were toggled since the last frame
+        self._toggled_cells: list[tuple[int, int]] = []
 
     def handle_event(self, event):
         """Handles user input."""
@@ -119,11 +125,12 @@ class EditorScene:
 
         # Toggle wall
         if self.map.is_blocked(grid_x, grid_y):
-            if (grid_x, grid_y) in self.map.walls:
-                self.map.walls.remove((grid_x, grid_y))
+            self.map.remove_wall(grid_x, grid_y)
+            self._toggled_cells.append((grid_x, grid_y))
         else:
             if 0 <= grid_x < self.map.width and 0 <= grid_y < self.map.height:
                 self.map.add_wall(grid_x, grid_y)
+                self._toggled_cells.append((grid_x, grid_y))
 
     def update(self, dt):
         """Updates camera."""
@@ -137,7 +144,13 @@ class EditorScene:
             self.camera.move(config.CAMERA_SPEED * dt, 0)
 
     def draw(self, screen):
-        """Draws the editor."""
+        """Draws the editor.
+
+        Returns:
+            The screen areas that changed since the previous frame: toggled
+            wall cells, the status line, the tooltip and an open file dialog.
+            None when the camera moved or another map was loaded.
+        """
         screen.fill((0, 0, 0))
 
         # Draw grid
@@ -146,15 +159,40 @@ class EditorScene:
         # Draw map
         self.map.draw(screen, self.font, self.camera)
 
+        grid_size = config.GRID_SIZE * self.camera.zoom
+        dirty = [
+            pygame.Rect(
+                int((x - self.camera.x) * grid_size), int((y - self.camera.y) * grid_size), grid_size + 1, grid_size + 1
+            )
+            for x, y in self._toggled_cells
+        ]
+        self._toggled_cells = []
+
         # Draw UI
-        self._draw_ui(screen)
+        status_rect = self._draw_ui(screen)
+        dirty += self._dirty_areas.track("status", len(self.map.walls), [status_rect])
 
         # Draw Tooltip
         if self.hover_grid_pos:
-            self._draw_tooltip(screen)
+            tooltip_rect = self._draw_tooltip(screen)
+            dirty += self._dirty_areas.track("tooltip", (self.hover_grid_pos, self.mouse_pos), [tooltip_rect])
+        else:
+            dirty += self._dirty_areas.track("tooltip", None)
 
         if self.file_dialog:
             self.file_dialog.draw()
+        if self.file_dialog and self.file_dialog.active:
+            # The dialog reacts to typing and hovering: redraw it every frame.
+            dirty += self._dirty_areas.track("dialog", id(self.file_dialog), [self.file_dialog.rect])
+            dirty.append(self.file_dialog.rect)
+        else:
+            dirty += self._dirty_areas.track("dialog", None)
+
+        view = (id(self.map), self.camera.x, self.camera.y, self.camera.zoom, screen.get_size())
+        if view != self._last_view:
+            self._last_view = view
+            return None
+        return dirty
 
     def _draw_tooltip(self, screen):
         gx, gy = self.hover_grid_pos
@@ -169,6 +207,7 @@ class EditorScene:
         pygame.draw.rect(screen, (100, 100, 100), bg_rect, 1)
 
         screen.blit(surf, (bg_rect.x + padding, bg_rect.y + padding))
+        return bg_rect
 
     def _draw_grid(self, screen):
         grid_size = int(config.GRID_SIZE * self.camera.zoom)
@@ -189,7 +228,7 @@ class EditorScene:
 
         status = f"Map: {self.map.width}x{self.map.height} | Walls: {len(self.map.walls)}"
         surf2 = self.ui_font.render(status, True, (200, 200, 200))
-        screen.blit(surf2, (10, 30))
+        return screen.blit(surf2, (10, 30))
 
     def open_save_dialog(self):
         """Opens the save map dialog."""
@@ -1,24 +1,20 @@
-import math
-from types import SimpleNamespace
-
 import pygame
 
 from command_line_conflict import config, factories
 from command_line_conflict.camera import Camera
 from command_line_conflict.campaign_manager import CampaignManager
 from command_line_conflict.components.attack import Attack
-from command_line_conflict.components.dead import Dead
 from command_line_conflict.components.health import Health
 from command_line_conflict.components.player import Player
 from command_line_conflict.components.position import Position
 from command_line_conflict.components.selectable import Selectable
 from command_line_conflict.components.unit_identity import UnitIdentity
-from command_line_conflict.components.vision import Vision
 from command_line_conflict.fog_of_war import FogOfWar
 from command_line_conflict.game_state import GameState
 from command_line_conflict.logger import log
 from command_line_conflict.maps import SimpleMap  # noqa: F401  # pylint: disable=unused-import
 from command_line_conflict.maps.factory_battle_map import FactoryBattleMap
+from command_line_conflict.simulation import register_simulation_systems
 from command_line_conflict.systems.ai_system import AISystem
 from command_line_conflict.systems.chat_system import ChatSystem
 from command_line_conflict.systems.combat_system import CombatSystem
@@ -26,6 +22,7 @@ from command_line_conflict.systems.confetti_system import ConfettiSystem
 from command_line_conflict.systems.corpse_removal_system import CorpseRemovalSystem
 from command_line_conflict.systems.flee_system import FleeSystem
 from command_line_conflict.systems.health_system import HealthSystem
+from command_line_conflict.systems.map_rendering_system import MapRenderingSystem
 from command_line_conflict.systems.movement_system import MovementSystem
 from command_line_conflict.systems.production_system import ProductionSystem
 from command_line_conflict.systems.rendering_system import RenderingSystem
@@ -34,21 +31,22 @@ from command_line_conflict.systems.selection_system import SelectionSystem
 from command_line_conflict.systems.sound_system import SoundSystem
 from command_line_conflict.systems.spawn_system import SpawnSystem
 from command_line_conflict.systems.ui_system import UISystem
+from command_line_conflict.systems.vision_system import VisionSystem
 from command_line_conflict.systems.wander_system import WanderSystem
+from command_line_conflict.utils.dirty_areas import DirtyAreas
+from command_line_conflict.utils.system_scheduler import SystemScheduler
 
-
-class UnitView:
-    """A simple object to satisfy the FogOfWar interface."""
-
-    def __init__(self, x, y, vision_range):
-        self.x = x
-        self.y = y
-        self.vision_range = vision_range
+# Ctrl+digit assigns a control group, digit recalls it
+CONTROL_GROUP_KEYS = {getattr(pygame, f"K_{number}"): number for number in range(1, 10)}
 
 
 class GameScene:
     """Manages the main gameplay scene, including entities, systems, and events."""
 
+    # update() advances the simulation in fixed ticks; per-frame logic goes
+    # in frame_update(). Scenes without this flag update once per frame.
+    FIXED_STEP = True
+
     def __init__(self, game):
         """Initializes the GameScene.
 
@@ -72,8 +70,6 @@ class GameScene:
         self.mission_started = False
         self.mission_over = False
 
-        self.win_loss_check_timer = 0.0
-
         # Cheats
         self.cheats = {
             "reveal_map": False,
@@ -91,12 +87,19 @@ class GameScene:
         self.drag_start_pos = None  # For middle mouse drag
         self.camera_start_pos = None
         self.hovered_entity_id = None
-        self._wave_cache = {}
+        self.hovered_scrap_cell: tuple[int, int] | None = None
+        # Set by the SceneManager before each draw: how far the rendered
+        # frame is between the previous and the current simulation tick.
+        self.interpolation_alpha = 1.0
+        # What the previous frame showed, for reporting changed areas
+        self._dirty_areas = DirtyAreas()
+        self._last_view: tuple | None = None
 
         # Initialize systems
         self.campaign_manager = CampaignManager()
         self.game_state.campaign_manager = self.campaign_manager
         self.movement_system = MovementSystem()
+        self.map_rendering_system = MapRenderingSystem(self.game.screen, self.font, self.camera)
         self.rendering_system = RenderingSystem(self.game.screen, self.font, self.camera)
         self.combat_system = CombatSystem()
         self.flee_system = FleeSystem()
@@ -118,6 +121,9 @@ class GameScene:
         self.sound_system = SoundSystem()
         self.wander_system = WanderSystem()
         self.spawn_system = SpawnSystem(spawn_interval=5.0)  # Spawn every 5 seconds
+        self.vision_system = VisionSystem()
+        self.scheduler = SystemScheduler()
+        self._register_systems()
         self._create_initial_units()
 
         player_entities = [self.game_state.entities.get(eid) for eid in self.game_state.get_entities_with_component(Player)]
@@ -134,11 +140,31 @@ class GameScene:
                 "F1: Toggle Reveal Map",
                 "F2: Toggle God Mode",
                 "TAB: Switch Player",
-                "1-6: Spawn Units",
+                "Ctrl+Shift+1-6: Spawn Units",
             ]
             for cheat in cheats_list:
                 log.info(cheat)
 
+    def _register_systems(self):
+        """Declares the order and tick rate of the per-frame simulation steps.
+
+        The simulation steps are shared with HeadlessSimulation (see
+        register_simulation_systems); the scene adds its presentation steps
+        after them.
+        """
+        register_simulation_systems(self.scheduler, self)
+        # Presentation steps, which the headless simulation leaves out. They
+        # run after every simulation step, so the events of a tick, SpawnSystem's
+        # included, are heard and shown in that same tick before the queue is
+        # cleared.
+        schedule = self.scheduler.register
+        schedule("SoundSystem", lambda dt: self.sound_system.update(self.game_state))
+        schedule("VisualEvents", lambda dt: self._process_visual_events())
+        schedule("FogOfWar", lambda dt: self._update_fog_of_war(), rate=15)
+        # Win/loss conditions iterate every Player entity and don't need
+        # frame-perfect resolution.
+        schedule("WinLossCheck", lambda dt: self._check_mission_end(), rate=2)
+
     def _create_initial_units(self):
         """Creates the starting units for each player."""
         if hasattr(self.game_state.map, "create_initial_units"):
@@ -213,9 +239,6 @@ class GameScene:
             target_enemy_id = None
             entities_at_pos = self.game_state.get_entities_at_position(grid_x, grid_y)
             for eid in entities_at_pos:
-                # Filter for live enemies
-                if self.game_state.get_component(eid, Dead):
-                    continue
                 player = self.game_state.get_component(eid, Player)
                 if player and player.player_id != self.current_player_id:
                     target_enemy_id = eid
@@ -227,53 +250,43 @@ class GameScene:
                 # Visual feedback (red ripple)
                 self.ui_system.add_click_effect(grid_x, grid_y, (255, 0, 0))
 
-                for entity_id in self.game_state.get_entities_with_component(Selectable):
-                    components = self.game_state.entities.get(entity_id)
-                    if not components:
-                        continue
-
-                    selectable = components.get(Selectable)
-                    if selectable and selectable.is_selected:
-                        attack = components.get(Attack)
-                        if attack:
-                            attack.attack_target = target_enemy_id
-                            # Clear move target if attacking? CombatSystem handles closing distance.
-                            # But if we were moving elsewhere, we should stop?
-                            # CombatSystem will update position if needed.
-                            # We should probably clear explicit move path so it doesn't wander off.
-                            from command_line_conflict.components.movable import Movable
-
-                            movable = components.get(Movable)
-                            if movable:
-                                movable.path = []
-                                movable.target_x = None
-                                movable.target_y = None
-                                movable.hold_position = False
+                for entity_id in self._get_selected_entities():
+                    components = self.game_state.entities[entity_id]
+                    attack = components.get(Attack)
+                    if attack:
+                        attack.attack_target = target_enemy_id
+                        # Clear move target if attacking? CombatSystem handles closing distance.
+                        # But if we were moving elsewhere, we should stop?
+                        # CombatSystem will update position if needed.
+                        # We should probably clear explicit move path so it doesn't wander off.
+                        from command_line_conflict.components.movable import Movable
+
+                        movable = components.get(Movable)
+                        if movable:
+                            movable.path = []
+                            movable.target_x = None
+                            movable.target_y = None
+                            movable.hold_position = False
             else:
                 # Move Command
                 log.info(f"Move command issued to {(grid_x, grid_y)}")
                 # Visual feedback (green ripple)
                 self.ui_system.add_click_effect(grid_x, grid_y, (0, 255, 0))
 
-                for entity_id in self.game_state.get_entities_with_component(Selectable):
-                    components = self.game_state.entities.get(entity_id)
-                    if not components:
-                        continue
-
-                    selectable = components.get(Selectable)
-                    if selectable and selectable.is_selected:
-                        log.info(f"Moving entity {entity_id} to {(grid_x, grid_y)}")
-                        # Moving clears hold position
-                        from command_line_conflict.components.movable import Movable
+                for entity_id in self._get_selected_entities():
+                    components = self.game_state.entities[entity_id]
+                    log.info(f"Moving entity {entity_id} to {(grid_x, grid_y)}")
+                    # Moving clears hold position
+                    from command_line_conflict.components.movable import Movable
 
-                        movable = components.get(Movable)
-                        if movable:
-                            movable.hold_position = False
+                    movable = components.get(Movable)
+                    if movable:
+                        movable.hold_position = False
 
-                        self.movement_system.set_target(self.game_state, entity_id, grid_x, grid_y)
-                        attack = components.get(Attack)
-                        if attack:
-                            attack.attack_target = None
+                    self.movement_system.set_target(self.game_state, entity_id, grid_x, grid_y)
+                    attack = components.get(Attack)
+                    if attack:
+                        attack.attack_target = None
         elif event.type == pygame.KEYDOWN:
             # Camera movement
             if event.key == pygame.K_UP:
@@ -285,148 +298,133 @@ class GameScene:
             elif event.key == pygame.K_RIGHT:
                 self.camera_movement["right"] = True
             else:
-                if config.DEBUG:
-                    mods = pygame.key.get_mods()
+                mods = pygame.key.get_mods()
+                # In DEBUG builds Ctrl+Shift+digit spawns units instead.
+                spawn_cheat = config.DEBUG and mods & pygame.KMOD_CTRL and mods & pygame.KMOD_SHIFT
+                if event.key in CONTROL_GROUP_KEYS and not spawn_cheat:
+                    group = CONTROL_GROUP_KEYS[event.key]
                     if mods & pygame.KMOD_CTRL:
-                        mx, my = pygame.mouse.get_pos()
-                        gx, gy = self.camera.screen_to_grid(mx, my)
-                        if event.key == pygame.K_1:
-                            factories.create_extractor(
-                                self.game_state,
-                                gx,
-                                gy,
-                                player_id=self.current_player_id,
-                                is_human=True,
-                            )
-                        elif event.key == pygame.K_2:
-                            factories.create_chassis(
-                                self.game_state,
-                                gx,
-                                gy,
-                                player_id=self.current_player_id,
-                                is_human=True,
-                            )
-                        elif event.key == pygame.K_3:
-                            factories.create_rover(
-                                self.game_state,
-                                gx,
-                                gy,
-                                player_id=self.current_player_id,
-                                is_human=True,
-                            )
-                        elif event.key == pygame.K_4:
-                            factories.create_arachnotron(
-                                self.game_state,
-                                gx,
-                                gy,
-                                player_id=self.current_player_id,
-                                is_human=True,
-                            )
-                        elif event.key == pygame.K_5:
-                            factories.create_observer(
-                                self.game_state,
-                                gx,
-                                gy,
-                                player_id=self.current_player_id,
-                                is_human=True,
-                            )
-                        elif event.key == pygame.K_6:
-                            factories.create_immortal(
-                                self.game_state,
-                                gx,
-                                gy,
-                                player_id=self.current_player_id,
-                                is_human=True,
-                            )
-
-                    # Debug cheats
-                    if config.DEBUG:
-                        if event.key == pygame.K_F1:
-                            self.cheats["reveal_map"] = not self.cheats["reveal_map"]
-                            status = "Enabled" if self.cheats["reveal_map"] else "Disabled"
-                            log.info(f"Cheat 'Reveal Map' toggled: {self.cheats['reveal_map']}")
-                            self.chat_system.add_message(f"Cheat: Map Reveal {status}", (255, 0, 255))
-                        elif event.key == pygame.K_F2:
-                            self.cheats["god_mode"] = not self.cheats["god_mode"]
-                            status = "Enabled" if self.cheats["god_mode"] else "Disabled"
-                            log.info(f"Cheat 'God Mode' toggled: {self.cheats['god_mode']}")
-                            self.chat_system.add_message(f"Cheat: God Mode {status}", (255, 0, 255))
-                        elif event.key == pygame.K_TAB:
-                            # Security: Gated side-switching feature behind config.DEBUG to prevent unauthorized access
-                            self.selection_system.clear_selection(self.game_state)
-                            if self.current_player_id == 1:
-                                self.current_player_id = 2
-                            else:
-                                self.current_player_id = 1
-                            log.info(f"Switched to player {self.current_player_id}")
-                            self.chat_system.add_message(f"Switched to player {self.current_player_id}", (255, 0, 255))
+                        self.selection_system.assign_control_group(self.game_state, group, self.current_player_id)
+                    else:
+                        self.selection_system.recall_control_group(
+                            self.game_state,
+                            group,
+                            bool(mods & pygame.KMOD_SHIFT),
+                            self.current_player_id,
+                        )
+
+                if spawn_cheat:
+                    mx, my = pygame.mouse.get_pos()
+                    gx, gy = self.camera.screen_to_grid(mx, my)
+                    if event.key == pygame.K_1:
+                        factories.create_extractor(
+                            self.game_state,
+                            gx,
+                            gy,
+                            player_id=self.current_player_id,
+                            is_human=True,
+                        )
+                    elif event.key == pygame.K_2:
+                        factories.create_chassis(
+                            self.game_state,
+                            gx,
+                            gy,
+                            player_id=self.current_player_id,
+                            is_human=True,
+                        )
+                    elif event.key == pygame.K_3:
+                        factories.create_rover(
+                            self.game_state,
+                            gx,
+                            gy,
+                            player_id=self.current_player_id,
+                            is_human=True,
+                        )
+                    elif event.key == pygame.K_4:
+                        factories.create_arachnotron(
+                            self.game_state,
+                            gx,
+                            gy,
+                            player_id=self.current_player_id,
+                            is_human=True,
+                        )
+                    elif event.key == pygame.K_5:
+                        factories.create_observer(
+                            self.game_state,
+                            gx,
+                            gy,
+                            player_id=self.current_player_id,
+                            is_human=True,
+                        )
+                    elif event.key == pygame.K_6:
+                        factories.create_immortal(
+                            self.game_state,
+                            gx,
+                            gy,
+                            player_id=self.current_player_id,
+                            is_human=True,
+                        )
+
+                # Debug cheats
+                if config.DEBUG:
+                    if event.key == pygame.K_F1:
+                        self.cheats["reveal_map"] = not self.cheats["reveal_map"]
+                        status = "Enabled" if self.cheats["reveal_map"] else "Disabled"
+                        log.info(f"Cheat 'Reveal Map' toggled: {self.cheats['reveal_map']}")
+                        self.chat_system.add_message(f"Cheat: Map Reveal {status}", (255, 0, 255))
+                    elif event.key == pygame.K_F2:
+                        self.cheats["god_mode"] = not self.cheats["god_mode"]
+                        status = "Enabled" if self.cheats["god_mode"] else "Disabled"
+                        log.info(f"Cheat 'God Mode' toggled: {self.cheats['god_mode']}")
+                        self.chat_system.add_message(f"Cheat: God Mode {status}", (255, 0, 255))
+                    elif event.key == pygame.K_TAB:
+                        # Security: Gated side-switching feature behind config.DEBUG to prevent unauthorized access
+                        self.selection_system.clear_selection(self.game_state)
+                        if self.current_player_id == 1:
+                            self.current_player_id = 2
+                        else:
+                            self.current_player_id = 1
+                        log.info(f"Switched to player {self.current_player_id}")
+                        self.chat_system.add_message(f"Switched to player {self.current_player_id}", (255, 0, 255))
 
                 if event.key == pygame.K_c:
                     selected_factories = []
-                    for entity_id in self.game_state.get_entities_with_component(Selectable):
-                        components = self.game_state.entities.get(entity_id)
-                        if not components:
-                            continue
-                        selectable = components.get(Selectable)
-                        identity = components.get(UnitIdentity)
-                        player = components.get(Player)
-                        if player and player.player_id == self.current_player_id:
-                            if selectable and selectable.is_selected:
-                                if identity and (
-                                    "factory" in identity.name or identity.name in ("rover_factory", "arachnotron_factory")
-                                ):
-                                    selected_factories.append(entity_id)
+                    for entity_id in self._get_selected_entities(self.current_player_id):
+                        identity = self.game_state.get_component(entity_id, UnitIdentity)
+                        if identity and (
+                            "factory" in identity.name or identity.name in ("rover_factory", "arachnotron_factory")
+                        ):
+                            selected_factories.append(entity_id)
 
                     if selected_factories:
                         self._train_chassis_at_factory(selected_factories[0])
 
                 if event.key == pygame.K_t:
                     selected_rover_factories = []
-                    for entity_id in self.game_state.get_entities_with_component(Selectable):
-                        components = self.game_state.entities.get(entity_id)
-                        if not components:
-                            continue
-                        selectable = components.get(Selectable)
-                        identity = components.get(UnitIdentity)
-                        player = components.get(Player)
-                        if player and player.player_id == self.current_player_id:
-                            if selectable and selectable.is_selected:
-                                if identity and identity.name == "rover_factory":
-                                    selected_rover_factories.append(entity_id)
+                    for entity_id in self._get_selected_entities(self.current_player_id):
+                        identity = self.game_state.get_component(entity_id, UnitIdentity)
+                        if identity and identity.name == "rover_factory":
+                            selected_rover_factories.append(entity_id)
 
                     if selected_rover_factories:
                         self._research_arachnotron_at_factory(selected_rover_factories[0])
 
                 if event.key == pygame.K_r:
                     selected_arachnotron_factories = []
-                    for entity_id in self.game_state.get_entities_with_component(Selectable):
-                        components = self.game_state.entities.get(entity_id)
-                        if not components:
-                            continue
-                        selectable = components.get(Selectable)
-                        identity = components.get(UnitIdentity)
-                        player = components.get(Player)
-                        if player and player.player_id == self.current_player_id:
-                            if selectable and selectable.is_selected:
-                                if identity and identity.name == "arachnotron_factory":
-                                    selected_arachnotron_factories.append(entity_id)
+                    for entity_id in self._get_selected_entities(self.current_player_id):
+                        identity = self.game_state.get_component(entity_id, UnitIdentity)
+                        if identity and identity.name == "arachnotron_factory":
+                            selected_arachnotron_factories.append(entity_id)
 
                     if selected_arachnotron_factories:
                         self._train_rover_at_factory(selected_arachnotron_factories[0])
 
                 if event.key == pygame.K_a:
                     selected_arachnotron_factories = []
-                    for entity_id in self.game_state.get_entities_with_component(Selectable):
-                        components = self.game_state.entities.get(entity_id)
-                        if not components:
-                            continue
-                        selectable = components.get(Selectable)
-                        identity = components.get(UnitIdentity)
-                        player = components.get(Player)
-                        if player and player.player_id == self.current_player_id:
-                            if selectable and selectable.is_selected:
-                                if identity and identity.name == "arachnotron_factory":
-                                    selected_arachnotron_factories.append(entity_id)
+                    for entity_id in self._get_selected_entities(self.current_player_id):
+                        identity = self.game_state.get_component(entity_id, UnitIdentity)
+                        if identity and identity.name == "arachnotron_factory":
+                            selected_arachnotron_factories.append(entity_id)
 
                     if selected_arachnotron_factories:
                         self._train_arachnotron_at_factory(selected_arachnotron_factories[0])
@@ -436,20 +434,14 @@ class GameScene:
                     self.chat_system.add_message("Hold Position command issued", (255, 255, 0))
                     from command_line_conflict.components.movable import Movable
 
-                    for entity_id in self.game_state.get_entities_with_component(Selectable):
-                        components = self.game_state.entities.get(entity_id)
-                        if not components:
-                            continue
-
-                        selectable = components.get(Selectable)
-                        if selectable and selectable.is_selected:
-                            movable = components.get(Movable)
-                            if movable:
-                                movable.hold_position = True
-                                movable.path = []
-                                movable.target_x = None
-                                movable.target_y = None
-                                log.info(f"Entity {entity_id} holding position")
+                    for entity_id in self._get_selected_entities():
+                        movable = self.game_state.get_component(entity_id, Movable)
+                        if movable:
+                            movable.hold_position = True
+                            movable.path = []
+                            movable.target_x = None
+                            movable.target_y = None
+                            log.info(f"Entity {entity_id} holding position")
 
                 elif event.key == pygame.K_p or event.key == pygame.K_SPACE:
                     self.paused = not self.paused
@@ -497,6 +489,7 @@ class GameScene:
     def _update_cursor(self, screen_pos: tuple[int, int]) -> None:
         """Updates the mouse cursor based on what is under the mouse."""
         self.hovered_entity_id = None
+        self.hovered_scrap_cell = None
         # Check if over UI panel (bottom 100px)
         panel_height = 100
         if screen_pos[1] > config.SCREEN_HEIGHT - panel_height:
@@ -508,10 +501,6 @@ class GameScene:
 
         cursor_set = False
         for entity_id in entity_ids:
-            # We must filter out dead entities, or cursors will react to corpses
-            if self.game_state.get_component(entity_id, Dead):
-                continue
-
             self.hovered_entity_id = entity_id
             player = self.game_state.get_component(entity_id, Player)
             if player:
@@ -527,9 +516,30 @@ class GameScene:
                         cursor_set = True
                         break
 
+        if self.hovered_entity_id is None and (grid_x, grid_y) in self.game_state.scrap:
+            self.hovered_scrap_cell = (grid_x, grid_y)
+
         if not cursor_set:
             pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
+    def _get_selected_entities(self, player_id: int | None = None) -> list[int]:
+        """Returns the selected entities in ID order.
+
+        Args:
+            player_id: If given, only the selected entities of this player.
+        """
+        # Optimization: read from the selected set GameState keeps, so a
+        # command costs the size of the selection, not the number of
+        # Selectable entities on the map.
+        selected = []
+        for entity_id in sorted(self.game_state.get_selected_entities()):
+            if player_id is not None:
+                player = self.game_state.get_component(entity_id, Player)
+                if not player or player.player_id != player_id:
+                    continue
+            selected.append(entity_id)
+        return selected
+
     def _handle_construction(self, key) -> bool:
         """Handles building construction requests.
 
@@ -541,17 +551,10 @@ class GameScene:
         """
         # Find selected chassis
         selected_chassis_ids = []
-        for entity_id in self.game_state.get_entities_with_component(Selectable):
-            components = self.game_state.entities.get(entity_id)
-            if not components:
-                continue
-
-            selectable = components.get(Selectable)
-            identity = components.get(UnitIdentity)
-
-            if selectable and selectable.is_selected:
-                if identity and identity.name == "chassis":
-                    selected_chassis_ids.append(entity_id)
+        for entity_id in self._get_selected_entities():
+            identity = self.game_state.get_component(entity_id, UnitIdentity)
+            if identity and identity.name == "chassis":
+                selected_chassis_ids.append(entity_id)
 
         if not selected_chassis_ids:
             return False
@@ -675,21 +678,7 @@ class GameScene:
             self.chat_system.add_message("Arachnotron tech is already unlocked!", (255, 255, 0))
             return
 
-        # Count chassis
-        chassis_count = 0
-        from command_line_conflict.components.dead import Dead
-        from command_line_conflict.components.player import Player
-        from command_line_conflict.components.unit_identity import UnitIdentity
-
-        for eid in self.game_state.get_entities_with_component(UnitIdentity):
-            components = self.game_state.entities.get(eid)
-            if not components:
-                continue
-            ident = components.get(UnitIdentity)
-            plyr = components.get(Player)
-            is_dead = components.get(Dead) is not None
-            if ident and ident.name == "chassis" and plyr and plyr.player_id == self.current_player_id and not is_dead:
-                chassis_count += 1
+        chassis_count = self.game_state.count_units(player_id=self.current_player_id, unit_type="chassis")
 
         cost = 100
         player_resources = self.game_state.resources.get(self.current_player_id, 0)
@@ -807,7 +796,6 @@ class GameScene:
             return
 
         # Find an adjacent friendly rover
-        from command_line_conflict.components.dead import Dead
         from command_line_conflict.components.player import Player as PlayerComponent
         from command_line_conflict.components.unit_identity import UnitIdentity
 
@@ -822,8 +810,7 @@ class GameScene:
                     continue
                 ident = self.game_state.get_component(ceid, UnitIdentity)
                 plyr = self.game_state.get_component(ceid, PlayerComponent)
-                is_dead = self.game_state.get_component(ceid, Dead) is not None
-                if ident and ident.name == "rover" and plyr and plyr.player_id == self.current_player_id and not is_dead:
+                if ident and ident.name == "rover" and plyr and plyr.player_id == self.current_player_id:
                     rover_to_consume = ceid
                     rover_pos = self.game_state.get_component(ceid, Position)
                     if rover_pos:
@@ -883,13 +870,23 @@ class GameScene:
         if self.camera_movement["right"]:
             self.camera.move(config.CAMERA_SPEED * dt, 0)
 
+    def frame_update(self, dt):
+        """Runs per-frame logic that isn't part of the simulation.
+
+        Args:
+            dt: The time elapsed since the last rendered frame.
+        """
+        if not self.paused:
+            self._update_camera(dt)
+
     def update(self, dt):
         """Updates the state of all game systems.
 
         Args:
-            dt: The time elapsed since the last frame.
+            dt: The fixed simulation time step.
         """
         self.mission_started = True
+        self.game_state.begin_tick()
         self.chat_system.update(self.game_state, dt)
 
         if self.paused:
@@ -907,59 +904,30 @@ class GameScene:
                 if player and player.is_human and health:
                     health.hp = health.max_hp
 
-        self._update_camera(dt)
-        self.health_system.update(self.game_state, dt)
-        self.flee_system.update(self.game_state, dt)
-        self.ai_system.update(self.game_state)
-        self.wander_system.update(self.game_state, dt)
-        self.combat_system.update(self.game_state, dt)
-        self.confetti_system.update(self.game_state, dt)
-        self.movement_system.update(self.game_state, dt)
-        self.resource_system.update(self.game_state, dt)
-        # NOTE: ProductionSystem still grants FREE walk-in transformations
-        # (unit standing on a factory tile becomes the factory's output),
-        # which bypasses the scrap prices charged by the training hotkeys.
-        # See the DESIGN NOTE on ProductionSystem before rebalancing costs.
-        self.production_system.update(self.game_state, dt)
-        self.corpse_removal_system.update(self.game_state, dt)
-        self.sound_system.update(self.game_state)
-
-        # Process visual events
+        self.scheduler.update(dt)
+
+    def _process_visual_events(self):
+        """Forwards visual events to the UI and clears the event queue."""
         for event in self.game_state.event_queue:
             if event.get("type") == "visual_effect":
                 if event.get("subtype") == "floating_text":
-                    self.ui_system.add_floating_text(event["x"], event["y"], event["text"], event["color"])
+                    self.ui_system.add_floating_text(
+                        event["x"], event["y"], event["text"], event["color"], target_id=event.get("target")
+                    )
 
         # Clear event queue after all systems have processed events
         self.game_state.event_queue.clear()
-        self.spawn_system.update(self.game_state, dt)
-
-        # Update Fog of War
-        vision_units = []
-        # Optimization: Iterate only over entities with Vision component
-        # This avoids iterating over non-combat entities (walls, minerals, etc.)
-        for entity_id in self.game_state.get_entities_with_component(Vision):
-            components = self.game_state.entities.get(entity_id)
-            if not components:
-                continue
-
-            player = components.get(Player)
-            if not player or not player.is_human:
-                continue
-
-            pos = components.get(Position)
-            vis = components.get(Vision)
-            if pos and vis:
-                vision_units.append(SimpleNamespace(x=pos.x, y=pos.y, vision_range=vis.vision_range))
-        self.fog_of_war.update(vision_units)
-
-        self.win_loss_check_timer += dt
-        if self.win_loss_check_timer >= 0.5:
-            self.win_loss_check_timer = 0.0
-            if self.check_win_condition():
-                self.game.scene_manager.switch_to("victory")
-            elif self.check_loss_condition():
-                self.game.scene_manager.switch_to("defeat")
+
+    def _update_fog_of_war(self):
+        """Shows the current player's visibility grid in the fog of war."""
+        self.fog_of_war.sync(self.game_state.get_visibility(self.current_player_id))
+
+    def _check_mission_end(self):
+        """Switches to the victory or defeat scene once the mission is decided."""
+        if self.check_win_condition():
+            self.game.scene_manager.switch_to("victory")
+        elif self.check_loss_condition():
+            self.game.scene_manager.switch_to("defeat")
 
     def check_win_condition(self) -> bool:
         """Checks if the player has won the level.
@@ -967,17 +935,13 @@ class GameScene:
         Returns:
             True if the win condition is met, False otherwise.
         """
-        for entity_id in self.game_state.get_entities_with_component(Player):
-            components = self.game_state.entities.get(entity_id)
-            if not components:
-                continue
-
-            player = components.get(Player)
-            if player and not player.is_human:
-                if self.has_player_2_opponent and player.player_id == config.NEUTRAL_PLAYER_ID:
-                    continue
-                if Health in components:
-                    return False
+        # Optimization: GameState keeps a live unit census, so this is a few
+        # counter lookups rather than a scan of every Player entity.
+        enemies = self.game_state.count_units(is_human=False)
+        if self.has_player_2_opponent:
+            enemies -= self.game_state.count_units(player_id=config.NEUTRAL_PLAYER_ID, is_human=False)
+        if enemies:
+            return False
 
         log.info("Victory! Mission Complete.")
         self.mission_over = True
@@ -1002,16 +966,9 @@ class GameScene:
         Returns:
             True if the loss condition is met, False otherwise.
         """
-        for entity_id in self.game_state.get_entities_with_component(Player):
-            components = self.game_state.entities.get(entity_id)
-            if not components:
-                continue
-
-            player = components.get(Player)
-            if player and player.is_human:
-                # Check for any player-controlled entity (unit or building)
-                if Health in components:
-                    return False
+        # Any player-controlled entity (unit or building) left
+        if self.game_state.count_units(is_human=True):
+            return False
 
         log.info("Defeat! Mission Failed.")
         self.mission_over = True
@@ -1026,108 +983,74 @@ class GameScene:
 
         Args:
             screen: The pygame screen surface to draw on.
+
+        Returns:
+            The screen areas that changed since the previous frame: the whole
+            screen while the simulation runs or after the game state changed
+            (e.g. the selection), and otherwise only the animated ocean, chat,
+            effects, tooltip and drag box. None when the camera moved.
         """
-        # Deep dark blue background for the ocean
-        screen.fill((0, 15, 35))
-
-        grid_size = int(config.GRID_SIZE * self.camera.zoom)
-        width, height = self.game.screen.get_size()
-
-        if grid_size > 0:
-            map_width = self.game_state.map.width
-            map_height = self.game_state.map.height
-            if not isinstance(map_width, (int, float)):
-                map_width = 0
-            if not isinstance(map_height, (int, float)):
-                map_height = 0
-
-            # 1. Draw solid black rectangle for the map area
-            map_left = int(-self.camera.x * grid_size)
-            map_top = int(-self.camera.y * grid_size)
-            map_width_px = map_width * grid_size
-            map_height_px = map_height * grid_size
-            pygame.draw.rect(screen, (0, 0, 0), pygame.Rect(map_left, map_top, map_width_px, map_height_px))
-
-            # 2. Draw animated wave characters in the out-of-bounds area
-            col_start = math.floor(self.camera.x)
-            row_start = math.floor(self.camera.y)
-            cols_count = math.ceil(width / grid_size) + 1
-            rows_count = math.ceil(height / grid_size) + 1
-
-            col_end = col_start + cols_count
-            row_end = row_start + rows_count
-            time_ms = pygame.time.get_ticks()
-
-            for r in range(row_start, row_end):
-                for c in range(col_start, col_end):
-                    # Only draw outside the map boundaries
-                    if 0 <= c < map_width and 0 <= r < map_height:
-                        continue
-
-                    # Animation frame changes every 400ms, offset by coordinates for movement
-                    char_idx = (c + r + time_ms // 400) % 4
-                    wave_surf = self._get_wave_surface(char_idx, grid_size)
-
-                    draw_x = int((c - self.camera.x) * grid_size)
-                    draw_y = int((r - self.camera.y) * grid_size)
-                    screen.blit(wave_surf, (draw_x, draw_y))
-
-            # 3. Draw grid lines *only* within the map boundaries
-            map_right = map_left + map_width_px
-            map_bottom = map_top + map_height_px
-
-            # Vertical lines
-            for col in range(map_width + 1):
-                x = int((col - self.camera.x) * grid_size)
-                if 0 <= x <= width:
-                    y_start = max(0, map_top)
-                    y_end = min(height, map_bottom)
-                    if y_start < y_end:
-                        pygame.draw.line(screen, (40, 40, 40), (x, y_start), (x, y_end))
-
-            # Horizontal lines
-            for row in range(map_height + 1):
-                y = int((row - self.camera.y) * grid_size)
-                if 0 <= y <= height:
-                    x_start = max(0, map_left)
-                    x_end = min(width, map_right)
-                    if x_start < x_end:
-                        pygame.draw.line(screen, (40, 40, 40), (x_start, y), (x_end, y))
-
-        self.game_state.map.draw(screen, self.font, camera=self.camera)
-        self.rendering_system.draw(self.game_state, self.paused)
+        screen_rect = screen.get_rect()
+        dirty = list(self.map_rendering_system.draw(self.game_state.map, self.game_state.corpses))
+        # Enemies under fog are only hidden while the fog is drawn.
+        viewer_id = None if self.cheats["reveal_map"] else self.current_player_id
+        # A paused game shows a still frame rather than the last tick's
+        # interpolation, which would shift with the frame timing.
+        alpha = 1.0 if self.paused else self.interpolation_alpha
+        self.rendering_system.draw(self.game_state, self.paused, alpha, viewer_id)
 
         if not self.cheats["reveal_map"]:
             self.fog_of_war.draw(screen, self.camera)
 
-        self.chat_system.draw()
-        self.ui_system.draw(self.game_state, self.paused, self.current_player_id)
+        dirty += self.chat_system.draw()
+        dirty += self.ui_system.draw(self.game_state, self.paused, self.current_player_id)
 
+        mouse_pos = pygame.mouse.get_pos()
+        tooltip_rect = None
         if self.hovered_entity_id is not None:
-            self.ui_system.draw_tooltip(self.game_state, self.hovered_entity_id, pygame.mouse.get_pos())
+            tooltip_rect = self.ui_system.draw_tooltip(self.game_state, self.hovered_entity_id, mouse_pos)
+        elif self.hovered_scrap_cell is not None:
+            amount = self.game_state.scrap.get(self.hovered_scrap_cell)
+            if amount:
+                tooltip_rect = self.ui_system.draw_scrap_tooltip(amount, mouse_pos)
+        if tooltip_rect:
+            dirty += self._dirty_areas.track(
+                "tooltip", (self.hovered_entity_id, self.hovered_scrap_cell, mouse_pos), [tooltip_rect]
+            )
+        else:
+            dirty += self._dirty_areas.track("tooltip", None)
 
         # Highlight selected units
+        drag_rect = None
         if self.selection_start:
             x1, y1 = self.selection_start
-            x2, y2 = pygame.mouse.get_pos()
+            x2, y2 = mouse_pos
             min_x, max_x = sorted((x1, x2))
             min_y, max_y = sorted((y1, y2))
-            rect = pygame.Rect(min_x, min_y, max_x - min_x, max_y - min_y)
-            overlay = pygame.Surface(rect.size, pygame.SRCALPHA)
+            drag_rect = pygame.Rect(min_x, min_y, max_x - min_x, max_y - min_y)
+            overlay = pygame.Surface(drag_rect.size, pygame.SRCALPHA)
             overlay.fill((0, 255, 0, 60))
-            screen.blit(overlay, rect.topleft)
-            pygame.draw.rect(screen, (0, 255, 0), rect, 1)
-
-    def _get_wave_surface(self, char_idx, grid_size):
-        """Pre-renders and scales wave characters to avoid runtime font overhead."""
-        cache_key = (char_idx, grid_size)
-        if cache_key not in self._wave_cache:
-            char = ["~", " ", "-", "."][char_idx]
-            surf = self.font.render(char, True, (0, 100, 180))
-            try:
-                surf = pygame.transform.scale(surf, (grid_size, grid_size))
-            except TypeError:
-                # If surf is a mock object (e.g. in tests), keep the mock as is
-                pass
-            self._wave_cache[cache_key] = surf
-        return self._wave_cache[cache_key]
+            screen.blit(overlay, drag_rect.topleft)
+            pygame.draw.rect(screen, (0, 255, 0), drag_rect, 1)
+        dirty += self._dirty_areas.track("drag", tuple(drag_rect) if drag_rect else None, [drag_rect] if drag_rect else [])
+
+        # Anything the game state or its display settings change can show
+        # up anywhere: units, selection panels, range overlays.
+        state = (
+            id(self.game_state),
+            self.game_state.change_version,
+            self.paused,
+            self.current_player_id,
+            tuple(self.cheats.items()),
+            self.game_state.resources.get(self.current_player_id),
+        )
+        dirty += self._dirty_areas.track("state", state, [screen_rect])
+
+        view = (self.camera.x, self.camera.y, self.camera.zoom, screen_rect.size)
+        if view != self._last_view:
+            self._last_view = view
+            return None
+        if not self.paused:
+            # Units move anywhere in view while the simulation runs.
+            return [screen_rect]
+        return dirty
@@ -38,6 +38,8 @@ class MenuScene:
             "Quit": "Exit the game.",
         }
         self.option_rects = []
+        # Areas drawn with changing content last frame, see draw().
+        self._last_dirty_rects = []
         self.title_font = pygame.font.Font(None, 74)
         self.option_font = pygame.font.Font(None, 50)
         self.time = 0.0
@@ -168,6 +170,11 @@ class MenuScene:
 
         Args:
             screen: The pygame screen surface to draw on.
+
+        Returns:
+            The screen areas that may have changed since the previous frame:
+            the options and help text as drawn now and as drawn last frame.
+            The title and background are static.
         """
         screen.fill((0, 0, 0))
 
@@ -203,12 +210,14 @@ class MenuScene:
             self.option_rects.append((text_rect, i))
 
         # Draw helper text for the currently selected option
+        dirty_rects = []
         current_option = self.menu_options[self.selected_option]
         help_text = self.help_texts.get(current_option, "")
         if help_text:
             help_surf = self.game.font.render(help_text, True, (150, 150, 150))
             help_rect = help_surf.get_rect(center=(self.game.screen.get_width() / 2, self.game.screen.get_height() - 50))
             screen.blit(help_surf, help_rect)
+            dirty_rects.append(help_rect)
 
         # Draw game version in bottom-right corner
         version_text = f"v{config.VERSION}"
@@ -217,3 +226,8 @@ class MenuScene:
             bottomright=(self.game.screen.get_width() - 10, self.game.screen.get_height() - 10)
         )
         screen.blit(version_surf, version_rect)
+
+        dirty_rects.extend(rect for rect, _ in self.option_rects)
+        changed = dirty_rects + self._last_dirty_rects
+        self._last_dirty_rects = dirty_rects
+        return changed
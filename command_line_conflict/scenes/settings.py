@@ -41,6 +41,8 @@ class SettingsScene:
         self.option_spacing = 52
         self.selected_option = 0
         self.option_rects = []
+        # Areas drawn with changing content last frame, see draw().
+        self._last_dirty_rects = []
         self.screen_sizes = [(800, 600), (1024, 768), (1280, 720)]
         self.current_screen_size_index = 0
         try:
@@ -214,6 +216,11 @@ class SettingsScene:
 
         Args:
             screen: The pygame screen surface to draw on.
+
+        Returns:
+            The screen areas that may have changed since the previous frame:
+            the options and help text as drawn now and as drawn last frame.
+            The title and background are static.
         """
         screen.fill((0, 0, 0))
 
@@ -264,6 +271,7 @@ class SettingsScene:
             self.option_rects.append((text_rect, i))
 
         # Helper text for current option
+        dirty_rects = [rect for rect, _ in self.option_rects]
         current_option = self.settings_options[self.selected_option]
         help_message = self.help_texts.get(current_option, "")
         if "Volume" in current_option:
@@ -274,3 +282,8 @@ class SettingsScene:
             help_text = self._get_text_surface(help_message, (150, 150, 150), "help")
             help_rect = help_text.get_rect(center=(self.game.screen.get_width() / 2, self.game.screen.get_height() - 50))
             screen.blit(help_text, help_rect)
+            dirty_rects.append(help_rect)
+
+        changed = dirty_rects + self._last_dirty_rects
+        self._last_dirty_rects = dirty_rects
+        return changed
@@ -0,0 +1,233 @@
+"""Headless simulation runner.
+
+Runs a match through the simulation systems only: no window, fonts, music,
+sound or Steam. The world advances in fixed ticks as fast as the CPU allows,
+which makes it suitable for soak tests, AI experiments and profiling.
+
+Usage:
+    python -m command_line_conflict.simulation --ticks 3000 --map factory_battle
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+
+from . import config, factories
+from .campaign_manager import CampaignManager
+from .game_state import GameState
+from .logger import log
+from .maps import FactoryBattleMap, Map, SimpleMap, WallMap
+from .systems.ai_system import AISystem
+from .systems.combat_system import CombatSystem
+from .systems.confetti_system import ConfettiSystem
+from .systems.corpse_removal_system import CorpseRemovalSystem
+from .systems.flee_system import FleeSystem
+from .systems.health_system import HealthSystem
+from .systems.movement_system import MovementSystem
+from .systems.production_system import ProductionSystem
+from .systems.resource_system import ResourceSystem
+from .systems.spawn_system import SpawnSystem
+from .systems.vision_system import VisionSystem
+from .systems.wander_system import WanderSystem
+from .utils.system_scheduler import SystemScheduler
+
+MAPS = {
+    "simple": SimpleMap,
+    "wall": WallMap,
+    "factory_battle": FactoryBattleMap,
+}
+
+
+def register_simulation_systems(scheduler: SystemScheduler, owner) -> None:
+    """Registers the simulation steps shared by GameScene and HeadlessSimulation.
+
+    Steps run in registration order. Steps without a rate run every tick;
+    the others run at the given frequency (Hz) and receive the dt
+    accumulated since their last run.
+
+    Args:
+        scheduler: The scheduler to add the steps to.
+        owner: The GameScene or HeadlessSimulation holding the game_state and
+            the systems the steps call. Its game_state is looked up on every
+            step, so a replaced game state is picked up.
+    """
+    schedule = scheduler.register
+    # Advances the simulation clock, expiring the timers systems scheduled on it.
+    schedule("Timers", lambda dt: owner.game_state.timers.advance(dt))
+    # Runs early so that targeting and rendering see this tick's vision.
+    schedule("VisionSystem", lambda dt: owner.vision_system.update(owner.game_state, dt))
+    schedule("HealthSystem", lambda dt: owner.health_system.update(owner.game_state, dt))
+    schedule("FleeSystem", lambda dt: owner.flee_system.update(owner.game_state, dt))
+    schedule("AISystem", lambda dt: owner.ai_system.update(owner.game_state, dt))
+    schedule("WanderSystem", lambda dt: owner.wander_system.update(owner.game_state, dt), rate=5, phase=0.25)
+    schedule("CombatSystem", lambda dt: owner.combat_system.update(owner.game_state, dt))
+    schedule("ConfettiSystem", lambda dt: owner.confetti_system.update(owner.game_state, dt))
+    schedule("MovementSystem", lambda dt: owner.movement_system.update(owner.game_state, dt))
+    schedule("ResourceSystem", lambda dt: owner.resource_system.update(owner.game_state, dt))
+    # NOTE: ProductionSystem still grants FREE walk-in transformations
+    # (unit standing on a factory tile becomes the factory's output),
+    # which bypasses the scrap prices charged by the training hotkeys.
+    # See the DESIGN NOTE on ProductionSystem before rebalancing costs.
+    schedule("ProductionSystem", lambda dt: owner.production_system.update(owner.game_state, dt))
+    schedule("CorpseRemovalSystem", lambda dt: owner.corpse_removal_system.update(owner.game_state, dt), rate=5, phase=0.75)
+    schedule("SpawnSystem", lambda dt: owner.spawn_system.update(owner.game_state, dt), rate=5, phase=0.5)
+
+
+class SimulationReport:
+    """The outcome of a HeadlessSimulation.run call."""
+
+    def __init__(self, ticks: int, sim_seconds: float, wall_seconds: float, entity_count: int):
+        """Initializes the report.
+
+        Args:
+            ticks: How many simulation ticks were run.
+            sim_seconds: The amount of game time those ticks covered.
+            wall_seconds: The real time it took to run them.
+            entity_count: The number of entities alive at the end of the run.
+        """
+        self.ticks = ticks
+        self.sim_seconds = sim_seconds
+        self.wall_seconds = wall_seconds
+        self.entity_count = entity_count
+
+    @property
+    def ticks_per_second(self) -> float:
+        """Simulation ticks completed per second of real time."""
+        return self.ticks / self.wall_seconds if self.wall_seconds > 0 else float("inf")
+
+    @property
+    def speedup(self) -> float:
+        """How much faster than real time the simulation ran."""
+        return self.sim_seconds / self.wall_seconds if self.wall_seconds > 0 else float("inf")
+
+    def __str__(self) -> str:
+        return (
+            f"{self.ticks} ticks ({self.sim_seconds:.1f}s of game time) in {self.wall_seconds:.3f}s: "
+            f"{self.ticks_per_second:.1f} ticks/s, {self.speedup:.1f}x real time, {self.entity_count} entities"
+        )
+
+
+class HeadlessSimulation:
+    """Builds a GameState and the simulation systems, without any pygame display.
+
+    The systems run in the same order and at the same rates as in GameScene;
+    presentation-only steps (sound, floating text, fog of war, win/loss
+    scene switches) are left out.
+    """
+
+    def __init__(
+        self,
+        game_map: Map | None = None,
+        tick_rate: float | None = None,
+        campaign_manager: CampaignManager | None = None,
+        create_initial_units: bool = True,
+    ) -> None:
+        """Initializes the HeadlessSimulation.
+
+        Args:
+            game_map: The map to play on. Defaults to FactoryBattleMap.
+            tick_rate: Simulation ticks per second of game time. Defaults to
+                config.SIMULATION_TICK_RATE.
+            campaign_manager: Decides which units factories may produce.
+                Defaults to a fresh campaign that never reads or writes the
+                player's save file.
+            create_initial_units: Whether to populate the map with its
+                starting units.
+        """
+        self.game_state = GameState(game_map or FactoryBattleMap())
+        self.dt = 1.0 / (tick_rate or config.SIMULATION_TICK_RATE)
+        self.ticks = 0
+
+        self.campaign_manager = campaign_manager or CampaignManager(save_file=os.devnull)
+        self.game_state.campaign_manager = self.campaign_manager
+
+        self.health_system = HealthSystem()
+        self.flee_system = FleeSystem()
+        self.ai_system = AISystem()
+        self.wander_system = WanderSystem()
+        self.combat_system = CombatSystem()
+        self.confetti_system = ConfettiSystem()
+        self.movement_system = MovementSystem()
+        self.resource_system = ResourceSystem()
+        self.production_system = ProductionSystem(self.campaign_manager)
+        self.corpse_removal_system = CorpseRemovalSystem()
+        self.spawn_system = SpawnSystem(spawn_interval=5.0)
+        self.vision_system = VisionSystem()
+
+        self.scheduler = SystemScheduler()
+        register_simulation_systems(self.scheduler, self)
+
+        if create_initial_units:
+            self._create_initial_units()
+
+    def _create_initial_units(self) -> None:
+        """Creates the starting units, like GameScene does."""
+        if hasattr(self.game_state.map, "create_initial_units"):
+            self.game_state.map.create_initial_units(self.game_state)
+        else:
+            for i in range(3):
+                factories.create_chassis(self.game_state, 10 + i * 2, 10, player_id=1, is_human=True)
+            factories.create_rover(self.game_state, 20, 15, player_id=2, is_human=False)
+
+    def step(self) -> None:
+        """Advances the simulation by a single fixed tick."""
+        self.game_state.begin_tick()
+        self.scheduler.update(self.dt)
+        # Nothing consumes sound or visual events without a display.
+        self.game_state.event_queue.clear()
+        self.ticks += 1
+
+    def run(self, ticks: int) -> SimulationReport:
+        """Runs the given number of ticks as fast as possible.
+
+        Args:
+            ticks: How many ticks to simulate.
+
+        Returns:
+            A SimulationReport with the achieved throughput.
+        """
+        start_time = time.perf_counter()
+        for _ in range(ticks):
+            self.step()
+        wall_seconds = time.perf_counter() - start_time
+
+        report = SimulationReport(ticks, ticks * self.dt, wall_seconds, len(self.game_state.entities))
+        log.info(f"Headless simulation: {report}")
+        return report
+
+
+def main(argv: list[str] | None = None) -> SimulationReport:
+    """Command line entry point for the headless runner.
+
+    Args:
+        argv: The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        The SimulationReport of the run.
+    """
+    parser = argparse.ArgumentParser(description="Run Command Line Conflict without a display.")
+    parser.add_argument("--ticks", type=int, default=3000, help="number of simulation ticks to run")
+    parser.add_argument("--map", choices=sorted(MAPS), default="factory_battle", help="map to play on")
+    parser.add_argument("--tick-rate", type=float, default=config.SIMULATION_TICK_RATE, help="ticks per game second")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the random number generator")
+    args = parser.parse_args(argv)
+
+    # Nothing here opens a window or an audio device, but make sure that
+    # anything touching SDL by accident doesn't either.
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    simulation = HeadlessSimulation(MAPS[args.map](), tick_rate=args.tick_rate)
+    report = simulation.run(args.ticks)
+    print(report)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from .. import config
 from ..components.attack import Attack
 from ..components.flee import Flee
 from ..components.player import Player
@@ -9,14 +10,50 @@ from ..utils.targeting import Targeting
 
 
 class AISystem:
-    """Controls the behavior of AI-controlled entities."""
+    """Controls the behavior of AI-controlled entities.
 
-    def update(self, game_state: GameState) -> None:
+    Idle units only re-run target acquisition a few times per second. Each
+    unit is assigned a phase from its entity ID, so the searches are spread
+    evenly across frames instead of all landing on the same one.
+    """
+
+    # Fractional part of the golden ratio; multiplying entity IDs by it
+    # scatters consecutive IDs evenly over [0, 1).
+    PHASE_HASH = 0.6180339887498949
+
+    def __init__(self, think_rate: float | None = None):
+        """Initializes the AISystem.
+
+        Args:
+            think_rate: Target acquisitions per second for each idle unit.
+                Defaults to config.AI_THINK_RATE. A value <= 0 makes units
+                think on every update.
+        """
+        if think_rate is None:
+            think_rate = config.AI_THINK_RATE
+        self.think_interval = 1.0 / think_rate if think_rate > 0 else 0.0
+        self.elapsed = 0.0
+
+    def _think_slot(self, entity_id: int) -> int:
+        """Returns the index of the think window the entity is currently in.
+
+        The slot changes once per think_interval, offset by a per-entity
+        phase so that different units roll over on different frames.
+        """
+        if self.think_interval <= 0:
+            return -1
+        phase = (entity_id * self.PHASE_HASH) % 1.0
+        return int(self.elapsed / self.think_interval + phase)
+
+    def update(self, game_state: GameState, dt: float = 0.0) -> None:
         """Processes AI logic for all entities.
 
         Args:
             game_state: The current state of the game.
+            dt: The time elapsed since the last frame.
         """
+        self.elapsed += dt
+
         # Optimization: Iterate only over entities with Attack component
         # This avoids iterating over non-combat entities (walls, minerals, etc.)
         # Note: We iterate over the set directly (no list copy) to avoid O(N) allocation.
@@ -56,6 +93,13 @@ class AISystem:
                 if vision:
                     my_pos = components.get(Position)
                     if my_pos:
+                        # Throttle: search at most once per think slot.
+                        # think_slot is None for new or freshly damaged units.
+                        slot = self._think_slot(entity_id)
+                        if slot != -1 and attack.think_slot == slot:
+                            continue
+                        attack.think_slot = slot
+
                         closest_enemy = Targeting.find_closest_enemy(entity_id, my_pos, player, vision, game_state)
                         if closest_enemy:
                             log.debug(
@@ -1,6 +1,7 @@
 import pygame
 
 from command_line_conflict import config
+from command_line_conflict.utils.dirty_areas import DirtyAreas
 
 
 class ChatSystem:
@@ -31,6 +32,7 @@ class ChatSystem:
         self.cursor_blink_timer = 0
         self.cursor_visible = True
         self.show_log = False  # Toggle for persistent log view
+        self._dirty_areas = DirtyAreas()
 
     def add_message(self, text: str, color: tuple[int, int, int] = (255, 255, 255)):
         """Adds a message to the chat history.
@@ -144,8 +146,12 @@ class ChatSystem:
             # Keep history visible while typing
             self.last_message_time = pygame.time.get_ticks()
 
-    def draw(self):
-        """Draws the chat overlay and input box."""
+    def draw(self) -> list[pygame.Rect]:
+        """Draws the chat overlay and input box.
+
+        Returns:
+            The screen areas of the chat that changed since the previous draw.
+        """
         current_time = pygame.time.get_ticks()
 
         # Determine if we should show history
@@ -154,7 +160,7 @@ class ChatSystem:
         )
 
         if not show_history and not self.input_active:
-            return
+            return self._dirty_areas.track("chat", None)
 
         # Anchor the chat above the contextual hint panels. UISystem draws
         # "Construction:" / "Factory Production:" hints in the band from
@@ -164,6 +170,8 @@ class ChatSystem:
         # unreadable text whenever a factory or chassis is selected.
         chat_bottom = config.SCREEN_HEIGHT - 170
         line_height = 20
+        rects = []
+        visible = []
 
         # Draw messages
         if show_history:
@@ -174,7 +182,7 @@ class ChatSystem:
                 bg_rect = pygame.Rect(5, chat_bottom - height, 600, height)
                 s = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
                 s.fill((0, 0, 0, 160))  # Semi-transparent black
-                self.screen.blit(s, bg_rect.topleft)
+                rects.append(self.screen.blit(s, bg_rect.topleft))
 
             # The transient overlay only shows the newest few lines; the L
             # log toggle shows everything with a backdrop.
@@ -194,8 +202,8 @@ class ChatSystem:
                 if self.input_active:
                     y_pos -= line_height + 5  # Make room for input box
 
-                self.screen.blit(shadow_surface, (12, y_pos + 2))
-                self.screen.blit(text_surface, (10, y_pos))
+                rects.append(self.screen.blit(shadow_surface, (12, y_pos + 2)))
+                rects.append(self.screen.blit(text_surface, (10, y_pos)))
 
         # Draw input box
         if self.input_active:
@@ -203,7 +211,7 @@ class ChatSystem:
 
             # Draw background for input
             input_bg_rect = pygame.Rect(5, input_y - 2, 400, line_height + 4)
-            pygame.draw.rect(self.screen, (0, 0, 0, 180), input_bg_rect)
+            rects.append(pygame.draw.rect(self.screen, (0, 0, 0, 180), input_bg_rect))
             pygame.draw.rect(self.screen, (100, 100, 100), input_bg_rect, 1)
 
             # Draw text
@@ -212,4 +220,13 @@ class ChatSystem:
                 display_text += "_"
 
             text_surface = self.font.render(display_text, True, (255, 255, 255))
-            self.screen.blit(text_surface, (10, input_y))
+            rects.append(self.screen.blit(text_surface, (10, input_y)))
+
+        key = (
+            self.show_log,
+            self.input_active,
+            self.input_text,
+            self.cursor_visible,
+            tuple((msg["text"], msg["color"]) for msg in visible),
+        )
+        return self._dirty_areas.track("chat", key, rects)
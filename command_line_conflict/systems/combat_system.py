@@ -4,7 +4,6 @@ from ..components.health import Health
 from ..components.movable import Movable
 from ..components.position import Position
 from ..components.unit_identity import UnitIdentity
-from ..factories import create_confetti
 from ..game_state import GameState
 from ..logger import log
 
@@ -12,10 +11,13 @@ from ..logger import log
 class CombatSystem:
     """Handles combat interactions between entities."""
 
+    # Seconds the confetti of a ranged hit stays on screen
+    CONFETTI_LIFETIME = 0.5
+
     def update(self, game_state: GameState, dt: float) -> None:
         """Processes combat logic for all entities.
         This method iterates through all entities with an Attack component,
-        manages attack cooldowns, finds targets, and executes attacks.
+        checks attack cooldowns, finds targets, and executes attacks.
         Args:
             game_state: The current state of the game.
             dt: The time elapsed since the last frame.
@@ -24,8 +26,11 @@ class CombatSystem:
         # This avoids iterating over non-combat entities (walls, minerals, etc.)
         # Note: We iterate over the set directly (no list copy) to avoid O(N) allocation.
         # This is safe because CombatSystem does not add/remove the Attack component
-        # or entities during iteration (death is handled by CorpseRemovalSystem).
+        # or entities during iteration (death is handled by HealthSystem).
         attackers = game_state.get_entities_with_component(Attack)
+        # Optimization: cooldowns are a "ready at" time on the simulation
+        # clock, so nothing counts them down on every attacker every tick.
+        now = game_state.timers.now
 
         for entity_id in attackers:
             components = game_state.entities.get(entity_id)
@@ -36,10 +41,6 @@ class CombatSystem:
             if not attack:
                 continue
 
-            # Cooldowns
-            if attack.attack_cooldown > 0:
-                attack.attack_cooldown -= dt
-
             # Attack the target if we have one
             if attack.attack_target:
                 target_components = game_state.entities.get(attack.attack_target)
@@ -70,7 +71,7 @@ class CombatSystem:
                         movable.path = []
                         movable.target_x, movable.target_y = my_pos.x, my_pos.y
 
-                    if attack.attack_cooldown <= 0 and attack.attack_damage > 0:  # pylint: disable=chained-comparison
+                    if attack.ready_at <= now and attack.attack_damage > 0:  # pylint: disable=chained-comparison
                         if config.DEBUG:
                             # Get entity names for logging
                             attacker_identity = components.get(UnitIdentity)
@@ -98,19 +99,24 @@ class CombatSystem:
                                 "y": target_pos.y,
                                 "text": str(int(attack.attack_damage)),
                                 "color": (255, 50, 50),  # Reddish for damage
+                                # Lets the UI merge rapid hits on one target
+                                "target": attack.attack_target,
                             }
                         )
                         # Retaliation Logic:
                         # If the target has an Attack component and no current target, make them fight back.
                         target_attack = target_components.get(Attack)
-                        if target_attack and target_attack.attack_target is None:
-                            target_attack.attack_target = entity_id
+                        if target_attack:
+                            if target_attack.attack_target is None:
+                                target_attack.attack_target = entity_id
+                            # Wake the AI up: taking damage overrides the think-interval throttle.
+                            target_attack.think_slot = None
 
                         if attack.attack_range > 1:
-                            create_confetti(game_state, target_pos.x, target_pos.y)
+                            game_state.particles.emit(target_pos.x, target_pos.y, self.CONFETTI_LIFETIME)
                             if config.DEBUG:
                                 log.info(f"Confetti effect created at ({target_pos.x}, {target_pos.y})")
-                        attack.attack_cooldown = 1 / attack.attack_speed
+                        attack.ready_at = now + 1 / attack.attack_speed
                 else:
                     # Move towards target
                     movable = components.get(Movable)
@@ -1,10 +1,8 @@
-from ..components.dead import Dead
 from ..game_state import GameState
-from ..logger import log
 
 
 class CorpseRemovalSystem:
-    """Removes dead entities from the game after a specified time."""
+    """Fades out corpses and removes them from the ground after a specified time."""
 
     def __init__(self, corpse_lifetime: float = 5.0):
         """Initializes the CorpseRemovalSystem.
@@ -15,19 +13,12 @@ class CorpseRemovalSystem:
         self.corpse_lifetime = corpse_lifetime
 
     def update(self, game_state: GameState, dt: float) -> None:
-        """Updates the timer on dead entities and removes them if expired.
+        """Ages the corpses on the ground and removes the expired ones.
 
         Args:
             game_state: The current state of the game.
             dt: The time elapsed since the last frame.
         """
-        # Optimized to iterate only over entities with Dead component
-        # We must iterate over a copy because we might remove entities.
-        for entity_id in list(game_state.get_entities_with_component(Dead)):
-            dead = game_state.get_component(entity_id, Dead)
-            if dead:
-                dead.timer += dt
-                if dead.timer >= self.corpse_lifetime:
-                    log.debug(f"Removing corpse of entity {entity_id}")
-                    game_state.remove_entity(entity_id)
-                    log.debug(f"Removed corpse of entity {entity_id}.")
+        # Optimization: corpses are a packed array on the GameState, not
+        # entities, so this is a single bulk update.
+        game_state.corpses.update(dt, self.corpse_lifetime)
@@ -1,12 +1,8 @@
 from .. import config
-from ..components.attack import Attack
-from ..components.dead import Dead
-from ..components.flee import Flee
 from ..components.health import Health
-from ..components.movable import Movable
 from ..components.player import Player
 from ..components.position import Position
-from ..components.selectable import Selectable
+from ..components.renderable import Renderable
 from ..game_state import GameState
 from ..logger import log
 
@@ -17,15 +13,19 @@ class HealthSystem:
     def update(self, game_state: GameState, dt: float) -> None:
         """Processes health regeneration and handles entity death.
 
-        This method iterates through all entities with a Health component.
-        It applies health regeneration and marks entities with zero or less
-        health as Dead, removing other components to prevent further actions.
+        This method iterates through the entities that are dead or damaged
+        and regenerating. It applies health regeneration and removes entities
+        with zero or less health, leaving a corpse on the ground if they were
+        drawn.
 
         Args:
             game_state: The current state of the game.
             dt: The time elapsed since the last frame.
         """
-        for entity_id in list(game_state.get_entities_with_component(Health)):
+        # Optimization: Health keeps the "health" active set up to date as hp
+        # changes, so units at full health (or damaged without regeneration)
+        # cost nothing here. Copied because healing and removal change it.
+        for entity_id in list(game_state.get_active_entities(Health.ACTIVE_SET)):
             components = game_state.entities.get(entity_id)
             if not components:
                 continue
@@ -35,26 +35,24 @@ class HealthSystem:
                 continue
 
             if health.hp <= 0:
-                if not components.get(Dead):
-                    if config.DEBUG:
-                        log.info(f"Entity {entity_id} has died.")
-
-                    # Play death sound
-                    game_state.add_event({"type": "sound", "data": {"name": "explosion"}})
-
-                    # Spawn scrap if a neutral unit dies
-                    player = components.get(Player)
-                    pos = components.get(Position)
-                    if player and player.player_id == config.NEUTRAL_PLAYER_ID and pos:
-                        from .. import factories
-
-                        factories.create_scrap(game_state, pos.x, pos.y, amount=50)
-
-                    game_state.add_component(entity_id, Dead())
-                    game_state.remove_component(entity_id, Movable)
-                    game_state.remove_component(entity_id, Attack)
-                    game_state.remove_component(entity_id, Selectable)
-                    game_state.remove_component(entity_id, Flee)
+                if config.DEBUG:
+                    log.info(f"Entity {entity_id} has died.")
+
+                # Play death sound
+                game_state.add_event({"type": "sound", "data": {"name": "explosion"}})
+
+                # Spawn scrap if a neutral unit dies
+                player = components.get(Player)
+                pos = components.get(Position)
+                if player and player.player_id == config.NEUTRAL_PLAYER_ID and pos:
+                    game_state.add_scrap(pos.x, pos.y, amount=50)
+
+                # Optimization: the dead leave the entity tables right away;
+                # only their glyph stays behind, on the corpse layer.
+                renderable = components.get(Renderable)
+                if renderable and pos:
+                    game_state.corpses.add(pos.x, pos.y, renderable.icon)
+                game_state.remove_entity(entity_id)
             elif health.hp < health.max_hp:
                 health.hp += health.health_regen_rate * dt
                 health.hp = min(health.hp, health.max_hp)
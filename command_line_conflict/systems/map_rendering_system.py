@@ -0,0 +1,341 @@
+import math
+from collections import OrderedDict
+
+import pygame
+
+from .. import config
+from ..camera import Camera
+from ..corpses import CorpseLayer
+from ..logger import log
+from ..maps.base import Map
+from ..utils.dirty_areas import DirtyAreas
+
+
+class MapRenderingSystem:
+    """Draws the map background: the ocean, the map floor, grid lines and walls.
+
+    The floor, grid lines and walls only change when the walls are edited or
+    the zoom changes, so they are pre-rendered onto square chunk surfaces of
+    CHUNK_CELLS cells per (map epoch, zoom), built when they first come into
+    view. A frame blits only the chunks in view, so maps of any size are
+    cached; the least recently drawn chunks are dropped once they hold more
+    than MAX_STATIC_MAP_LAYER_PIXELS. Corpses are baked into the chunks as
+    ground decals; when the corpse layer changes, only the cells whose
+    corpses changed are redrawn.
+
+    The ocean is drawn the same way: its wave pattern only depends on
+    (column + row + animation frame) % 4, so each of the four frames is
+    pre-composited into a screen-sized sheet that is blitted once, with the
+    map layer drawn over it.
+    """
+
+    OCEAN_COLOR = (0, 15, 35)
+    FLOOR_COLOR = (0, 0, 0)
+    GRID_LINE_COLOR = (40, 40, 40)
+    WAVE_COLOR = (0, 100, 180)
+    WAVE_CHARS = ["~", " ", "-", "."]
+    CORPSE_COLOR = (128, 128, 128)
+    # Cells along each side of a static layer chunk
+    CHUNK_CELLS = 64
+
+    def __init__(self, screen, font, camera: Camera):
+        """Initializes the MapRenderingSystem.
+
+        Args:
+            screen: The pygame screen surface to draw on.
+            font: The pygame font used to render walls and waves.
+            camera: The camera object controlling view and zoom.
+        """
+        self.screen = screen
+        self.font = font
+        self.camera = camera
+        # The built chunks of the static layer by (column, row), least
+        # recently drawn first, and the (map, epoch, zoom) they were built for
+        self._chunks: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+        self._chunk_pixels = 0
+        self._static_layer_key: tuple | None = None
+        self._wave_cache: dict[tuple[int, int], pygame.Surface] = {}
+        self._ocean_sheets: dict[int, pygame.Surface] = {}
+        self._ocean_sheets_key: tuple[int, int, int] | None = None
+        # The corpses baked into the built chunks, per cell, and the corpse
+        # layer version they reflect. Chunks built later bake them too.
+        self._baked_corpses: dict[tuple[int, int], list[tuple[str, int]]] = {}
+        self._baked_corpses_version: int | None = None
+        self._corpse_glyphs: dict[tuple[str, int, int], pygame.Surface] = {}
+        self._dirty_areas = DirtyAreas()
+
+    def draw(self, game_map: Map, corpses: CorpseLayer | None = None) -> list[pygame.Rect]:
+        """Draws the map background onto the screen.
+
+        Args:
+            game_map: The map to draw.
+            corpses: The corpses to draw on the ground, if any.
+
+        Returns:
+            The screen areas that changed since the previous draw if the
+            camera did not move: the ocean on a new wave frame, the map after
+            a wall edit, and the cells whose corpses changed.
+        """
+        screen = self.screen
+        width, height = screen.get_size()
+        screen_rect = pygame.Rect(0, 0, width, height)
+
+        grid_size = int(config.GRID_SIZE * self.camera.zoom)
+        if grid_size <= 0:
+            screen.fill(self.OCEAN_COLOR)
+            game_map.draw(screen, self.font, camera=self.camera)
+            return [screen_rect]
+
+        map_width = game_map.width
+        map_height = game_map.height
+        if not isinstance(map_width, (int, float)):
+            map_width = 0
+        if not isinstance(map_height, (int, float)):
+            map_height = 0
+
+        map_left = int(-self.camera.x * grid_size)
+        map_top = int(-self.camera.y * grid_size)
+        map_rect = pygame.Rect(map_left, map_top, map_width * grid_size + 1, map_height * grid_size + 1)
+        phase = self._draw_ocean(width, height, grid_size)
+        dirty = self._dirty_areas.track("ocean", phase, self._ocean_rects(screen_rect, map_rect))
+
+        key = (id(game_map), game_map.epoch, grid_size, map_width, map_height)
+        if key != self._static_layer_key:
+            log.debug(f"Resetting static map layer (epoch {game_map.epoch}, grid size {grid_size})")
+            self._chunks = OrderedDict()
+            self._chunk_pixels = 0
+            self._static_layer_key = key
+            self._baked_corpses = {}
+            self._baked_corpses_version = None
+        dirty += self._dirty_areas.track("layer", key, [map_rect.clip(screen_rect)])
+        if corpses is not None:
+            for x, y in self._bake_corpses(corpses, game_map, grid_size):
+                cell_rect = pygame.Rect(map_left + x * grid_size, map_top + y * grid_size, grid_size, grid_size)
+                if cell_rect.colliderect(screen_rect):
+                    dirty.append(cell_rect)
+
+        chunk_px = self.CHUNK_CELLS * grid_size
+        # Chunks overlapping the screen, clipped to the map
+        first_col = max(0, -map_left // chunk_px)
+        first_row = max(0, -map_top // chunk_px)
+        last_col = min(math.ceil(map_width / self.CHUNK_CELLS) - 1, (width - 1 - map_left) // chunk_px)
+        last_row = min(math.ceil(map_height / self.CHUNK_CELLS) - 1, (height - 1 - map_top) // chunk_px)
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                chunk = self._get_chunk(game_map, col, row, grid_size, map_width, map_height)
+                screen.blit(chunk, (map_left + col * chunk_px, map_top + row * chunk_px))
+        return dirty
+
+    @staticmethod
+    def _ocean_rects(screen_rect: pygame.Rect, map_rect: pygame.Rect) -> list[pygame.Rect]:
+        """Returns the parts of the screen the map does not cover."""
+        inner = map_rect.clip(screen_rect)
+        if not inner:
+            return [screen_rect]
+        bands = [
+            pygame.Rect(0, 0, screen_rect.width, inner.top),
+            pygame.Rect(0, inner.bottom, screen_rect.width, screen_rect.height - inner.bottom),
+            pygame.Rect(0, inner.top, inner.left, inner.height),
+            pygame.Rect(inner.right, inner.top, screen_rect.width - inner.right, inner.height),
+        ]
+        return [band for band in bands if band]
+
+    def _get_chunk(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, game_map: Map, col: int, row: int, grid_size: int, map_width: int, map_height: int
+    ) -> pygame.Surface:
+        """Returns a pre-rendered chunk of floor, grid and walls, building it if needed."""
+        chunk = self._chunks.get((col, row))
+        if chunk is not None:
+            self._chunks.move_to_end((col, row))
+            return chunk
+
+        cells = self.CHUNK_CELLS
+        # The last chunk of a row or column also holds the closing grid line.
+        width_px = min(cells, map_width - col * cells) * grid_size + (1 if (col + 1) * cells >= map_width else 0)
+        height_px = min(cells, map_height - row * cells) * grid_size + (1 if (row + 1) * cells >= map_height else 0)
+        log.debug(f"Building static map chunk {(col, row)} ({width_px}x{height_px})")
+        chunk = pygame.Surface((width_px, height_px))
+        left = -col * cells * grid_size
+        top = -row * cells * grid_size
+        self._draw_floor(chunk, width_px, height_px, left, top, grid_size, map_width, map_height)
+        game_map.draw(chunk, self.font, camera=Camera(x=col * cells, y=row * cells, zoom=self.camera.zoom))
+        for (x, y), stack in self._baked_corpses.items():
+            if x // cells == col and y // cells == row:
+                for icon, stage in stack:
+                    chunk.blit(self._get_corpse_glyph(icon, stage, grid_size), (left + x * grid_size, top + y * grid_size))
+
+        self._chunks[(col, row)] = chunk
+        self._chunk_pixels += width_px * height_px
+        # Keep at least this chunk, even if it alone is over the budget.
+        while self._chunk_pixels > config.MAX_STATIC_MAP_LAYER_PIXELS and len(self._chunks) > 1:
+            _, evicted = self._chunks.popitem(last=False)
+            evicted_width, evicted_height = evicted.get_size()
+            self._chunk_pixels -= evicted_width * evicted_height
+        return chunk
+
+    def _bake_corpses(self, corpses: CorpseLayer, game_map: Map, grid_size: int) -> list[tuple[int, int]]:
+        """Brings the corpses baked into the built chunks up to date.
+
+        Only cells whose corpses were added, faded or removed since the last
+        bake are redrawn, so frames without deaths cost nothing.
+
+        Returns:
+            The cells whose corpses changed.
+        """
+        if corpses.version == self._baked_corpses_version:
+            return []
+        changed = []
+        wanted = self._corpses_by_cell(corpses, game_map)
+        baked = self._baked_corpses
+        cells = self.CHUNK_CELLS
+        for cell in wanted.keys() | baked.keys():
+            stack = wanted.get(cell)
+            if stack == baked.get(cell):
+                continue
+            changed.append(cell)
+            x, y = cell
+            chunk = self._chunks.get((x // cells, y // cells))
+            if chunk is None:
+                # Baked when the chunk is built.
+                continue
+            left = (x % cells) * grid_size
+            top = (y % cells) * grid_size
+            if cell in baked:
+                self._restore_floor_cell(chunk, left, top, grid_size)
+            for icon, stage in stack or ():
+                chunk.blit(self._get_corpse_glyph(icon, stage, grid_size), (left, top))
+        self._baked_corpses = wanted
+        self._baked_corpses_version = corpses.version
+        return changed
+
+    @staticmethod
+    def _corpses_by_cell(corpses: CorpseLayer, game_map: Map) -> dict[tuple[int, int], list[tuple[str, int]]]:
+        """Groups the (icon, fade stage) of the corpses on the map floor by cell, oldest first.
+
+        Corpses on walls are left out, so restoring a cell never has to
+        redraw a wall.
+        """
+        cells: dict[tuple[int, int], list[tuple[str, int]]] = {}
+        walls = game_map.walls
+        for x, y, icon, stage in corpses.entries():
+            if 0 <= x < game_map.width and 0 <= y < game_map.height and (x, y) not in walls:
+                cells.setdefault((x, y), []).append((icon, stage))
+        return cells
+
+    def _restore_floor_cell(self, layer: pygame.Surface, left: int, top: int, grid_size: int) -> None:
+        """Redraws the bare floor and the top and left grid lines of the cell at (left, top)."""
+        pygame.draw.rect(layer, self.FLOOR_COLOR, pygame.Rect(left, top, grid_size, grid_size))
+        pygame.draw.line(layer, self.GRID_LINE_COLOR, (left, top), (left + grid_size, top))
+        pygame.draw.line(layer, self.GRID_LINE_COLOR, (left, top), (left, top + grid_size))
+
+    def _get_corpse_glyph(self, icon: str, stage: int, grid_size: int):
+        """Returns the grey glyph of a corpse, more transparent at later fade stages."""
+        cache_key = (icon, stage, grid_size)
+        surf = self._corpse_glyphs.get(cache_key)
+        if surf is None:
+            surf = self.font.render(icon, True, self.CORPSE_COLOR)
+            try:
+                surf = pygame.transform.scale(surf, (grid_size, grid_size))
+            except TypeError:
+                # If surf is a mock object (e.g. in tests), keep the mock as is
+                pass
+            steps = CorpseLayer.FADE_STEPS
+            surf.set_alpha(255 * (steps - stage) // steps)
+            self._corpse_glyphs[cache_key] = surf
+        return surf
+
+    def _draw_floor(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, surf, width: int, height: int, left: int, top: int, grid_size: int, map_width: int, map_height: int
+    ) -> None:
+        """Draws the solid map area and its grid lines with the map origin at (left, top).
+
+        Lines are clipped to the width x height area of surf.
+        """
+        map_width_px = map_width * grid_size
+        map_height_px = map_height * grid_size
+        pygame.draw.rect(surf, self.FLOOR_COLOR, pygame.Rect(left, top, map_width_px, map_height_px))
+
+        map_right = left + map_width_px
+        map_bottom = top + map_height_px
+
+        # Vertical lines
+        y_start = max(0, top)
+        y_end = min(height, map_bottom)
+        if y_start < y_end:
+            for col in range(map_width + 1):
+                x = left + col * grid_size
+                if 0 <= x <= width:
+                    pygame.draw.line(surf, self.GRID_LINE_COLOR, (x, y_start), (x, y_end))
+
+        # Horizontal lines
+        x_start = max(0, left)
+        x_end = min(width, map_right)
+        if x_start < x_end:
+            for row in range(map_height + 1):
+                y = top + row * grid_size
+                if 0 <= y <= height:
+                    pygame.draw.line(surf, self.GRID_LINE_COLOR, (x_start, y), (x_end, y))
+
+    def _draw_ocean(self, width: int, height: int, grid_size: int) -> int:
+        """Covers the whole screen with animated waves in a single blit.
+
+        The map layer is drawn on top, so only the out-of-bounds area stays
+        visible.
+
+        Returns:
+            The wave animation frame drawn.
+        """
+        col_start = math.floor(self.camera.x)
+        row_start = math.floor(self.camera.y)
+        # Animation frame changes every 400ms, offset by coordinates for movement
+        phase = (col_start + row_start + pygame.time.get_ticks() // 400) % 4
+
+        sheet = self._get_ocean_sheet(phase, grid_size, width, height)
+        draw_x = int((col_start - self.camera.x) * grid_size)
+        draw_y = int((row_start - self.camera.y) * grid_size)
+        self.screen.blit(sheet, (draw_x, draw_y))
+        return phase
+
+    def _get_ocean_sheet(self, phase: int, grid_size: int, width: int, height: int) -> pygame.Surface:
+        """Returns a screen-sized wave sheet whose cell (i, j) shows wave (i + j + phase) % 4.
+
+        The sheet is one cell larger than the screen in each direction so it
+        can be shifted by the camera's sub-cell offset. Sheets are kept for
+        the current zoom and screen size only.
+        """
+        cols = math.ceil(width / grid_size) + 1
+        rows = math.ceil(height / grid_size) + 1
+        key = (grid_size, cols, rows)
+        if key != self._ocean_sheets_key:
+            self._ocean_sheets = {}
+            self._ocean_sheets_key = key
+
+        sheet = self._ocean_sheets.get(phase)
+        if sheet is None:
+            # The pattern repeats every 4 cells in both directions: composite
+            # one 4x4 tile, then tile it across the sheet.
+            tile = pygame.Surface((4 * grid_size, 4 * grid_size))
+            tile.fill(self.OCEAN_COLOR)
+            for j in range(4):
+                for i in range(4):
+                    tile.blit(self._get_wave_surface((i + j + phase) % 4, grid_size), (i * grid_size, j * grid_size))
+
+            sheet = pygame.Surface((cols * grid_size, rows * grid_size))
+            for row in range(0, rows, 4):
+                for col in range(0, cols, 4):
+                    sheet.blit(tile, (col * grid_size, row * grid_size))
+            self._ocean_sheets[phase] = sheet
+        return sheet
+
+    def _get_wave_surface(self, char_idx: int, grid_size: int):
+        """Pre-renders and scales wave characters to avoid runtime font overhead."""
+        cache_key = (char_idx, grid_size)
+        if cache_key not in self._wave_cache:
+            surf = self.font.render(self.WAVE_CHARS[char_idx], True, self.WAVE_COLOR)
+            try:
+                surf = pygame.transform.scale(surf, (grid_size, grid_size))
+            except TypeError:
+                # If surf is a mock object (e.g. in tests), keep the mock as is
+                pass
+            self._wave_cache[cache_key] = surf
+        return self._wave_cache[cache_key]
@@ -38,7 +38,7 @@ class MovementSystem:
 
         movable.target_x = x
         movable.target_y = y
-        movable.path_retry_timer = 0.0  # Reset retry timer on manual target set
+        movable.path_retry_at = 0.0  # Reset retry timer on manual target set
         movable.stuck_notified = False  # Allow a fresh stuck-ping for the new order
 
         if not movable.intelligent:
@@ -59,13 +59,14 @@ class MovementSystem:
             log.debug(f"Path found for entity {entity_id}: {movable.path}")
         else:
             log.warning(f"No path found for entity {entity_id} from ({position.x}, {position.y}) to ({x}, {y})")
-            movable.path_retry_timer = self.PATH_RETRY_INTERVAL
+            movable.path_retry_at = game_state.timers.now + self.PATH_RETRY_INTERVAL
 
     def update(self, game_state: GameState, dt: float) -> None:
         """Processes entity movement based on their current path or target.
 
         This method moves entities along their calculated path or directly
-        towards their target if no path is set.
+        towards their target if no path is set. Only the entities in the
+        "movement" active set are visited.
 
         Args:
             game_state: The current state of the game.
@@ -74,8 +75,13 @@ class MovementSystem:
         # Cache for blocking obstacles to avoid redundant calculations per frame
         blocking_obstacles_cache = None
 
-        # Optimized to iterate only over entities with Movable component
-        for entity_id in game_state.get_entities_with_component(Movable):
+        now = game_state.timers.now
+        active = game_state.get_active_entities(Movable.ACTIVE_SET)
+
+        # Optimization: Movable keeps the "movement" active set up to date as
+        # paths and targets are assigned, so idle units cost nothing here.
+        # Copied because moving changes the set.
+        for entity_id in list(active):
             components = game_state.entities.get(entity_id)
             if not components:
                 continue
@@ -86,9 +92,17 @@ class MovementSystem:
             if not position or not movable:
                 continue
 
-            # Update retry timer
-            if movable.path_retry_timer > 0:
-                movable.path_retry_timer -= dt
+            # An intelligent unit that reached the end of its path keeps its
+            # last target; it has nothing left to do until it gets a new one.
+            if (
+                not movable.path
+                and movable.intelligent
+                and movable.target_x is not None
+                and movable.target_y is not None
+                and (int(position.x), int(position.y)) == (int(movable.target_x), int(movable.target_y))
+            ):
+                movable.arrived = True
+                continue
 
             if movable.hold_position:
                 movable.path = []
@@ -101,7 +115,7 @@ class MovementSystem:
             if not movable.path and movable.target_x is not None and movable.target_y is not None:
                 if movable.intelligent:
                     # Check throttle before attempting pathfinding
-                    if movable.path_retry_timer <= 0:
+                    if movable.path_retry_at <= now:
                         start_node = (int(position.x), int(position.y))
                         end_node = (int(movable.target_x), int(movable.target_y))
                         if start_node != end_node:
@@ -127,7 +141,7 @@ class MovementSystem:
                                 )
                                 # Do NOT clear target here, so we can retry later.
                                 # Instead, set the retry timer.
-                                movable.path_retry_timer = self.PATH_RETRY_INTERVAL
+                                movable.path_retry_at = now + self.PATH_RETRY_INTERVAL
                                 # Previously: movable.target_x = None; movable.target_y = None
                                 # Keeping target allows retrying. But we must stop motion if path is empty.
                             else:
@@ -5,6 +5,7 @@ from command_line_conflict.components.player import Player
 from command_line_conflict.components.position import Position
 from command_line_conflict.components.unit_identity import UnitIdentity
 from command_line_conflict.logger import log
+from command_line_conflict.triggers import TriggerZones
 
 
 class ProductionSystem:
@@ -16,7 +17,7 @@ class ProductionSystem:
 
     1. Walk-in transformation (THIS system, the original mechanic):
        a unit whose UnitIdentity matches the factory's ``input_unit`` and
-       stands on the factory's tile is transformed into ``output_unit``
+       steps onto the factory's tile is transformed into ``output_unit``
        — chassis -> rover at a Rover Factory, rover -> arachnotron at an
        Arachnotron Factory. It costs NOTHING except the consumed unit.
 
@@ -51,6 +52,9 @@ class ProductionSystem:
 
     def __init__(self, campaign_manager: CampaignManager):
         self.campaign_manager = campaign_manager
+        # The factory trigger zones registered on _zones_state, by factory
+        self._factory_cells: dict[int, tuple[int, int]] = {}
+        self._zones_state = None
 
     def update(self, game_state, dt):
         """Checks for units entering factories and handles transformation.
@@ -59,23 +63,14 @@ class ProductionSystem:
             game_state: The current state of the game.
             dt: Delta time (unused for this check, but required by interface).
         """
-        # Find all entities with Factory component
-        factory_entities = []
-        for entity_id in game_state.get_entities_with_component(Factory):
-            components = game_state.entities.get(entity_id)
-            if components and Position in components:
-                factory_entities.append((entity_id, components))
-
-        if not factory_entities:
-            return
-
-        # Check for overlap with input units
-        # Iterate over a copy of entities to avoid modification issues if we delete
-        # entities while iterating (though create_entity creates a new ID, best be safe)
-        # Optimization: Iterate over entities with UnitIdentity instead of all entities
-        all_unit_entities = list(game_state.get_entities_with_component(UnitIdentity))
+        self._sync_factory_zones(game_state)
 
-        for unit_id in all_unit_entities:
+        # Optimization: factory tiles are trigger zones, so only units that
+        # just stepped onto one are checked, instead of every unit against
+        # every factory.
+        for kind, unit_id, cell in game_state.pop_trigger_events("factory"):
+            if kind != TriggerZones.ENTER:
+                continue
             unit_components = game_state.entities.get(unit_id)
             if not unit_components:
                 continue
@@ -84,34 +79,52 @@ class ProductionSystem:
             unit_identity = unit_components.get(UnitIdentity)
             unit_player = unit_components.get(Player)
 
-            if not unit_pos or not unit_identity:
+            if not unit_pos or not unit_identity or (int(unit_pos.x), int(unit_pos.y)) != cell:
                 continue
 
-            for factory_id, factory_components in factory_entities:
+            for factory_id in game_state.get_entities_at_position(*cell):
                 # Don't let a factory consume itself (though it shouldn't match input_unit usually)
-                if unit_id == factory_id:
+                if factory_id == unit_id:
                     continue
 
-                factory = factory_components[Factory]
-                factory_pos = factory_components[Position]
+                factory_components = game_state.entities[factory_id]
+                factory = factory_components.get(Factory)
+                if not factory:
+                    continue
                 factory_player = factory_components.get(Player)
 
                 # Check player ownership compatibility (can only use own factories)
                 if unit_player and factory_player and unit_player.player_id != factory_player.player_id:
                     continue
 
-                # Check Position Overlap
-                # Using simple integer grid comparison as movement snaps to grid or close enough
-                if int(unit_pos.x) == int(factory_pos.x) and int(unit_pos.y) == int(factory_pos.y):
+                # Check Input Type Match
+                if unit_identity.name == factory.input_unit:
 
-                    # Check Input Type Match
-                    if unit_identity.name == factory.input_unit:
+                    # Check Campaign Unlock
+                    if self.campaign_manager.is_unit_unlocked(factory.output_unit):
+                        self._transform_unit(game_state, unit_id, unit_player, factory, factory_components[Position])
+                        break  # Consumed unit, stop checking factories for this unit
+                    # Optional: Feedback that tech is not unlocked
+
+    def _sync_factory_zones(self, game_state) -> None:
+        """Registers the tiles of new factories as "factory" trigger zones and drops those of removed ones."""
+        if game_state is not self._zones_state:
+            self._factory_cells = {}
+            self._zones_state = game_state
+
+        factory_ids = game_state.get_entities_with_component(Factory)
+        if factory_ids == self._factory_cells.keys():
+            return
 
-                        # Check Campaign Unlock
-                        if self.campaign_manager.is_unit_unlocked(factory.output_unit):
-                            self._transform_unit(game_state, unit_id, unit_player, factory, factory_pos)
-                            break  # Consumed unit, stop checking factories for this unit
-                        # Optional: Feedback that tech is not unlocked
+        for factory_id in self._factory_cells.keys() - factory_ids:
+            game_state.remove_trigger(*self._factory_cells.pop(factory_id), "factory")
+        for factory_id in factory_ids - self._factory_cells.keys():
+            position = game_state.get_component(factory_id, Position)
+            if position:
+                # Factories never move
+                cell = (int(position.x), int(position.y))
+                self._factory_cells[factory_id] = cell
+                game_state.add_trigger(*cell, "factory")
 
     def _transform_unit(
         self, game_state, input_unit_id, input_player, factory, position
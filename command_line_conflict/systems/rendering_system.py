@@ -1,12 +1,11 @@
 import functools
 from typing import cast
 
+import numpy as np
 import pygame
 
 from .. import config
 from ..camera import Camera
-from ..components.confetti import Confetti
-from ..components.dead import Dead
 from ..components.health import Health
 from ..components.movable import Movable
 from ..components.position import Position
@@ -14,14 +13,26 @@ from ..components.renderable import Renderable
 from ..components.selectable import Selectable
 from ..game_state import GameState
 from ..logger import log
+from ..utils.glyph_atlas import GlyphAtlas
+from ..visibility import VisibilityGrid
 
 
 class RenderingSystem:
     """Handles rendering all entities and UI elements to the screen.
 
-    Optimized to use spatial hashing for performance.
+    Optimized to use spatial hashing for performance. Entity glyphs come from
+    a GlyphAtlas and are drawn in a single Surface.blits call per frame;
+    health bars and movement orders are drawn on top afterwards.
+
+    When drawn for a viewing player, one lookup in its visibility grid per
+    tile culls what the fog would cover anyway: nothing is drawn on HIDDEN
+    cells, and only stationary entities such as buildings and scrap, the
+    "last seen" state of the cell, are drawn on EXPLORED ones.
     """
 
+    SCRAP_ICON = "$"
+    SCRAP_COLOR = (255, 215, 0)
+    CONFETTI_ICON = "*"
     # Pre-defined colors for confetti to avoid allocation per frame
     CONFETTI_COLORS = [
         (255, 0, 0),
@@ -42,6 +53,13 @@ class RenderingSystem:
         self.screen = screen
         self.font = font
         self.camera = camera
+        self._alpha = 1.0
+        self._visibility: VisibilityGrid | None = None
+        self.glyph_atlas = GlyphAtlas(font)
+        # Filled by _draw_tile during draw(), then flushed in order.
+        self._glyph_blits: list[tuple[pygame.Surface, tuple[float, float], pygame.Rect]] = []
+        self._health_bars: list[tuple[float, float, Health]] = []
+        self._orders: list[dict] = []
         log.debug("RenderingSystem initialized")
 
     @functools.lru_cache(maxsize=1024)
@@ -52,12 +70,23 @@ class RenderingSystem:
             s = pygame.transform.scale(s, (size, size))
         return cast(pygame.Surface, s)
 
-    def draw(self, game_state: GameState, paused: bool) -> None:
+    def draw(self, game_state: GameState, paused: bool, alpha: float = 1.0, viewer_id: int | None = None) -> None:
         """Draws all renderable entities to the screen.
 
         This method iterates through visible entities using the spatial map,
         drawing them based on their position and state.
+
+        Args:
+            game_state: The current state of the game.
+            paused: Whether the game is paused (entities are greyed out).
+            alpha: How far the frame is between the previous and the current
+                simulation tick. Entities that moved during the tick are drawn
+                at their interpolated position.
+            viewer_id: The player whose view is drawn; entities under its
+                fog are culled. None draws everything.
         """
+        self._alpha = alpha
+        self._visibility = game_state.get_visibility(viewer_id) if viewer_id is not None else None
         screen_width = self.screen.get_width()
         screen_height = self.screen.get_height()
         tile_size = config.GRID_SIZE * self.camera.zoom
@@ -67,10 +96,23 @@ class RenderingSystem:
         end_x = int(self.camera.x + screen_width / tile_size) + 2
         start_y = int(self.camera.y) - 1
         end_y = int(self.camera.y + screen_height / tile_size) + 2
+        if self._visibility is not None:
+            # Nothing outside the map can be seen
+            start_x = max(start_x, 0)
+            start_y = max(start_y, 0)
+            end_x = min(end_x, self._visibility.width)
+            end_y = min(end_y, self._visibility.height)
 
         # Pre-calculate common values
         grid_size = int(tile_size)
         bar_height = max(4, int(grid_size * 0.2))
+        self._glyph_blits.clear()
+        self._health_bars.clear()
+        self._orders.clear()
+
+        # Scrap lies on the ground, under the entities
+        if game_state.scrap:
+            self._queue_scrap(game_state, paused, start_x, end_x, start_y, end_y, grid_size)
 
         # Optimization: Hybrid iteration
         # If the map is sparse (number of populated tiles < visible tiles),
@@ -102,23 +144,44 @@ class RenderingSystem:
 
             # Iterate through visible keys
             for y, x in visible_keys:
-                self._draw_tile(x, y, game_state, paused, grid_size, bar_height)
+                self._draw_tile(x, y, game_state, paused, grid_size)
         else:
             # Fallback to grid iteration for dense maps or zoomed out views
             for y in range(start_y, end_y):
                 for x in range(start_x, end_x):
                     # Only process if tile has entities
                     if (x, y) in game_state.spatial_map:
-                        self._draw_tile(x, y, game_state, paused, grid_size, bar_height)
-
-    def _draw_tile(self, x: int, y: int, game_state: GameState, paused: bool, grid_size: int, bar_height: int) -> None:
-        """Draws entities at a specific tile coordinate."""
+                        self._draw_tile(x, y, game_state, paused, grid_size)
+
+        self._queue_particles(game_state, start_x, end_x, start_y, end_y, grid_size)
+
+        # Optimization: one C-level call draws every glyph of the frame.
+        if self._glyph_blits:
+            self.screen.blits(self._glyph_blits, doreturn=False)
+        # Bars sit above their tile, so drawing them after every glyph keeps
+        # them on top of the row above, as before.
+        for cam_x, cam_y, health in self._health_bars:
+            self._draw_health_bar(cam_x, cam_y, grid_size, bar_height, health)
+        for components in self._orders:
+            self.draw_orders(components)
+
+    def _draw_tile(self, x: int, y: int, game_state: GameState, paused: bool, grid_size: int) -> None:
+        """Queues the glyphs, health bars and orders of the entities on a tile."""
         entity_ids = game_state.spatial_map.get((x, y))
         if not entity_ids:
             return
 
-        cam_x = (x - self.camera.x) * config.GRID_SIZE * self.camera.zoom
-        cam_y = (y - self.camera.y) * config.GRID_SIZE * self.camera.zoom
+        tile_cam_x = (x - self.camera.x) * config.GRID_SIZE * self.camera.zoom
+        tile_cam_y = (y - self.camera.y) * config.GRID_SIZE * self.camera.zoom
+        previous_positions = game_state.previous_positions if self._alpha < 1.0 else None
+        last_seen_only = False
+        if self._visibility is not None:
+            state = self._visibility.grid[y, x]
+            if state == VisibilityGrid.HIDDEN:
+                return
+            last_seen_only = state == VisibilityGrid.EXPLORED
+        glyph = self.glyph_atlas.get
+        glyph_blits = self._glyph_blits
 
         for entity_id in entity_ids:
             components = game_state.entities.get(entity_id)
@@ -129,39 +192,99 @@ class RenderingSystem:
             if not renderable:
                 continue
 
-            confetti = components.get(Confetti)
-            if confetti:
-                color = self.CONFETTI_COLORS[entity_id % len(self.CONFETTI_COLORS)]
-                ch = self._get_rendered_surface(renderable.icon, color, grid_size)
-                self.screen.blit(ch, (cam_x, cam_y))
+            if last_seen_only and Movable in components:
                 continue
 
-            dead = components.get(Dead)
-            if dead:
-                color = (128, 128, 128)
-            elif paused:
+            cam_x, cam_y = tile_cam_x, tile_cam_y
+            if previous_positions:
+                previous = previous_positions.get(entity_id)
+                if previous:
+                    cam_x, cam_y = self._interpolated_tile_origin(components[Position], previous)
+
+            if paused:
                 color = (128, 128, 128)
             else:
                 color = renderable.color
                 selectable = components.get(Selectable)
                 if selectable and selectable.is_selected:
                     color = (0, 255, 0)
-                    shadow_ch = self._get_rendered_surface(renderable.icon, (128, 128, 128), grid_size)
-                    self.screen.blit(shadow_ch, (cam_x + 2, cam_y + 2))
+                    page, area = glyph(renderable.icon, (128, 128, 128), grid_size)
+                    glyph_blits.append((page, (cam_x + 2, cam_y + 2), area))
 
-            ch = self._get_rendered_surface(renderable.icon, color, grid_size)
-            self.screen.blit(ch, (cam_x, cam_y))
+            page, area = glyph(renderable.icon, color, grid_size)
+            glyph_blits.append((page, (cam_x, cam_y), area))
+            if last_seen_only:
+                # Health and orders of what is under fog are unknown
+                continue
 
             health = components.get(Health)
-            if not dead and health and health.max_hp > 0:
-                self._draw_health_bar(cam_x, cam_y, grid_size, bar_height, health)
+            if health and health.max_hp > 0:
+                self._health_bars.append((cam_x, cam_y, health))
 
             selectable = components.get(Selectable)
-            if not dead:
-                if selectable and selectable.is_selected:
-                    self.draw_orders(components)
-                elif config.DEBUG:
-                    self.draw_orders(components)
+            if selectable and selectable.is_selected:
+                self._orders.append(components)
+            elif config.DEBUG:
+                self._orders.append(components)
+
+    def _queue_scrap(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, game_state: GameState, paused: bool, start_x: int, end_x: int, start_y: int, end_y: int, grid_size: int
+    ) -> None:
+        """Queues the glyphs of the scrap piles on seen or explored tiles of the view window."""
+        page, area = self.glyph_atlas.get(self.SCRAP_ICON, (128, 128, 128) if paused else self.SCRAP_COLOR, grid_size)
+        tile_size = config.GRID_SIZE * self.camera.zoom
+        visibility = self._visibility
+        scrap = game_state.scrap
+        # Optimization: walk whichever is smaller, the piles or the view
+        # window's cells, so a map littered with scrap costs O(view) per frame.
+        if len(scrap) > (end_x - start_x) * (end_y - start_y):
+            cells = ((x, y) for y in range(start_y, end_y) for x in range(start_x, end_x) if (x, y) in scrap)
+        else:
+            cells = ((x, y) for x, y in scrap if start_x <= x < end_x and start_y <= y < end_y)
+        for x, y in cells:
+            if visibility is not None and visibility.grid[y, x] == VisibilityGrid.HIDDEN:
+                continue
+            self._glyph_blits.append((page, ((x - self.camera.x) * tile_size, (y - self.camera.y) * tile_size), area))
+
+    def _queue_particles(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, game_state: GameState, start_x: int, end_x: int, start_y: int, end_y: int, grid_size: int
+    ) -> None:
+        """Queues the glyphs of the particles on visible tiles of the view window."""
+        particles = game_state.particles
+        n = particles.count
+        if not n:
+            return
+
+        # Optimization: cull the whole particle array at once
+        cells_x = particles.x[:n].astype(int)
+        cells_y = particles.y[:n].astype(int)
+        shown = (cells_x >= start_x) & (cells_x < end_x) & (cells_y >= start_y) & (cells_y < end_y)
+        if self._visibility is not None:
+            # The view window is clamped to the map, so the lookups are in bounds
+            in_view = np.flatnonzero(shown)
+            shown[in_view] = self._visibility.grid[cells_y[in_view], cells_x[in_view]] == VisibilityGrid.VISIBLE
+
+        tile_size = config.GRID_SIZE * self.camera.zoom
+        colors = self.CONFETTI_COLORS
+        for i in np.flatnonzero(shown).tolist():
+            page, area = self.glyph_atlas.get(self.CONFETTI_ICON, colors[particles.color[i] % len(colors)], grid_size)
+            cam_x = (cells_x[i] - self.camera.x) * tile_size
+            cam_y = (cells_y[i] - self.camera.y) * tile_size
+            self._glyph_blits.append((page, (cam_x, cam_y), area))
+
+    def _interpolated_tile_origin(self, position: Position, previous: tuple[float, float]) -> tuple[float, float]:
+        """Returns the screen position of the tile an entity occupies at self._alpha.
+
+        Entities stay snapped to the grid; interpolation only decides when
+        they are shown crossing into the next tile.
+        """
+        prev_x, prev_y = previous
+        x = int(prev_x + (position.x - prev_x) * self._alpha)
+        y = int(prev_y + (position.y - prev_y) * self._alpha)
+        return (
+            (x - self.camera.x) * config.GRID_SIZE * self.camera.zoom,
+            (y - self.camera.y) * config.GRID_SIZE * self.camera.zoom,
+        )
 
     def _draw_health_bar(self, x: float, y: float, width: int, height: int, health: Health) -> None:
         """Draws a health bar for an entity."""
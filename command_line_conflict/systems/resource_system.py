@@ -1,13 +1,11 @@
-from ..components.dead import Dead
 from ..components.player import Player
-from ..components.position import Position
-from ..components.resource_deposit import ResourceDeposit
 from ..game_state import GameState
 from ..logger import log
+from ..triggers import TriggerZones
 
 
 class ResourceSystem:
-    """System that handles resource collection/harvesting from scrap entities.
+    """System that handles resource collection/harvesting from scrap piles.
 
     DESIGN NOTE (2026-07-04) — the scrap economy currently has exactly one
     income source: wildlife drops 50 scrap on death (HealthSystem), and any
@@ -27,62 +25,45 @@ class ResourceSystem:
     """
 
     def update(self, game_state: GameState, dt: float) -> None:
-        """Checks for player units overlapping with scrap deposits and harvests them.
+        """Harvests the scrap piles that player units stepped onto.
 
         Args:
             game_state: The current state of the game.
             dt: Delta time (unused but required by interface).
         """
-        # Find all entities with ResourceDeposit component
-        scrap_entities = list(game_state.get_entities_with_component(ResourceDeposit))
-
-        for scrap_id in scrap_entities:
-            components = game_state.entities.get(scrap_id)
+        # Optimization: every pile is a trigger zone, so the cost depends on
+        # the units that stepped onto one, not on the number of piles.
+        for kind, ent_id, cell in game_state.pop_trigger_events("scrap"):
+            if kind != TriggerZones.ENTER or cell not in game_state.scrap:
+                continue  # Already harvested
+            components = game_state.entities.get(ent_id)
             if not components:
                 continue
 
-            deposit = components.get(ResourceDeposit)
-            pos = components.get(Position)
-            if not deposit or not pos:
-                continue
-
-            # Find who is at this integer position
-            cell_entities = game_state.get_entities_at_position(int(pos.x), int(pos.y))
-            for ent_id in cell_entities:
-                if ent_id == scrap_id:
-                    continue
-
-                # Must not be dead
-                if game_state.get_component(ent_id, Dead):
-                    continue
-
-                player = game_state.get_component(ent_id, Player)
-                # Player units only, excluding neutral (player_id = 0)
-                if player and player.player_id != 0:
-                    player_id = player.player_id
-                    current_resources = game_state.resources.get(player_id, 0)
-                    game_state.resources[player_id] = current_resources + deposit.amount
-
-                    log.info(
-                        f"Player {player_id} harvested {deposit.amount} resources from scrap {scrap_id} "
-                        f"(New total: {game_state.resources[player_id]})"
-                    )
+            player = components.get(Player)
+            # Player units only, excluding neutral (player_id = 0)
+            if player and player.player_id != 0:
+                player_id = player.player_id
+                amount = game_state.take_scrap(*cell)
+                current_resources = game_state.resources.get(player_id, 0)
+                game_state.resources[player_id] = current_resources + amount
 
-                    # Trigger visual floating text event
-                    game_state.add_event(
-                        {
-                            "type": "visual_effect",
-                            "subtype": "floating_text",
-                            "x": pos.x,
-                            "y": pos.y,
-                            "text": f"+{deposit.amount} Scrap",
-                            "color": (255, 215, 0),  # Gold color
-                        }
-                    )
+                log.info(
+                    f"Player {player_id} harvested {amount} resources from scrap at {cell} "
+                    f"(New total: {game_state.resources[player_id]})"
+                )
 
-                    # Trigger sound event
-                    game_state.add_event({"type": "sound", "data": {"name": "spawn_unit"}})
+                # Trigger visual floating text event
+                game_state.add_event(
+                    {
+                        "type": "visual_effect",
+                        "subtype": "floating_text",
+                        "x": cell[0],
+                        "y": cell[1],
+                        "text": f"+{amount} Scrap",
+                        "color": (255, 215, 0),  # Gold color
+                    }
+                )
 
-                    # Remove the scrap entity from the game
-                    game_state.remove_entity(scrap_id)
-                    break  # Consumed this scrap pile
+                # Trigger sound event
+                game_state.add_event({"type": "sound", "data": {"name": "spawn_unit"}})
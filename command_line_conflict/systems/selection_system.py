@@ -1,5 +1,4 @@
 from ..components.player import Player
-from ..components.position import Position
 from ..components.selectable import Selectable
 from ..game_state import GameState
 from ..logger import log
@@ -17,14 +16,11 @@ class SelectionSystem:
             game_state: The current state of the game.
         """
         count = 0
-        # Optimization: Iterate only Selectable entities
-        for entity_id in game_state.get_entities_with_component(Selectable):
-            components = game_state.entities.get(entity_id)
-            if not components:
-                continue
-
-            selectable = components.get(Selectable)
-            if selectable and selectable.is_selected:
+        # Optimization: only the selected entities are visited, through the
+        # selected set GameState keeps, not every Selectable.
+        for entity_id in list(game_state.get_selected_entities()):
+            selectable = game_state.get_component(entity_id, Selectable)
+            if selectable:
                 selectable.is_selected = False
                 count += 1
 
@@ -58,43 +54,32 @@ class SelectionSystem:
 
         x1, y1 = grid_start
         x2, y2 = grid_end
-        sx, ex = sorted((x1, x2))
-        sy, ey = sorted((y1, y2))
 
-        # Optimization: Iterate only Selectable entities instead of all entities
-        for entity_id in game_state.get_entities_with_component(Selectable):
+        # Optimization: the rectangle is looked up in the spatial map and
+        # the deselection walks the selected set, so a drag costs the units
+        # in the box plus those already selected, not every Selectable.
+        in_rect = set()
+        for entity_id in game_state.get_entities_in_rect(x1, y1, x2, y2):
             components = game_state.entities.get(entity_id)
             if not components:
                 continue
 
-            selectable = components.get(Selectable)
             player = components.get(Player)
-
             # Check if the unit belongs to the current player
-            if not selectable or not player or player.player_id != current_player_id:
-                continue
-
-            position = components.get(Position)
-            if not position:
-                continue
+            if components.get(Selectable) and player and player.player_id == current_player_id:
+                in_rect.add(entity_id)
 
-            ux = int(position.x)
-            uy = int(position.y)
-            if sx <= ux <= ex and sy <= uy <= ey:
-                selectable.is_selected = True
-            elif not shift_pressed:
-                selectable.is_selected = False
+        if not shift_pressed:
+            for entity_id in list(game_state.get_selected_entities()):
+                if entity_id not in in_rect and self._owned_by(game_state, entity_id, current_player_id):
+                    game_state.get_component(entity_id, Selectable).is_selected = False
 
-        selected_count = 0
-        for entity_id in game_state.get_entities_with_component(Selectable):
-            components = game_state.entities.get(entity_id)
-            if not components:
-                continue
+        for entity_id in in_rect:
+            game_state.get_component(entity_id, Selectable).is_selected = True
 
-            selectable = components.get(Selectable)
-            player = components.get(Player)
-            if selectable and selectable.is_selected and player and player.player_id == current_player_id:
-                selected_count += 1
+        selected_count = sum(
+            1 for entity_id in game_state.get_selected_entities() if self._owned_by(game_state, entity_id, current_player_id)
+        )
 
         if selected_count > 0:
             log.debug(f"Drag selection complete. Total selected: {selected_count}")
@@ -147,18 +132,72 @@ class SelectionSystem:
                     if selectable.is_selected:
                         game_state.add_event({"type": "sound", "data": {"name": "click_select"}})
             else:
-                # Optimization: Iterate only Selectable entities
-                for entity_id in game_state.get_entities_with_component(Selectable):
-                    components = game_state.entities.get(entity_id)
-                    if not components:
-                        continue
-
-                    selectable = components.get(Selectable)
-                    # Deselect other units unless they are the one clicked
-                    if selectable:
-                        selectable.is_selected = entity_id == clicked_entity_id
+                # Deselect other units unless they are the one clicked
+                for entity_id in list(game_state.get_selected_entities()):
+                    if entity_id != clicked_entity_id:
+                        game_state.get_component(entity_id, Selectable).is_selected = False
+                game_state.get_component(clicked_entity_id, Selectable).is_selected = True
                 log.debug(f"Selected unit {clicked_entity_id}")
                 game_state.add_event({"type": "sound", "data": {"name": "click_select"}})
         elif not shift_pressed:
             log.debug("Clicked on empty space, clearing selection")
             self.clear_selection(game_state)
+
+    def assign_control_group(self, game_state: GameState, group: int, current_player_id: int = 1) -> None:
+        """Stores the current player's selected units as a numbered control group.
+
+        Args:
+            game_state: The current state of the game.
+            group: The control group number.
+            current_player_id: The ID of the player currently controlling the game.
+        """
+        members = {
+            entity_id
+            for entity_id in game_state.get_selected_entities()
+            if self._owned_by(game_state, entity_id, current_player_id)
+        }
+        game_state.control_groups[(current_player_id, group)] = members
+        log.debug(f"Assigned {len(members)} units to control group {group}")
+
+    def recall_control_group(
+        self,
+        game_state: GameState,
+        group: int,
+        shift_pressed: bool = False,
+        current_player_id: int = 1,
+    ) -> None:
+        """Selects the units of a numbered control group.
+
+        Units of the group that died are dropped from it. An unassigned
+        group leaves the selection untouched.
+
+        Args:
+            game_state: The current state of the game.
+            group: The control group number.
+            shift_pressed: True to add the group to the selection instead of
+                replacing it.
+            current_player_id: The ID of the player currently controlling the game.
+        """
+        members = game_state.control_groups.get((current_player_id, group))
+        if members is None:
+            return
+
+        # Optimization: groups are entity sets, so a recall costs the group
+        # plus the previous selection whatever the size of the map.
+        members.intersection_update(game_state.entities)
+        if not shift_pressed:
+            for entity_id in list(game_state.get_selected_entities()):
+                if entity_id not in members:
+                    game_state.get_component(entity_id, Selectable).is_selected = False
+
+        for entity_id in members:
+            selectable = game_state.get_component(entity_id, Selectable)
+            if selectable:
+                selectable.is_selected = True
+        log.debug(f"Recalled control group {group}: {len(members)} units")
+
+    @staticmethod
+    def _owned_by(game_state: GameState, entity_id: int, player_id: int) -> bool:
+        """Returns whether an entity belongs to a player."""
+        player = game_state.get_component(entity_id, Player)
+        return bool(player) and player.player_id == player_id
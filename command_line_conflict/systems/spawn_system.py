@@ -14,7 +14,6 @@ class SpawnSystem:
             spawn_interval: Time in seconds between spawns.
         """
         self.spawn_interval = spawn_interval
-        self.time_since_last_spawn = 0.0
 
     def update(self, game_state: GameState, dt: float) -> None:
         """Processes spawning logic.
@@ -23,11 +22,12 @@ class SpawnSystem:
             game_state: The current state of the game.
             dt: The time elapsed since the last frame.
         """
-        self.time_since_last_spawn += dt
-
-        if self.time_since_last_spawn >= self.spawn_interval:
+        timers = game_state.timers
+        if timers.pop("spawn"):
             self.spawn_wildlife(game_state)
-            self.time_since_last_spawn = 0.0
+            timers.schedule(self.spawn_interval, "spawn", self)
+        elif self not in timers.scheduled("spawn"):
+            timers.schedule(self.spawn_interval, "spawn", self)
 
     def spawn_wildlife(self, game_state: GameState) -> None:
         """Spawns a wildlife unit at a random valid location."""
@@ -1,21 +1,22 @@
 import functools
 
+import numpy as np
 import pygame
 
 from command_line_conflict import config
 from command_line_conflict.camera import Camera
 from command_line_conflict.components.attack import Attack
-from command_line_conflict.components.dead import Dead
 from command_line_conflict.components.detection import Detection
 from command_line_conflict.components.health import Health
 from command_line_conflict.components.player import Player
 from command_line_conflict.components.position import Position
 from command_line_conflict.components.renderable import Renderable
-from command_line_conflict.components.resource_deposit import ResourceDeposit
-from command_line_conflict.components.selectable import Selectable
 from command_line_conflict.components.unit_identity import UnitIdentity
 from command_line_conflict.game_state import GameState
 from command_line_conflict.logger import log
+from command_line_conflict.utils.dirty_areas import DirtyAreas
+from command_line_conflict.utils.effect_pool import EffectPool
+from command_line_conflict.visibility import VisibilityGrid
 
 
 class UISystem:
@@ -56,13 +57,17 @@ class UISystem:
         self.pause_overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
         self.pause_overlay.fill((0, 0, 0, 150))
 
-        # List of active click effects (ripples)
-        # Each effect is a dict: {x, y, time, color, duration}
-        self.click_effects: list[dict] = []
+        # Active click effects (ripples); each slot's data is its color
+        self.click_effects = EffectPool(config.MAX_CLICK_EFFECTS, 500)
 
-        # List of active floating texts
-        # Each item is a dict: {x, y, text, color, start_time, duration}
-        self.floating_texts: list[dict] = []
+        # Active floating texts; each slot's data is (text, color, surface)
+        self.floating_texts = EffectPool(config.MAX_FLOATING_TEXTS, 1000)
+        # The effect areas drawn last frame, see draw()
+        self._dirty_areas = DirtyAreas()
+
+        # Detection/attack range overlays of the current selection, per kind:
+        # (key, overlay, tile mask, top-left tile)
+        self._range_overlays: dict[str, tuple] = {}
 
         log.debug("UISystem initialized")
 
@@ -137,13 +142,18 @@ class UISystem:
         # Border (Black)
         pygame.draw.rect(self.screen, (0, 0, 0), (x, y, width, height), 1)
 
-    def draw(self, game_state: GameState, paused: bool, current_player_id: int = 1) -> None:
+    def draw(self, game_state: GameState, paused: bool, current_player_id: int = 1) -> list[pygame.Rect]:
         """Draws the main UI, including selected unit info and key options.
 
         Args:
             game_state: The current state of the game.
             paused: Whether the game is paused.
             current_player_id: The ID of the player currently controlling the game.
+
+        Returns:
+            The screen areas of the click effects and floating texts that
+            changed since the previous draw. The rest of the UI only changes
+            with the game state.
         """
         self._draw_key_options()
         self._draw_player_indicator(current_player_id)
@@ -177,12 +187,14 @@ class UISystem:
             self._draw_aggregate_detection_range(game_state, selected_entities)
             self._draw_aggregate_attack_range(game_state, selected_entities)
 
-        self._draw_click_effects()
-        self._draw_floating_texts()
+        effect_rects = self._draw_click_effects() + self._draw_floating_texts()
 
         if paused:
             self._draw_paused_message()
 
+        # Live effects animate every frame.
+        return self._dirty_areas.track("effects", pygame.time.get_ticks() if effect_rects else None, effect_rects)
+
     def add_click_effect(self, grid_x: int, grid_y: int, color: tuple[int, int, int] = (0, 255, 0)) -> None:
         """Adds a visual click effect at the specified grid coordinates.
 
@@ -191,98 +203,97 @@ class UISystem:
             grid_y: The Y coordinate on the grid.
             color: The RGB color of the effect.
         """
-        self.click_effects.append(
-            {
-                "x": grid_x,
-                "y": grid_y,
-                "time": pygame.time.get_ticks(),
-                "color": color,
-                "duration": 500,  # ms
-            }
-        )
+        self.click_effects.spawn(grid_x, grid_y, pygame.time.get_ticks(), color)
 
     def add_floating_text(
-        self, grid_x: float, grid_y: float, text: str, color: tuple[int, int, int] = (255, 255, 255)
+        self,
+        grid_x: float,
+        grid_y: float,
+        text: str,
+        color: tuple[int, int, int] = (255, 255, 255),
+        target_id: int | None = None,
     ) -> None:
         """Adds a floating text effect at the specified grid coordinates.
 
+        Numeric texts for the same target and color that arrive within
+        DAMAGE_NUMBER_COALESCE_MS are merged into one number showing their
+        sum.
+
         Args:
             grid_x: The X coordinate on the grid.
             grid_y: The Y coordinate on the grid.
             text: The text to display.
             color: The RGB color of the text.
+            target_id: The entity the text is about, e.g. the one taking
+                damage.
         """
-        self.floating_texts.append(
-            {
-                "x": grid_x,
-                "y": grid_y,
-                "text": text,
-                "color": color,
-                "start_time": pygame.time.get_ticks(),
-                "duration": 1000,  # ms
-            }
-        )
-
-    def _draw_floating_texts(self) -> None:
-        """Draws and updates active floating texts."""
-        current_time = pygame.time.get_ticks()
-        # Filter out expired texts
-        self.floating_texts = [t for t in self.floating_texts if current_time - t["start_time"] < t["duration"]]
-
-        for item in self.floating_texts:
-            elapsed = current_time - item["start_time"]
-            progress = elapsed / item["duration"]
-
-            # Calculate screen position
-            cam_x = ((item["x"] - self.camera.x) * config.GRID_SIZE * self.camera.zoom) + (
-                config.GRID_SIZE * self.camera.zoom / 2
-            )
-            cam_y = ((item["y"] - self.camera.y) * config.GRID_SIZE * self.camera.zoom) + (
-                config.GRID_SIZE * self.camera.zoom / 2
-            )
-
-            # Float up
-            # Float distance in pixels
-            float_dist = 30 * progress
-            cam_y -= float_dist
-
-            # Draw text
-            text_surf = self._get_text_surface(item["text"], item["color"], "small")
-
-            # Center the text
-            rect = text_surf.get_rect(center=(int(cam_x), int(cam_y)))
-            self.screen.blit(text_surf, rect)
+        now = pygame.time.get_ticks()
+        key = None
+        if target_id is not None and text.isdigit():
+            key = (target_id, color)
+            slot = self.floating_texts.find(key)
+            if slot is not None and now - self.floating_texts.start_time[slot] < config.DAMAGE_NUMBER_COALESCE_MS:
+                text = str(int(self.floating_texts.data[slot][0]) + int(text))
+                self.floating_texts.data[slot] = (text, color, self._get_text_surface(text, color, "small"))
+                return
+
+        # The surface is rendered once here, not on every frame it is drawn
+        self.floating_texts.spawn(grid_x, grid_y, now, (text, color, self._get_text_surface(text, color, "small")), key)
+
+    def _draw_floating_texts(self) -> list[pygame.Rect]:
+        """Draws and updates active floating texts.
 
-    def _draw_click_effects(self) -> None:
-        """Draws and updates active click effects (ripples)."""
+        Returns:
+            The screen areas of the texts drawn.
+        """
         current_time = pygame.time.get_ticks()
-        # Filter out expired effects
-        self.click_effects = [e for e in self.click_effects if current_time - e["time"] < e["duration"]]
+        slots = self.floating_texts.expire(current_time)
+        if not slots.size:
+            return []
+
+        # Screen positions of every text at once, floating up 30 pixels over
+        # their lifetime
+        tile_size = config.GRID_SIZE * self.camera.zoom
+        progress = self.floating_texts.progress(slots, current_time)
+        cam_xs = (self.floating_texts.x[slots] - self.camera.x) * tile_size + tile_size / 2
+        cam_ys = (self.floating_texts.y[slots] - self.camera.y) * tile_size + tile_size / 2 - 30 * progress
+
+        data = self.floating_texts.data
+        blits = []
+        for slot, cam_x, cam_y in zip(slots.tolist(), cam_xs.tolist(), cam_ys.tolist()):
+            text_surf = data[slot][2]
+            # Center the text
+            blits.append((text_surf, text_surf.get_rect(center=(int(cam_x), int(cam_y)))))
+        self.screen.blits(blits, doreturn=False)
+        return [rect for _, rect in blits]
 
-        for effect in self.click_effects:
-            elapsed = current_time - effect["time"]
-            progress = elapsed / effect["duration"]
+    def _draw_click_effects(self) -> list[pygame.Rect]:
+        """Draws and updates active click effects (ripples).
 
-            # Calculate screen position
-            cam_x = ((effect["x"] - self.camera.x) * config.GRID_SIZE * self.camera.zoom) + (
-                config.GRID_SIZE * self.camera.zoom / 2
-            )
-            cam_y = ((effect["y"] - self.camera.y) * config.GRID_SIZE * self.camera.zoom) + (
-                config.GRID_SIZE * self.camera.zoom / 2
+        Returns:
+            The screen areas of the ripples drawn.
+        """
+        current_time = pygame.time.get_ticks()
+        slots = self.click_effects.expire(current_time)
+        if not slots.size:
+            return []
+
+        tile_size = config.GRID_SIZE * self.camera.zoom
+        progress = self.click_effects.progress(slots, current_time)
+        cam_xs = (self.click_effects.x[slots] - self.camera.x) * tile_size + tile_size / 2
+        cam_ys = (self.click_effects.y[slots] - self.camera.y) * tile_size + tile_size / 2
+        # Draw expanding ring, thinning as it grows
+        radii = np.maximum(1, (tile_size * progress).astype(int))
+        widths = np.maximum(1, (3 * (1 - progress)).astype(int))
+
+        rects = []
+        for slot, cam_x, cam_y, radius, width in zip(
+            slots.tolist(), cam_xs.tolist(), cam_ys.tolist(), radii.tolist(), widths.tolist()
+        ):
+            rects.append(
+                pygame.draw.circle(self.screen, self.click_effects.data[slot], (int(cam_x), int(cam_y)), radius, width)
             )
-
-            # Draw expanding ring
-            max_radius = config.GRID_SIZE * self.camera.zoom
-            radius = max(1, int(max_radius * progress))
-
-            # Fade out alpha (simulated by not drawing if too faint,
-            # or we could use a surface, but circles are cheap.
-            # Pygame's draw.circle doesn't support alpha directly on main screen
-            # unless we blit a surface. For simplicity, just draw.
-            # Maybe width decreases?
-            width = max(1, int(3 * (1 - progress)))
-
-            pygame.draw.circle(self.screen, effect["color"], (int(cam_x), int(cam_y)), radius, width)
+        return rects
 
     def _draw_player_indicator(self, current_player_id: int) -> None:
         """Draws a visual indicator for the current player.
@@ -316,16 +327,9 @@ class UISystem:
         Returns:
             A list of entity IDs for all selected entities.
         """
-        selected_entities = []
-        # Optimization: Use component index instead of iterating all entities (O(K) vs O(N))
-        for entity_id in game_state.get_entities_with_component(Selectable):
-            components = game_state.entities.get(entity_id)
-            if not components:
-                continue
-            selectable = components.get(Selectable)
-            if selectable and selectable.is_selected:
-                selected_entities.append(entity_id)
-        return selected_entities
+        # Optimization: GameState keeps the selected set, so nothing has to
+        # scan the Selectable entities. Sorted for a stable panel order.
+        return sorted(game_state.get_selected_entities())
 
     def _draw_single_unit_info(self, game_state: GameState, entity_id: int, current_player_id: int = 1) -> None:
         """Draws the detailed information panel for a single selected unit.
@@ -411,14 +415,7 @@ class UISystem:
                                 continue
                             c_ident = game_state.get_component(ceid, UnitIdentity)
                             c_plyr = game_state.get_component(ceid, Player)
-                            c_dead = game_state.get_component(ceid, Dead)
-                            if (
-                                c_ident
-                                and c_ident.name == "rover"
-                                and c_plyr
-                                and c_plyr.player_id == current_player_id
-                                and not c_dead
-                            ):
+                            if c_ident and c_ident.name == "rover" and c_plyr and c_plyr.player_id == current_player_id:
                                 has_adj_rover = True
                                 break
                         if has_adj_rover:
@@ -438,18 +435,7 @@ class UISystem:
             if identity.name == "rover_factory":
                 cm = getattr(game_state, "campaign_manager", None)
                 if cm and not cm.is_unit_unlocked("arachnotron"):
-                    # Count chassis
-                    chassis_count = 0
-
-                    for eid in game_state.get_entities_with_component(UnitIdentity):
-                        ent_components = game_state.entities.get(eid)
-                        if not ent_components:
-                            continue
-                        ident = ent_components.get(UnitIdentity)
-                        plyr = ent_components.get(Player)
-                        is_dead = ent_components.get(Dead) is not None
-                        if ident and ident.name == "chassis" and plyr and plyr.player_id == current_player_id and not is_dead:
-                            chassis_count += 1
+                    chassis_count = game_state.count_units(player_id=current_player_id, unit_type="chassis")
 
                     resources = getattr(game_state, "resources", {}).get(current_player_id, 0)
                     req_text = f"T: Research Arachnotron (100 Scrap) [Req: 6 Chassis, Have {chassis_count}]"
@@ -464,59 +450,89 @@ class UISystem:
 
     def _draw_aggregate_detection_range(self, game_state: GameState, entity_ids: list[int]) -> None:
         """Draws a combined detection range for multiple units."""
-        detection_tiles = set()
+        sources = set()
         for entity_id in entity_ids:
             position = game_state.get_component(entity_id, Position)
             detection = game_state.get_component(entity_id, Detection)
             if not position or not detection or detection.detection_range <= 0:
                 continue
-            unit_x, unit_y = int(position.x), int(position.y)
-            for x in range(
-                unit_x - detection.detection_range,
-                unit_x + detection.detection_range + 1,
-            ):
-                for y in range(
-                    unit_y - detection.detection_range,
-                    unit_y + detection.detection_range + 1,
-                ):
-                    dx = x - unit_x
-                    dy = y - unit_y
-                    if dx * dx + dy * dy <= detection.detection_range * detection.detection_range:
-                        detection_tiles.add((x, y))
-
-        # Pre-calculate common values
-        size = int(config.GRID_SIZE * self.camera.zoom)
-        range_surface = self._get_range_surface(size, (0, 0, 255, 30))
-
-        for x, y in detection_tiles:
-            cam_x = (x - self.camera.x) * config.GRID_SIZE * self.camera.zoom
-            cam_y = (y - self.camera.y) * config.GRID_SIZE * self.camera.zoom
-            self.screen.blit(range_surface, (cam_x, cam_y))
+            sources.add((int(position.x), int(position.y), detection.detection_range))
+        self._draw_range_overlay("detection", frozenset(sources), (0, 0, 255, 30))
 
     def _draw_aggregate_attack_range(self, game_state: GameState, entity_ids: list[int]) -> None:
         """Draws a combined attack range for multiple units."""
-        attack_tiles = set()
+        sources = set()
         for entity_id in entity_ids:
             position = game_state.get_component(entity_id, Position)
             attack = game_state.get_component(entity_id, Attack)
             if not position or not attack or attack.attack_range <= 0:
                 continue
-            unit_x, unit_y = int(position.x), int(position.y)
-            for x in range(unit_x - attack.attack_range, unit_x + attack.attack_range + 1):
-                for y in range(unit_y - attack.attack_range, unit_y + attack.attack_range + 1):
-                    dx = x - unit_x
-                    dy = y - unit_y
-                    if dx * dx + dy * dy <= attack.attack_range * attack.attack_range:
-                        attack_tiles.add((x, y))
-
-        # Pre-calculate common values
+            sources.add((int(position.x), int(position.y), attack.attack_range))
+        self._draw_range_overlay("attack", frozenset(sources), (255, 0, 0, 30))
+
+    def _draw_range_overlay(self, kind: str, sources: frozenset[tuple[int, int, int]], color: tuple) -> None:
+        """Draws the union of the circles around (x, y, range) sources as one overlay.
+
+        Optimization: The overlay only depends on the selected units' integer
+        cells and ranges, so it is rebuilt when those change and is otherwise
+        a single camera-offset blit.
+        """
         size = int(config.GRID_SIZE * self.camera.zoom)
-        range_surface = self._get_range_surface(size, (255, 0, 0, 30))
+        if not sources or size <= 0:
+            return
+
+        key = (sources, size, color)
+        cached = self._range_overlays.get(kind)
+        if cached is None or cached[0] != key:
+            cached = (key, *self._build_range_overlay(sources, size, color))
+            self._range_overlays[kind] = cached
+        _, overlay, mask, (left, top) = cached
+
+        if overlay is None:
+            # Too large for a single surface: one square per tile instead
+            range_surface = self._get_range_surface(size, color)
+            for y, x in np.argwhere(mask):
+                cam_x = (left + x - self.camera.x) * config.GRID_SIZE * self.camera.zoom
+                cam_y = (top + y - self.camera.y) * config.GRID_SIZE * self.camera.zoom
+                self.screen.blit(range_surface, (cam_x, cam_y))
+            return
 
-        for x, y in attack_tiles:
-            cam_x = (x - self.camera.x) * config.GRID_SIZE * self.camera.zoom
-            cam_y = (y - self.camera.y) * config.GRID_SIZE * self.camera.zoom
-            self.screen.blit(range_surface, (cam_x, cam_y))
+        cam_x = (left - self.camera.x) * config.GRID_SIZE * self.camera.zoom
+        cam_y = (top - self.camera.y) * config.GRID_SIZE * self.camera.zoom
+        self.screen.blit(overlay, (cam_x, cam_y))
+
+    @staticmethod
+    def _build_range_overlay(
+        sources: frozenset[tuple[int, int, int]], size: int, color: tuple
+    ) -> tuple[pygame.Surface | None, np.ndarray, tuple[int, int]]:
+        """Renders the tiles covered by any source's circle.
+
+        Returns:
+            The overlay (None if it would exceed MAX_STATIC_MAP_LAYER_PIXELS),
+            the covered-tile mask indexed [y][x], and the tile coordinates of
+            their top-left corner.
+        """
+        left = min(x - r for x, _, r in sources)
+        top = min(y - r for _, y, r in sources)
+        width = max(x + r for x, _, r in sources) + 1 - left
+        height = max(y + r for _, y, r in sources) + 1 - top
+
+        mask = np.zeros((height, width), dtype=bool)
+        for x, y, r in sources:
+            mask[y - r - top : y + r + 1 - top, x - r - left : x + r + 1 - left] |= VisibilityGrid.get_mask(r)
+
+        if width * size * height * size > config.MAX_STATIC_MAP_LAYER_PIXELS:
+            return None, mask, (left, top)
+
+        # One pixel per tile, then scaled up without smoothing so each tile
+        # becomes a solid square.
+        tiles = pygame.Surface((width, height), pygame.SRCALPHA)
+        tiles.fill((*color[:3], 0))
+        alpha = pygame.surfarray.pixels_alpha(tiles)
+        alpha[:] = mask.T * np.uint8(color[3])
+        del alpha
+        overlay = pygame.transform.scale(tiles, (width * size, height * size))
+        return overlay, mask, (left, top)
 
     def _draw_unit_health_text(self, game_state: GameState, entity_id: int) -> None:
         """Draws the current health of a unit above its icon.
@@ -658,13 +674,16 @@ class UISystem:
                 self.screen.blit(text, (panel_x_offset, panel_y))
                 panel_y += 18
 
-    def draw_tooltip(self, game_state: GameState, entity_id: int, screen_pos: tuple[int, int]) -> None:
+    def draw_tooltip(self, game_state: GameState, entity_id: int, screen_pos: tuple[int, int]) -> pygame.Rect | None:
         """Draws a tooltip for the hovered entity.
 
         Args:
             game_state: The current state of the game.
             entity_id: The ID of the hovered entity.
             screen_pos: The (x, y) coordinates of the mouse cursor.
+
+        Returns:
+            The screen area of the tooltip, or None if none was drawn.
         """
         components = game_state.entities.get(entity_id, {})
         identity = components.get(UnitIdentity)
@@ -672,7 +691,7 @@ class UISystem:
         player = components.get(Player)
 
         if not identity:
-            return
+            return None
 
         lines = [identity.name.title()]
         if health:
@@ -680,10 +699,27 @@ class UISystem:
         if player:
             lines.append(f"P{player.player_id}" if player.player_id != 0 else "Neutral")
 
-        deposit = components.get(ResourceDeposit)
-        if deposit:
-            lines.append(f"Amount: {deposit.amount}")
+        border_color = (255, 255, 255)
+        if player:
+            border_color = (0, 255, 0) if player.player_id == 1 else (255, 0, 0)
+            if player.player_id == 0:
+                border_color = (150, 150, 150)
+        return self._draw_tooltip_box(lines, border_color, screen_pos)
+
+    def draw_scrap_tooltip(self, amount: int, screen_pos: tuple[int, int]) -> pygame.Rect:
+        """Draws a tooltip for the hovered scrap pile.
+
+        Args:
+            amount: The amount of scrap in the pile.
+            screen_pos: The (x, y) coordinates of the mouse cursor.
+
+        Returns:
+            The screen area of the tooltip.
+        """
+        return self._draw_tooltip_box(["Scrap", f"Amount: {amount}"], (255, 255, 255), screen_pos)
 
+    def _draw_tooltip_box(self, lines: list[str], border_color: tuple, screen_pos: tuple[int, int]) -> pygame.Rect:
+        """Draws lines of text in a bordered box next to the mouse cursor, returning the box."""
         # Determine tooltip dimensions
         padding = 5
         line_height = 16
@@ -708,14 +744,10 @@ class UISystem:
         self.screen.blit(s, (x, y))
 
         # Draw Border
-        border_color = (255, 255, 255)
-        if player:
-            border_color = (0, 255, 0) if player.player_id == 1 else (255, 0, 0)
-            if player.player_id == 0:
-                border_color = (150, 150, 150)
         pygame.draw.rect(self.screen, border_color, bg_rect, 1)
 
         # Draw Text
         for i, line in enumerate(lines):
             text = self._get_text_surface(line, (255, 255, 255), "small")
             self.screen.blit(text, (x + padding, y + padding + i * line_height))
+        return bg_rect
@@ -0,0 +1,93 @@
+from ..components.player import Player
+from ..components.position import Position
+from ..components.vision import Vision
+from ..game_state import GameState
+
+
+class VisionSystem:
+    """Keeps every player's visibility grid in GameState up to date.
+
+    Rendering, fog of war and target acquisition all read these grids, so
+    the vision of each unit is stamped once per tick instead of being
+    re-derived by every consumer.
+    """
+
+    # The change channels that can move, add or remove a vision source
+    CHANNELS = (Position.CHANGE_CHANNEL, Player.CHANGE_CHANNEL, Vision.CHANGE_CHANNEL)
+
+    def __init__(self):
+        """Initializes the VisionSystem."""
+        self._state: GameState | None = None
+        self._version = 0
+        # The player and (x, y, vision_range) cell source each unit stamps
+        self._sources: dict[int, tuple[int, tuple[int, int, int]]] = {}
+
+    def update(self, game_state: GameState, dt: float = 0.0) -> None:  # pylint: disable=unused-argument
+        """Stamps the vision of every living unit onto its owner's grid.
+
+        Args:
+            game_state: The current state of the game.
+            dt: The time elapsed since the last frame.
+        """
+        if game_state is not self._state:
+            self._rebuild(game_state)
+            return
+
+        # Optimization: only the units that changed cell, owner or vision
+        # since the last update are re-stamped, so a tick where nobody
+        # crossed into another cell costs next to nothing.
+        changed: set[int] = set()
+        for channel in self.CHANNELS:
+            channel_changes = game_state.changed_since(channel, self._version)
+            if channel_changes is None:
+                self._rebuild(game_state)
+                return
+            changed.update(channel_changes)
+        self._version = game_state.change_version
+        if not changed:
+            return
+
+        removed: dict[int, list[tuple[int, int, int]]] = {}
+        added: dict[int, list[tuple[int, int, int]]] = {}
+        for entity_id in changed:
+            old = self._sources.pop(entity_id, None)
+            if old:
+                removed.setdefault(old[0], []).append(old[1])
+            new = self._get_source(game_state, entity_id)
+            if new:
+                self._sources[entity_id] = new
+                added.setdefault(new[0], []).append(new[1])
+
+        for player_id in removed.keys() | added.keys():
+            game_state.get_visibility(player_id).move_sources(removed.get(player_id, ()), added.get(player_id, ()))
+
+    def _rebuild(self, game_state: GameState) -> None:
+        """Stamps the vision of every unit of a GameState seen for the first time."""
+        self._state = game_state
+        self._version = game_state.change_version
+        self._sources = {}
+
+        sources: dict[int, list[tuple[int, int, int]]] = {}
+        for entity_id in game_state.get_entities_with_component(Vision):
+            source = self._get_source(game_state, entity_id)
+            if source:
+                self._sources[entity_id] = source
+                sources.setdefault(source[0], []).append(source[1])
+
+        # Players that lost every unit still need their last view cleared.
+        for player_id in set(sources) | set(game_state.visibility):
+            game_state.get_visibility(player_id).update(sources.get(player_id, ()))
+
+    @staticmethod
+    def _get_source(game_state: GameState, entity_id: int) -> tuple[int, tuple[int, int, int]] | None:
+        """Returns the player and (x, y, vision_range) cell source of a unit, or None if it has no vision."""
+        components = game_state.entities.get(entity_id)
+        if not components:
+            return None
+
+        vision = components.get(Vision)
+        player = components.get(Player)
+        pos = components.get(Position)
+        if not vision or not player or not pos:
+            return None
+        return player.player_id, (int(pos.x), int(pos.y), int(vision.vision_range))
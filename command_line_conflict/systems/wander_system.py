@@ -9,6 +9,9 @@ from ..game_state import GameState
 class WanderSystem:
     """Controls the random movement of entities with the Wander component."""
 
+    # Seconds before a wanderer that found no reachable target tries again
+    RETRY_DELAY = 0.2
+
     def update(self, game_state: GameState, dt: float) -> None:
         """Processes wandering logic.
 
@@ -16,55 +19,71 @@ class WanderSystem:
             game_state: The current state of the game.
             dt: The time elapsed since the last frame.
         """
-        # Optimized to iterate only over entities with Wander component
-        for entity_id in list(game_state.get_entities_with_component(Wander)):
-            wander = game_state.get_component(entity_id, Wander)
-            if not wander:
-                continue
+        timers = game_state.timers
 
-            movable = game_state.get_component(entity_id, Movable)
-            position = game_state.get_component(entity_id, Position)
+        # Optimization: every wanderer has a "wander" timer on the simulation
+        # clock, started by its Wander component, so only the ones whose timer
+        # expired are looked at instead of ticking a countdown on each of them.
+        for entity_id in timers.pop("wander"):
+            components = game_state.entities.get(entity_id)
+            if not components:
+                continue
 
+            # Entities that lost their Wander component had their timer
+            # cancelled; the others keep one running.
+            wander = components.get(Wander)
+            if not wander:
+                continue
+            movable = components.get(Movable)
+            position = components.get(Position)
             if not movable or not position:
+                timers.schedule(wander.move_interval, "wander", entity_id)
                 continue
 
-            # Check if currently moving
+            # Still walking to its last target: rest for a full interval
+            # before checking again.
             if movable.path or (movable.target_x is not None):
+                timers.schedule(wander.move_interval, "wander", entity_id)
                 continue
 
-            # Update timer
-            wander.time_since_last_move += dt
-
-            if wander.time_since_last_move >= wander.move_interval:
-                # Pick a random target
-                dx = random.randint(-wander.wander_radius, wander.wander_radius)
-                dy = random.randint(-wander.wander_radius, wander.wander_radius)
-
-                target_x = int(position.x + dx)
-                target_y = int(position.y + dy)
-
-                # Clamp to map bounds
-                target_x = max(0, min(target_x, game_state.map.width - 1))
-                target_y = max(0, min(target_y, game_state.map.height - 1))
-
-                # Simple check if target is valid (not a wall)
-                if game_state.map.is_walkable(target_x, target_y):
-                    # Use MovementSystem logic indirectly by setting path (or relying on MovementSystem to calculate it)
-                    # But MovementSystem.set_target is a method on the system instance, not available here easily
-                    # unless we pass the system or duplicate logic.
-                    # However, Movable component has target_x/target_y which MovementSystem reads.
-                    # But MovementSystem usually calculates path *once* in set_target.
-                    # If we just set target_x/y, MovementSystem might just move in straight line.
-                    # Let's use game_state.map.find_path here to be safe and set the path.
-
-                    path = game_state.map.find_path(
-                        (int(position.x), int(position.y)),
-                        (target_x, target_y),
-                        can_fly=movable.can_fly,
-                    )
-
-                    if path:
-                        movable.path = path
-                        movable.target_x = path[0][0]
-                        movable.target_y = path[0][1]
-                        wander.time_since_last_move = 0.0
+            if self._start_wandering(game_state, wander, movable, position):
+                timers.schedule(wander.move_interval, "wander", entity_id)
+            else:
+                timers.schedule(self.RETRY_DELAY, "wander", entity_id)
+
+    @staticmethod
+    def _start_wandering(game_state: GameState, wander: Wander, movable: Movable, position: Position) -> bool:
+        """Sends an entity towards a random walkable cell within its wander radius.
+
+        Returns:
+            True if a path to the target was found.
+        """
+        # Pick a random target
+        dx = random.randint(-wander.wander_radius, wander.wander_radius)
+        dy = random.randint(-wander.wander_radius, wander.wander_radius)
+
+        target_x = int(position.x + dx)
+        target_y = int(position.y + dy)
+
+        # Clamp to map bounds
+        target_x = max(0, min(target_x, game_state.map.width - 1))
+        target_y = max(0, min(target_y, game_state.map.height - 1))
+
+        # Simple check if target is valid (not a wall)
+        if not game_state.map.is_walkable(target_x, target_y):
+            return False
+
+        # MovementSystem only computes a path in set_target, which isn't
+        # reachable from here, so find the path directly.
+        path = game_state.map.find_path(
+            (int(position.x), int(position.y)),
+            (target_x, target_y),
+            can_fly=movable.can_fly,
+        )
+        if not path:
+            return False
+
+        movable.path = path
+        movable.target_x = path[0][0]
+        movable.target_y = path[0][1]
+        return True
@@ -0,0 +1,127 @@
+import math
+from typing import Hashable
+
+
+class TimerWheel:
+    """The simulation clock, and the timers systems schedule on it.
+
+    Systems schedule a (type, key) timer, e.g. ("wander", entity_id), to
+    expire some seconds from now and later pop the keys of the timers of
+    that type that expired. Each (type, key) has at most one pending timer:
+    scheduling it again moves it, and the old entry is dropped when its
+    slot comes up.
+
+    Timers live in a hierarchical wheel of LEVELS rings of SLOTS slots
+    each. Ring 0 holds the timers due within SLOTS ticks of the current
+    one, ring 1 those due within SLOTS**2 ticks, and so on; a slot of an
+    outer ring is re-sorted into the inner rings once the clock reaches it.
+    Scheduling is O(1), and advancing the clock only touches the timers
+    that expire (or cascade) on the ticks it crosses, however many are
+    pending.
+    """
+
+    SLOTS = 64
+    LEVELS = 4
+
+    def __init__(self, resolution: float):
+        """Initializes a TimerWheel at time 0.
+
+        Args:
+            resolution: The length of a wheel tick in seconds. Timers expire
+                on the first tick at or after their due time.
+        """
+        self.resolution = resolution
+        # Seconds of simulation time elapsed
+        self.now = 0.0
+        # Wheel ticks elapsed
+        self.tick = 0
+        self._rings: list[list[list[tuple[int, str, Hashable]]]] = [
+            [[] for _ in range(self.SLOTS)] for _ in range(self.LEVELS)
+        ]
+        # Timers too far out for the outer ring, re-sorted on each turn of it
+        self._overflow: list[tuple[int, str, Hashable]] = []
+        # Due tick of the pending timer of each key, by type
+        self._deadlines: dict[str, dict[Hashable, int]] = {}
+        self._expired: dict[str, list[Hashable]] = {}
+
+    def schedule(self, delay: float, event_type: str, key: Hashable) -> None:
+        """Sets the timer of a key to expire delay seconds from now.
+
+        Args:
+            delay: Seconds until the timer expires. Timers expire on a later
+                tick than the current one, even with a delay of 0.
+            event_type: The type the expired key is popped with.
+            key: What the timer is for, usually an entity ID.
+        """
+        # The small tolerance keeps float error from pushing an exact
+        # multiple of the resolution onto the next tick.
+        due = max(self.tick + 1, math.ceil((self.now + delay) / self.resolution - 1e-9))
+        self._deadlines.setdefault(event_type, {})[key] = due
+        self._insert((due, event_type, key))
+
+    def cancel(self, event_type: str, key: Hashable) -> None:
+        """Forgets the pending timer of a key, if any."""
+        deadlines = self._deadlines.get(event_type)
+        if deadlines:
+            deadlines.pop(key, None)
+
+    def scheduled(self, event_type: str):
+        """Returns a set-like view of the keys with a pending timer of a type."""
+        return self._deadlines.setdefault(event_type, {}).keys()
+
+    def advance(self, dt: float) -> None:
+        """Moves the clock forward by dt seconds, expiring the timers it passes."""
+        self.now += dt
+        target = int(self.now / self.resolution + 1e-9)
+        while self.tick < target:
+            self.tick += 1
+            self._cascade()
+            slot = self._rings[0][self.tick % self.SLOTS]
+            if slot:
+                self._rings[0][self.tick % self.SLOTS] = []
+                for entry in slot:
+                    self._expire(entry)
+
+    def pop(self, event_type: str) -> list[Hashable]:
+        """Returns and forgets the keys whose timers of a type expired, oldest first."""
+        return self._expired.pop(event_type, [])
+
+    def _insert(self, entry: tuple[int, str, Hashable]) -> None:
+        """Files a timer in the innermost ring whose span covers its due tick."""
+        due = entry[0]
+        delta = due - self.tick
+        span = self.SLOTS
+        for level in range(self.LEVELS):
+            if delta < span:
+                self._rings[level][(due // (span // self.SLOTS)) % self.SLOTS].append(entry)
+                return
+            span *= self.SLOTS
+        self._overflow.append(entry)
+
+    def _cascade(self) -> None:
+        """Re-sorts the outer ring slots the clock just reached into the inner rings."""
+        span = self.SLOTS ** (self.LEVELS - 1)
+        if self.tick % (span * self.SLOTS) == 0 and self._overflow:
+            overflow, self._overflow = self._overflow, []
+            for entry in overflow:
+                self._insert(entry)
+        # Outer rings first, so a timer can fall through several of them on
+        # the same tick.
+        for level in range(self.LEVELS - 1, 0, -1):
+            if self.tick % span == 0:
+                index = (self.tick // span) % self.SLOTS
+                slot = self._rings[level][index]
+                if slot:
+                    self._rings[level][index] = []
+                    for entry in slot:
+                        self._insert(entry)
+            span //= self.SLOTS
+
+    def _expire(self, entry: tuple[int, str, Hashable]) -> None:
+        due, event_type, key = entry
+        deadlines = self._deadlines.get(event_type)
+        # Timers that were moved or cancelled leave stale entries behind.
+        if deadlines is None or deadlines.get(key) != due:
+            return
+        del deadlines[key]
+        self._expired.setdefault(event_type, []).append(key)
@@ -0,0 +1,76 @@
+from typing import NamedTuple
+
+
+class TriggerEvent(NamedTuple):
+    """An entity entering or leaving a trigger zone cell."""
+
+    kind: str
+    entity_id: int
+    cell: tuple[int, int]
+
+
+class TriggerZones:
+    """Cells that raise events when entities enter or leave them.
+
+    Systems register cells under an event type (e.g. "scrap" or "factory")
+    and later pop the events of that type. GameState reports every entity
+    that is placed on, moves across or is removed from a cell, so a zone
+    costs nothing until something actually crosses into or out of it.
+    """
+
+    ENTER = "enter"
+    LEAVE = "leave"
+
+    def __init__(self):
+        """Initializes an empty TriggerZones."""
+        # How many registrations each event type has on each cell
+        self._zones: dict[tuple[int, int], dict[str, int]] = {}
+        self._events: dict[str, list[TriggerEvent]] = {}
+
+    def __contains__(self, cell: tuple[int, int]) -> bool:
+        return cell in self._zones
+
+    def add(self, cell: tuple[int, int], event_type: str, occupants=()) -> None:
+        """Registers a cell for an event type.
+
+        Args:
+            cell: The (x, y) cell.
+            event_type: The type of the events the cell raises.
+            occupants: The entities already on the cell; they count as
+                entering it.
+        """
+        types = self._zones.setdefault(cell, {})
+        types[event_type] = types.get(event_type, 0) + 1
+        if occupants:
+            events = self._events.setdefault(event_type, [])
+            for entity_id in occupants:
+                events.append(TriggerEvent(self.ENTER, entity_id, cell))
+
+    def remove(self, cell: tuple[int, int], event_type: str) -> None:
+        """Undoes one registration of a cell for an event type."""
+        types = self._zones.get(cell)
+        if not types or event_type not in types:
+            return
+        types[event_type] -= 1
+        if types[event_type] <= 0:
+            del types[event_type]
+            if not types:
+                del self._zones[cell]
+
+    def has(self, cell: tuple[int, int], event_type: str) -> bool:
+        """Returns whether a cell is registered for an event type."""
+        types = self._zones.get(cell)
+        return bool(types) and event_type in types
+
+    def fire(self, kind: str, entity_id: int, cell: tuple[int, int]) -> None:
+        """Raises a kind (ENTER or LEAVE) event on every type registered on a cell."""
+        types = self._zones.get(cell)
+        if not types:
+            return
+        event = TriggerEvent(kind, entity_id, cell)
+        for event_type in types:
+            self._events.setdefault(event_type, []).append(event)
+
+    def pop(self, event_type: str) -> list[TriggerEvent]:
+        """Returns and forgets the events of an event type, oldest first."""
+        return self._events.pop(event_type, [])
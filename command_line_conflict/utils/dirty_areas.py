@@ -0,0 +1,43 @@
+"""Tracking which screen areas of a scene changed between frames."""
+
+from typing import Hashable, Iterable
+
+import pygame
+
+
+class DirtyAreas:
+    """Remembers what each changing layer of a scene drew last frame.
+
+    Every frame, a scene reports each layer whose drawing can change (a
+    tooltip, the chat, an animation) with a key describing its content and
+    the rects it covers. A layer whose key is the same as last frame drew
+    the same pixels and adds nothing; a changed layer marks both its
+    previous and its current rects dirty, so whatever moved or vanished is
+    repainted.
+    """
+
+    def __init__(self):
+        """Initializes a DirtyAreas with no layers drawn yet."""
+        self._layers: dict[str, tuple[Hashable, list[pygame.Rect]]] = {}
+
+    def track(self, name: str, key: Hashable, rects: Iterable[pygame.Rect] = ()) -> list[pygame.Rect]:
+        """Records a layer as drawn this frame.
+
+        Args:
+            name: The layer.
+            key: A value that changes whenever the layer's pixels do. A
+                layer that drew nothing can pass None.
+            rects: The screen areas the layer covers this frame.
+
+        Returns:
+            The rects to update for the layer: empty if its key is unchanged,
+            otherwise its previous and current rects (once if they match).
+        """
+        rects = list(rects)
+        last_key, last_rects = self._layers.get(name, (None, []))
+        self._layers[name] = (key, rects)
+        if key == last_key:
+            return []
+        if last_rects == rects:
+            return rects
+        return last_rects + rects
@@ -0,0 +1,99 @@
+"""Fixed-capacity storage for short-lived screen effects."""
+
+from typing import Any, Hashable
+
+import numpy as np
+
+
+class EffectPool:
+    """Keeps up to `capacity` timed effects in preallocated parallel arrays.
+
+    Positions and start times live in NumPy arrays, so expiring effects and
+    computing their progress are whole-array operations instead of list
+    rebuilds. Each slot also carries arbitrary data, such as a pre-rendered
+    surface. Effects may be registered under a key so that a later effect
+    can update a live one instead of spawning another.
+    """
+
+    def __init__(self, capacity: int, duration_ms: int):
+        """Initializes an empty EffectPool.
+
+        Args:
+            capacity: The most effects alive at once. When full, spawning
+                recycles the oldest one.
+            duration_ms: How long each effect lives, in milliseconds.
+        """
+        self.capacity = capacity
+        self.duration_ms = duration_ms
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.start_time = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.data: list[Any] = [None] * capacity
+        self._keys: list[Hashable | None] = [None] * capacity
+        self._slot_by_key: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.alive))
+
+    def spawn(self, x: float, y: float, now: int, data: Any, key: Hashable | None = None) -> int:
+        """Starts a new effect.
+
+        Args:
+            x: The X coordinate of the effect.
+            y: The Y coordinate of the effect.
+            now: The current time in milliseconds.
+            data: Whatever the owner needs to draw the effect.
+            key: An optional key to find the effect again with find().
+
+        Returns:
+            The slot holding the effect.
+        """
+        free = np.flatnonzero(~self.alive)
+        slot = int(free[0]) if free.size else int(np.argmin(self.start_time))
+        self._release(slot)
+
+        self.x[slot] = x
+        self.y[slot] = y
+        self.start_time[slot] = now
+        self.alive[slot] = True
+        self.data[slot] = data
+        if key is not None:
+            self._keys[slot] = key
+            self._slot_by_key[key] = slot
+        return slot
+
+    def find(self, key: Hashable) -> int | None:
+        """Returns the slot of the live effect registered under key, if any."""
+        slot = self._slot_by_key.get(key)
+        if slot is None or not self.alive[slot]:
+            return None
+        return slot
+
+    def expire(self, now: int) -> np.ndarray:
+        """Retires finished effects.
+
+        Args:
+            now: The current time in milliseconds.
+
+        Returns:
+            The slots of the effects still alive.
+        """
+        finished = self.alive & (now - self.start_time >= self.duration_ms)
+        for slot in np.flatnonzero(finished):
+            self._release(int(slot))
+        return np.flatnonzero(self.alive)
+
+    def progress(self, slots: np.ndarray, now: int) -> np.ndarray:
+        """Returns how far through their lifetime the effects in slots are, from 0 to 1."""
+        return (now - self.start_time[slots]) / self.duration_ms
+
+    def _release(self, slot: int) -> None:
+        """Frees a slot and forgets its key."""
+        self.alive[slot] = False
+        self.data[slot] = None
+        key = self._keys[slot]
+        if key is not None:
+            if self._slot_by_key.get(key) == slot:
+                del self._slot_by_key[key]
+            self._keys[slot] = None
@@ -0,0 +1,100 @@
+"""Shared texture pages for the square, scaled glyphs drawn on the map grid."""
+
+from collections import OrderedDict
+
+import pygame
+
+from ..logger import log
+
+
+class GlyphAtlas:
+    """Packs rendered glyphs of the same size into shared atlas pages.
+
+    Each (char, color, size) is rendered and scaled once, then copied into a
+    slot of a page holding SLOTS_PER_ROW x SLOTS_PER_ROW glyphs of that size.
+    Callers draw glyphs as (page, dest, area) items, which is the format
+    Surface.blits expects, so a whole frame can be drawn in one call.
+
+    The atlas is bounded: it keeps the glyphs of the MAX_SIZES most recently
+    used sizes (each zoom level is a size), and a size that fills
+    MAX_PAGES_PER_SIZE pages starts over empty. Evicted pages are dropped
+    rather than reused, so glyphs already queued for the frame stay valid.
+    """
+
+    SLOTS_PER_ROW = 16
+    MAX_SIZES = 2
+    MAX_PAGES_PER_SIZE = 4
+
+    def __init__(self, font):
+        """Initializes an empty GlyphAtlas.
+
+        Args:
+            font: The pygame font used to render glyphs.
+        """
+        self.font = font
+        self._glyphs: dict[tuple[str, tuple, int], tuple[pygame.Surface, pygame.Rect]] = {}
+        # Pages by size, least recently used size first
+        self._pages: OrderedDict[int, list[pygame.Surface]] = OrderedDict()
+        self._slot_counts: dict[int, int] = {}
+        self._last_size: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
+
+    def get(self, char: str, color: tuple, size: int) -> tuple[pygame.Surface, pygame.Rect]:
+        """Returns the page and area holding a glyph, adding it on first use.
+
+        Args:
+            char: The character to draw.
+            color: The color tuple (R, G, B).
+            size: The width and height the glyph is scaled to, in pixels.
+
+        Returns:
+            The atlas page and the area of the glyph within it.
+        """
+        if size != self._last_size:
+            self._use_size(size)
+
+        key = (char, color, size)
+        entry = self._glyphs.get(key)
+        if entry is not None:
+            return entry
+
+        slot = self._slot_counts.get(size, 0)
+        slots_per_page = self.SLOTS_PER_ROW * self.SLOTS_PER_ROW
+        if slot >= slots_per_page * self.MAX_PAGES_PER_SIZE:
+            log.debug(f"Glyph atlas for {size}px glyphs is full; starting over")
+            self._evict(size)
+            slot = 0
+        index = slot % slots_per_page
+        if index == 0:
+            page_size = self.SLOTS_PER_ROW * size
+            self._pages.setdefault(size, []).append(pygame.Surface((page_size, page_size), pygame.SRCALPHA))
+            log.debug(f"Allocated glyph atlas page {len(self._pages[size])} for {size}px glyphs")
+        page = self._pages[size][-1]
+        area = pygame.Rect((index % self.SLOTS_PER_ROW) * size, (index // self.SLOTS_PER_ROW) * size, size, size)
+
+        glyph = pygame.transform.scale(self.font.render(char, True, color), (size, size))
+        # The slot is fully transparent, so a max blend copies the glyph's
+        # pixels exactly instead of alpha-blending them onto black.
+        page.blit(glyph, area.topleft, special_flags=pygame.BLEND_RGBA_MAX)
+
+        self._slot_counts[size] = slot + 1
+        entry = (page, area)
+        self._glyphs[key] = entry
+        return entry
+
+    def _use_size(self, size: int) -> None:
+        """Marks a size as the most recently used, evicting the least recently used beyond MAX_SIZES."""
+        self._last_size = size
+        if size in self._pages:
+            self._pages.move_to_end(size)
+            return
+        while len(self._pages) >= self.MAX_SIZES:
+            self._evict(next(iter(self._pages)))
+
+    def _evict(self, size: int) -> None:
+        """Forgets every glyph and page of a size."""
+        self._pages.pop(size, None)
+        self._slot_counts.pop(size, None)
+        self._glyphs = {key: entry for key, entry in self._glyphs.items() if key[2] != size}
@@ -52,7 +52,7 @@ class Profiler:
         target_frame_time = 1.0 / config.FPS if config.FPS > 0 else 0
         frame_drop = 0
         # If frame took longer than target + 10%, we count it as a drop
-        if dt > target_frame_time * 1.1:
+        if target_frame_time > 0 and dt > target_frame_time * 1.1:
             frame_drop = 1
             self.frame_drops += 1
 
@@ -0,0 +1,88 @@
+"""Multi-rate scheduler for the per-tick game systems."""
+
+import time
+from typing import Callable
+
+from ..logger import log
+from .profiler import profiler
+
+
+class ScheduledSystem:
+    """Bookkeeping for a single callback registered with the SystemScheduler."""
+
+    def __init__(self, name: str, callback: Callable[[float], None], interval: float, phase: float):
+        """Initializes the scheduled entry.
+
+        Args:
+            name: A label used for profiling and debugging.
+            callback: Called with the dt accumulated since its last run.
+            interval: Seconds between runs. 0 runs the callback every tick.
+            phase: Offset of the first run, as a fraction of the interval.
+        """
+        self.name = name
+        self.callback = callback
+        self.interval = interval
+        self.pending_dt = 0.0
+        self.countdown = interval * phase
+
+
+class SystemScheduler:
+    """Runs registered systems in order, each at its own tick rate.
+
+    Systems that don't need frame-perfect resolution (fog of war, spawning,
+    win/loss checks...) can run a few times per second instead of every
+    frame. They receive the dt accumulated since their previous run, so
+    timers inside the systems keep real-time behaviour.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty SystemScheduler."""
+        self.systems: list[ScheduledSystem] = []
+
+    def register(
+        self,
+        name: str,
+        callback: Callable[[float], None],
+        rate: float | None = None,
+        phase: float = 0.0,
+    ) -> None:
+        """Adds a system to the end of the schedule.
+
+        Args:
+            name: A label used for profiling and debugging.
+            callback: Called with the accumulated dt whenever the system is due.
+            rate: Runs per second. None (or <= 0) runs the system every tick.
+            phase: Offset of the first run within the interval, in [0, 1).
+                Systems sharing a rate can use different phases so they
+                don't all land on the same tick.
+        """
+        interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self.systems.append(ScheduledSystem(name, callback, interval, phase % 1.0))
+        log.debug(f"Scheduled system '{name}' at {rate or 'every tick'} Hz (phase {phase})")
+
+    def update(self, dt: float) -> None:
+        """Advances the schedule by dt and runs every system that is due.
+
+        Args:
+            dt: The time elapsed since the last tick.
+        """
+        for system in self.systems:
+            system.pending_dt += dt
+            if system.interval > 0:
+                system.countdown -= dt
+                if system.countdown > 0:
+                    continue
+                system.countdown += system.interval
+                # After a long stall, run once and resynchronize instead of
+                # trying to catch up on every missed interval.
+                if system.countdown <= 0:
+                    system.countdown = system.interval
+
+            elapsed = system.pending_dt
+            system.pending_dt = 0.0
+            if profiler.enabled:
+                start_time = time.perf_counter()
+                system.callback(elapsed)
+                profiler.log_metric(system.name, time.perf_counter() - start_time)
+            else:
+                system.callback(elapsed)
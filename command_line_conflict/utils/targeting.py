@@ -20,6 +20,8 @@ class Targeting:
         """Finds the closest enemy entity within the vision range.
 
         Optimized to use spatial hashing to avoid O(N) iteration over all entities.
+        Once the VisionSystem has built a visibility grid for the player,
+        occupied cells that player cannot currently see are skipped.
         """
         if DEBUG:
             log.debug(f"Targeting: Searching for enemy for unit {my_id} at ({my_pos.x}, {my_pos.y})")
@@ -29,6 +31,8 @@ class Targeting:
         vision_range = vision.vision_range
         vision_range_sq = vision_range * vision_range
 
+        visibility = game_state.visibility.get(my_player.player_id)
+
         # Calculate search bounds based on vision range
         min_x = int(my_pos.x - vision_range)
         max_x = int(my_pos.x + vision_range)
@@ -39,72 +43,52 @@ class Targeting:
         # If the map is sparse (number of populated tiles < visible tiles),
         # iterating over the spatial map keys is significantly faster than
         # iterating over every tile in the bounding box.
+        spatial_map = game_state.spatial_map
         area = (max_x - min_x + 1) * (max_y - min_y + 1)
-        use_keys_iteration = len(game_state.spatial_map) < (area * 0.5)
-
-        if use_keys_iteration:
+        if len(spatial_map) < (area * 0.5):
             # Iterate spatial map keys (Sparse map optimization)
-            for (x, y), cell_entities in game_state.spatial_map.items():
-                if min_x <= x <= max_x and min_y <= y <= max_y:
-                    for other_id in cell_entities:
-                        if other_id == my_id:
-                            continue
-
-                        # Retrieve components directly for performance
-                        other_components = game_state.entities.get(other_id)
-                        if not other_components:
-                            continue
-
-                        other_player = other_components.get(Player)
-                        if not other_player or other_player.player_id == my_player.player_id:
-                            continue
-
-                        other_pos = other_components.get(Position)
-                        if not other_pos:
-                            continue
-
-                        # Optimization: Use squared distance to avoid expensive sqrt() in the loop
-                        dx = my_pos.x - other_pos.x
-                        dy = my_pos.y - other_pos.y
-                        dist_sq = dx * dx + dy * dy
-
-                        if dist_sq <= vision_range_sq and dist_sq < min_dist_sq:
-                            min_dist_sq = dist_sq
-                            closest_enemy = other_id
+            cells = (
+                (x, y, cell_entities)
+                for (x, y), cell_entities in spatial_map.items()
+                if min_x <= x <= max_x and min_y <= y <= max_y
+            )
         else:
             # Iterate only over the grid cells within the vision range (Dense map / Small vision)
-            for x in range(min_x, max_x + 1):
-                for y in range(min_y, max_y + 1):
-                    # Retrieve potential targets from the spatial map
-                    grid_cell_entities: set[int] | None = game_state.spatial_map.get((x, y))
-                    if not grid_cell_entities:
-                        continue
-
-                    for other_id in grid_cell_entities:
-                        if other_id == my_id:
-                            continue
-
-                        # Retrieve components directly for performance
-                        other_components = game_state.entities.get(other_id)
-                        if not other_components:
-                            continue
-
-                        other_player = other_components.get(Player)
-                        if not other_player or other_player.player_id == my_player.player_id:
-                            continue
-
-                        other_pos = other_components.get(Position)
-                        if not other_pos:
-                            continue
-
-                        # Optimization: Use squared distance to avoid expensive sqrt() in the loop
-                        dx = my_pos.x - other_pos.x
-                        dy = my_pos.y - other_pos.y
-                        dist_sq = dx * dx + dy * dy
-
-                        if dist_sq <= vision_range_sq and dist_sq < min_dist_sq:
-                            min_dist_sq = dist_sq
-                            closest_enemy = other_id
+            cells = ((x, y, spatial_map.get((x, y))) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1))
+
+        for x, y, cell_entities in cells:
+            if not cell_entities:
+                continue
+            # Enemies on cells the player cannot currently see are not
+            # targetable; an O(1) lookup per occupied cell.
+            if visibility is not None and not visibility.is_visible(x, y):
+                continue
+
+            for other_id in cell_entities:
+                if other_id == my_id:
+                    continue
+
+                # Retrieve components directly for performance
+                other_components = game_state.entities.get(other_id)
+                if not other_components:
+                    continue
+
+                other_player = other_components.get(Player)
+                if not other_player or other_player.player_id == my_player.player_id:
+                    continue
+
+                other_pos = other_components.get(Position)
+                if not other_pos:
+                    continue
+
+                # Optimization: Use squared distance to avoid expensive sqrt() in the loop
+                dx = my_pos.x - other_pos.x
+                dy = my_pos.y - other_pos.y
+                dist_sq = dx * dx + dy * dy
+
+                if dist_sq <= vision_range_sq and dist_sq < min_dist_sq:
+                    min_dist_sq = dist_sq
+                    closest_enemy = other_id
 
         if DEBUG and closest_enemy:
             log.debug(f"Targeting: Found target {closest_enemy} for unit {my_id} at distance {min_dist_sq**0.5:.2f}")
@@ -0,0 +1,192 @@
+from collections import Counter, deque
+from typing import Iterable
+
+import numpy as np
+
+from .logger import log
+
+
+class VisibilityGrid:
+    """Tracks which map cells a player can see and has seen.
+
+    Every cell holds a count of the vision sources that see it. An update
+    only un-stamps and re-stamps the circular masks of the sources whose
+    integer cell or range changed, so moving one unit costs O(R^2)
+    regardless of army size, and a cell becomes EXPLORED only once its last
+    viewer leaves.
+    """
+
+    HIDDEN = 0
+    EXPLORED = 1
+    VISIBLE = 2
+
+    # How many version bumps changed_area_since can look back over.
+    HISTORY = 32
+
+    # Circular masks per vision range, shared by every grid.
+    _masks: dict[int, np.ndarray] = {}
+
+    def __init__(self, width: int, height: int):
+        """Initializes a VisibilityGrid with every cell hidden.
+
+        Args:
+            width: The width of the map in grid cells.
+            height: The height of the map in grid cells.
+        """
+        self.width = width
+        self.height = height
+        # Cell states, indexed [y][x]
+        self.grid = np.full((height, width), self.HIDDEN, dtype=np.uint8)
+        # How many vision sources currently see each cell
+        self.viewers = np.zeros((height, width), dtype=np.int32)
+        # Cells seen by at least one vision source
+        self.visible = np.zeros((height, width), dtype=bool)
+        # Incremented whenever a cell changes state.
+        self.version = 0
+        # The (x0, y0, x1, y1) area that contained every change of the last
+        # version bump.
+        self.changed_area: tuple[int, int, int, int] | None = None
+        # The changed area of each of the last HISTORY version bumps
+        self._changes: deque[tuple[int, int, int, int]] = deque(maxlen=self.HISTORY)
+        self._sources: Counter[tuple[int, int, int]] = Counter()
+        log.debug(f"Initialized VisibilityGrid with grid size {width}x{height}")
+
+    @classmethod
+    def get_mask(cls, radius: int) -> np.ndarray:
+        """Returns a (2r+1) x (2r+1) boolean disc of the cells within radius of its center."""
+        mask = cls._masks.get(radius)
+        if mask is None:
+            offsets = np.arange(-radius, radius + 1)
+            mask = offsets[:, None] ** 2 + offsets[None, :] ** 2 <= radius * radius
+            cls._masks[radius] = mask
+        return mask
+
+    def is_visible(self, x: int, y: int) -> bool:
+        """Returns whether a cell is currently seen; cells off the map never are."""
+        return 0 <= x < self.width and 0 <= y < self.height and bool(self.visible[y, x])
+
+    def changed_area_since(self, version: int) -> tuple[int, int, int, int] | None:
+        """Returns the (x0, y0, x1, y1) area containing every change made after a version.
+
+        Args:
+            version: A version the grid had, e.g. the last one a consumer
+                synced to.
+
+        Returns:
+            The union of the changed areas, an empty area if nothing changed,
+            or None if the version is more than HISTORY bumps old and the
+            whole grid must be treated as changed.
+        """
+        missed = self.version - version
+        if missed <= 0:
+            return 0, 0, 0, 0
+        if missed > len(self._changes):
+            return None
+        area = None
+        for index in range(len(self._changes) - missed, len(self._changes)):
+            area = self._union(area, self._changes[index])
+        return area
+
+    def update(self, sources: Iterable[tuple[float, float, int]]) -> bool:
+        """Moves the vision sources to their current positions.
+
+        Args:
+            sources: An (x, y, vision_range) tuple per unit with vision.
+
+        Returns:
+            True if any cell changed state.
+        """
+        current_sources = Counter((int(x), int(y), int(vision_range)) for x, y, vision_range in sources)
+        if current_sources == self._sources:
+            return False
+
+        # Counter subtraction keeps positive counts only, which are exactly the
+        # removed (or surplus duplicate) sources and the added ones.
+        removed = self._sources - current_sources
+        added = current_sources - self._sources
+        self._sources = current_sources
+        return self._apply(removed, added)
+
+    def move_sources(self, removed: Iterable[tuple[int, int, int]], added: Iterable[tuple[int, int, int]]) -> bool:
+        """Applies a change of the vision sources, given as the sources that went away and came in.
+
+        Unlike update, this costs nothing for the sources that didn't change.
+
+        Args:
+            removed: An (x, y, vision_range) cell tuple per source that went
+                away; it must have been added before.
+            added: An (x, y, vision_range) cell tuple per new source.
+
+        Returns:
+            True if any cell changed state.
+        """
+        removed = Counter(removed)
+        added = Counter(added)
+        # A unit that stayed put shows up on both sides.
+        common = removed & added
+        removed -= common
+        added -= common
+        if not removed and not added:
+            return False
+        sources = self._sources
+        sources.update(added)
+        for source, count in removed.items():
+            count = sources[source] - count
+            if count > 0:
+                sources[source] = count
+            else:
+                del sources[source]
+        return self._apply(removed, added)
+
+    def _apply(self, removed: Counter, added: Counter) -> bool:
+        """Un-stamps the removed sources and stamps the added ones."""
+        dirty = None
+        for source, count in removed.items():
+            dirty = self._union(dirty, self._stamp(source, -count))
+        for source, count in added.items():
+            dirty = self._union(dirty, self._stamp(source, count))
+        if dirty is None:
+            return False
+
+        x0, y0, x1, y1 = dirty
+        visible = self.viewers[y0:y1, x0:x1] > 0
+        previous = self.visible[y0:y1, x0:x1]
+        if np.array_equal(visible, previous):
+            return False
+
+        # Cells whose last viewer left become explored
+        grid = self.grid[y0:y1, x0:x1]
+        grid[previous & ~visible] = self.EXPLORED
+        grid[visible] = self.VISIBLE
+        previous[:] = visible
+
+        self.changed_area = dirty
+        self._changes.append(dirty)
+        self.version += 1
+        return True
+
+    def _stamp(self, source: tuple[int, int, int], count: int) -> tuple[int, int, int, int] | None:
+        """Adds count viewers to every cell a source sees; negative counts remove them.
+
+        Returns:
+            The touched (x0, y0, x1, y1) area, or None if the source sees no
+            cell of the map.
+        """
+        ux, uy, radius = source
+        x0, x1 = max(0, ux - radius), min(self.width, ux + radius + 1)
+        y0, y1 = max(0, uy - radius), min(self.height, uy + radius + 1)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        mask = self.get_mask(radius)
+        patch = mask[y0 - uy + radius : y1 - uy + radius, x0 - ux + radius : x1 - ux + radius]
+        self.viewers[y0:y1, x0:x1] += patch * np.int32(count)
+        return x0, y0, x1, y1
+
+    @staticmethod
+    def _union(area, other):
+        """Returns the bounding box of two (x0, y0, x1, y1) areas, either of which may be None."""
+        if area is None:
+            return other
+        if other is None:
+            return area
+        return min(area[0], other[0]), min(area[1], other[1]), max(area[2], other[2]), max(area[3], other[3])
@@ -0,0 +1,296 @@
+"""Times each game system on the synthetic benchmark scenarios.
+
+Usage:
+    python -m tests.benchmarks.run_benchmarks
+    python -m tests.benchmarks.run_benchmarks --scenario simple_100 --output results.json
+    python -m tests.benchmarks.run_benchmarks --save-baseline
+
+Results are written as JSON and compared against tests/benchmarks/baseline.json.
+Timings depend on the machine, so refresh the baseline (--save-baseline) on
+the machine you compare on before judging an optimization.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402  # pylint: disable=wrong-import-position
+
+from command_line_conflict import config  # noqa: E402  # pylint: disable=wrong-import-position
+from command_line_conflict.camera import Camera  # noqa: E402  # pylint: disable=wrong-import-position
+from command_line_conflict.campaign_manager import CampaignManager  # noqa: E402  # pylint: disable=wrong-import-position
+from command_line_conflict.components.player import Player  # noqa: E402  # pylint: disable=wrong-import-position
+from command_line_conflict.components.position import Position  # noqa: E402  # pylint: disable=wrong-import-position
+from command_line_conflict.components.vision import Vision  # noqa: E402  # pylint: disable=wrong-import-position
+from command_line_conflict.fog_of_war import FogOfWar  # noqa: E402  # pylint: disable=wrong-import-position
+from command_line_conflict.systems.ai_system import AISystem  # noqa: E402  # pylint: disable=wrong-import-position
+from command_line_conflict.systems.combat_system import CombatSystem  # noqa: E402  # pylint: disable=wrong-import-position
+from command_line_conflict.systems.flee_system import FleeSystem  # noqa: E402  # pylint: disable=wrong-import-position
+from command_line_conflict.systems.health_system import HealthSystem  # noqa: E402  # pylint: disable=wrong-import-position
+from command_line_conflict.systems.movement_system import MovementSystem  # noqa: E402  # pylint: disable=wrong-import-position
+from command_line_conflict.systems.production_system import (  # noqa: E402  # pylint: disable=wrong-import-position
+    ProductionSystem,
+)
+from command_line_conflict.systems.rendering_system import (  # noqa: E402  # pylint: disable=wrong-import-position
+    RenderingSystem,
+)
+from command_line_conflict.systems.resource_system import (  # noqa: E402  # pylint: disable=wrong-import-position
+    ResourceSystem,
+)
+from command_line_conflict.systems.vision_system import (  # noqa: E402  # pylint: disable=wrong-import-position
+    VisionSystem,
+)
+
+from .scenarios import SCENARIOS, Scenario  # noqa: E402  # pylint: disable=wrong-import-position
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+FONT_PATH = Path(config.__file__).resolve().parent / "fonts" / "DejaVuSansMono.ttf"
+RESULTS_VERSION = 1
+
+# A system is reported as a regression when its median time grows by more
+# than this fraction over the baseline (and as an improvement when it
+# shrinks by the same factor).
+DEFAULT_TOLERANCE = 0.25
+
+
+def _vision_sources(game_state) -> list:
+    """Collects the human player's vision sources, like GameScene does."""
+    sources = []
+    for entity_id in game_state.get_entities_with_component(Vision):
+        components = game_state.entities[entity_id]
+        player = components.get(Player)
+        pos = components.get(Position)
+        if player and player.is_human and pos:
+            sources.append((pos.x, pos.y, components[Vision].vision_range))
+    return sources
+
+
+def benchmark_scenario(scenario: Scenario, ticks: int, seed: int = 0) -> dict:
+    """Runs every benchmarked system on a scenario for a number of ticks.
+
+    Systems run once per tick in the same order as GameScene, all at full
+    rate so that each sample is the cost of a single call.
+
+    Args:
+        scenario: The world to benchmark.
+        ticks: How many ticks to time.
+        seed: Seeds world placement and the systems' random choices.
+
+    Returns:
+        A dict with the entity count and per-system timings in milliseconds.
+    """
+    random.seed(seed)
+    # Factories keep producing units; make sure a full scenario never hits
+    # the entity cap in the middle of a run.
+    max_entities = config.MAX_ENTITIES
+    config.MAX_ENTITIES = max(max_entities, scenario.entity_count * 2)
+    try:
+        game_state = scenario.build(seed)
+        game_state.campaign_manager = CampaignManager(save_file=os.devnull)
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+        screen = pygame.Surface((config.SCREEN["width"], config.SCREEN["height"]))
+        camera = Camera()
+        # Look at the front line in the middle of the map.
+        visible_w = config.SCREEN["width"] / config.GRID_SIZE
+        visible_h = config.SCREEN["height"] / config.GRID_SIZE
+        camera.set_position(max(0, (game_state.map.width - visible_w) / 2), max(0, (game_state.map.height - visible_h) / 2))
+        rendering_system = RenderingSystem(screen, pygame.font.Font(str(FONT_PATH), 16), camera)
+        fog_of_war = FogOfWar(game_state.map.width, game_state.map.height)
+
+        vision_system = VisionSystem()
+        health_system = HealthSystem()
+        flee_system = FleeSystem()
+        ai_system = AISystem()
+        combat_system = CombatSystem()
+        movement_system = MovementSystem()
+        resource_system = ResourceSystem()
+        production_system = ProductionSystem(game_state.campaign_manager)
+
+        dt = 1.0 / config.SIMULATION_TICK_RATE
+        steps = [
+            ("Timers", lambda: game_state.timers.advance(dt)),
+            ("VisionSystem", lambda: vision_system.update(game_state, dt)),
+            ("HealthSystem", lambda: health_system.update(game_state, dt)),
+            ("FleeSystem", lambda: flee_system.update(game_state, dt)),
+            ("AISystem", lambda: ai_system.update(game_state, dt)),
+            ("CombatSystem", lambda: combat_system.update(game_state, dt)),
+            ("MovementSystem", lambda: movement_system.update(game_state, dt)),
+            ("ResourceSystem", lambda: resource_system.update(game_state, dt)),
+            ("ProductionSystem", lambda: production_system.update(game_state, dt)),
+            ("FogOfWar.update", lambda: fog_of_war.update(_vision_sources(game_state))),
+            ("RenderingSystem.draw", lambda: rendering_system.draw(game_state, False, viewer_id=1)),
+        ]
+
+        samples: dict[str, list[float]] = {name: [] for name, _ in steps}
+        for _ in range(ticks):
+            game_state.begin_tick()
+            for name, step in steps:
+                start_time = time.perf_counter()
+                step()
+                samples[name].append((time.perf_counter() - start_time) * 1000)
+            game_state.event_queue.clear()
+    finally:
+        config.MAX_ENTITIES = max_entities
+
+    return {
+        "entities": scenario.entity_count,
+        "ticks": ticks,
+        "systems": {
+            name: {
+                "median_ms": statistics.median(times),
+                "mean_ms": statistics.fmean(times),
+                "max_ms": max(times),
+            }
+            for name, times in samples.items()
+        },
+    }
+
+
+def run_benchmarks(scenarios: list[Scenario], ticks: int, seed: int = 0) -> dict:
+    """Benchmarks several scenarios.
+
+    Args:
+        scenarios: The scenarios to run.
+        ticks: How many ticks to time per scenario.
+        seed: Seeds every scenario.
+
+    Returns:
+        The machine-readable results document.
+    """
+    return {
+        "version": RESULTS_VERSION,
+        "metadata": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "seed": seed,
+        },
+        "scenarios": {scenario.name: benchmark_scenario(scenario, ticks, seed) for scenario in scenarios},
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[dict]:
+    """Compares median timings against a baseline.
+
+    Pairs missing from the baseline, e.g. a newly benchmarked system, are
+    reported with a "missing" status: re-record the baseline whenever the
+    benchmarked steps change.
+
+    Args:
+        results: The current results document.
+        baseline: The stored results document.
+        tolerance: The allowed relative slowdown before flagging a regression.
+
+    Returns:
+        One row per scenario/system pair of the results with the ratio and a
+        status of "regression", "improvement", "ok" or "missing". Missing
+        rows have no baseline_ms or ratio.
+    """
+    rows = []
+    for scenario_name, scenario in results["scenarios"].items():
+        base_systems = baseline.get("scenarios", {}).get(scenario_name, {}).get("systems", {})
+        for system_name, timing in scenario["systems"].items():
+            base_timing = base_systems.get(system_name)
+            current_ms = timing["median_ms"]
+            if not base_timing:
+                base_ms = ratio = None
+                status = "missing"
+            else:
+                base_ms = base_timing["median_ms"]
+                ratio = current_ms / base_ms if base_ms > 0 else float("inf")
+                if ratio > 1 + tolerance:
+                    status = "regression"
+                elif ratio < 1 / (1 + tolerance):
+                    status = "improvement"
+                else:
+                    status = "ok"
+            rows.append(
+                {
+                    "scenario": scenario_name,
+                    "system": system_name,
+                    "baseline_ms": base_ms,
+                    "current_ms": current_ms,
+                    "ratio": ratio,
+                    "status": status,
+                }
+            )
+    return rows
+
+
+def format_comparison(rows: list[dict]) -> str:
+    """Formats comparison rows as a plain-text table."""
+    lines = [f"{'scenario':<22}{'system':<24}{'baseline':>10}{'current':>10}{'ratio':>8}  status"]
+    for row in rows:
+        if row["baseline_ms"] is None:
+            lines.append(
+                f"{row['scenario']:<22}{row['system']:<24}{'-':>10}{row['current_ms']:>8.3f}ms{'-':>8}  {row['status']}"
+            )
+            continue
+        lines.append(
+            f"{row['scenario']:<22}{row['system']:<24}{row['baseline_ms']:>8.3f}ms{row['current_ms']:>8.3f}ms"
+            f"{row['ratio']:>7.2f}x  {row['status']}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point.
+
+    Args:
+        argv: The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        The process exit code: 1 if --fail-on-regression is set and a
+        regression was found, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the game systems on synthetic scenarios.")
+    parser.add_argument("--scenario", action="append", choices=[s.name for s in SCENARIOS], help="run only these scenarios")
+    parser.add_argument("--ticks", type=int, default=30, help="ticks to time per scenario")
+    parser.add_argument("--seed", type=int, default=0, help="seed for world placement and the systems")
+    parser.add_argument("--output", type=Path, help="write the results JSON to this file")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite the baseline with these results")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed relative slowdown")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit with status 1 on any regression")
+    args = parser.parse_args(argv)
+
+    scenarios = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+    results = run_benchmarks(scenarios, args.ticks, args.seed)
+    document = json.dumps(results, indent=2, sort_keys=True)
+
+    if args.output:
+        args.output.write_text(document + "\n", encoding="utf-8")
+    else:
+        print(document)
+
+    if args.save_baseline:
+        args.baseline.write_text(document + "\n", encoding="utf-8")
+        print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.", file=sys.stderr)
+        return 0
+
+    rows = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+    print(format_comparison(rows), file=sys.stderr)
+    if any(row["status"] == "missing" for row in rows):
+        print("Some systems are missing from the baseline; refresh it with --save-baseline.", file=sys.stderr)
+    if args.fail_on_regression and any(row["status"] == "regression" for row in rows):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Synthetic, reproducible worlds for the system benchmarks."""
+
+import random
+from typing import Callable
+
+from command_line_conflict import factories
+from command_line_conflict.game_state import GameState
+from command_line_conflict.maps import FactoryBattleMap, Map, SimpleMap
+
+# Unit factories cycled through when populating each army.
+UNIT_FACTORIES = [
+    factories.create_chassis,
+    factories.create_rover,
+    factories.create_arachnotron,
+    factories.create_observer,
+    factories.create_immortal,
+]
+
+# One building per this many units in each army.
+UNITS_PER_BUILDING = 50
+
+
+class Scenario:
+    """A named map plus the number of entities to populate it with."""
+
+    def __init__(self, name: str, map_factory: Callable[[], Map], entity_count: int):
+        """Initializes the Scenario.
+
+        Args:
+            name: The key used in the results file.
+            map_factory: Builds a fresh map for each run.
+            entity_count: How many entities to create, counting scrap piles
+                as entities so the workload matches earlier baselines.
+        """
+        self.name = name
+        self.map_factory = map_factory
+        self.entity_count = entity_count
+
+    def build(self, seed: int = 0) -> GameState:
+        """Creates a populated GameState.
+
+        40% of the entities belong to the human player on the left half of
+        the map, 40% to the AI on the right half, and the rest are neutral
+        wildlife and scrap scattered across the whole map.
+
+        Args:
+            seed: Seeds the placement so every run gets the same world.
+
+        Returns:
+            The populated GameState.
+        """
+        rng = random.Random(seed)
+        game_state = GameState(self.map_factory())
+        game_map = game_state.map
+        half = game_map.width // 2
+
+        free = [(x, y) for y in range(game_map.height) for x in range(game_map.width) if not game_map.is_blocked(x, y)]
+        rng.shuffle(free)
+        left = [cell for cell in free if cell[0] < half]
+        right = [cell for cell in free if cell[0] >= half]
+        used: set[tuple[int, int]] = set()
+
+        def take(cells: list[tuple[int, int]]) -> tuple[int, int]:
+            while cells:
+                cell = cells.pop()
+                if cell not in used:
+                    used.add(cell)
+                    return cell
+            raise ValueError(f"Scenario '{self.name}' does not fit on its map")
+
+        army_size = self.entity_count * 2 // 5
+        for player_id, cells, is_human in ((1, left, True), (2, right, False)):
+            for i in range(army_size):
+                x, y = take(cells)
+                if i % UNITS_PER_BUILDING == UNITS_PER_BUILDING - 1:
+                    factories.create_rover_factory(game_state, x, y, player_id=player_id, is_human=is_human)
+                else:
+                    create = UNIT_FACTORIES[i % len(UNIT_FACTORIES)]
+                    create(game_state, x, y, player_id=player_id, is_human=is_human)
+
+        for i in range(self.entity_count - 2 * army_size):
+            x, y = take(free)
+            if i % 2:
+                game_state.add_scrap(x, y, 50)
+            else:
+                factories.create_wildlife(game_state, x, y)
+
+        return game_state
+
+
+SCENARIOS = [
+    Scenario("simple_100", SimpleMap, 100),
+    Scenario("factory_battle_1000", lambda: FactoryBattleMap(width=120, height=80), 1000),
+    Scenario("open_5000", lambda: Map(width=200, height=150), 5000),
+]
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from command_line_conflict import config
+from command_line_conflict.components.player import Player
+from command_line_conflict.maps import SimpleMap
+
+from .run_benchmarks import BASELINE_PATH, benchmark_scenario, compare, format_comparison, main
+from .scenarios import SCENARIOS, Scenario
+
+
+@pytest.fixture(autouse=True)
+def mock_glyph_scaling(mocker):
+    """The global pygame mocks hand RenderingSystem fake glyphs it can't scale."""
+    mocker.patch("pygame.transform.scale")
+
+
+def _results(median_ms):
+    return {"scenarios": {"tiny": {"systems": {"MovementSystem": {"median_ms": median_ms}}}}}
+
+
+class TestScenario:
+    def test_build_creates_requested_entities(self):
+        game_state = Scenario("tiny", SimpleMap, 50).build()
+
+        assert len(game_state.entities) + len(game_state.scrap) == 50
+        owners = {game_state.get_component(eid, Player).player_id for eid in game_state.get_entities_with_component(Player)}
+        assert {1, 2} <= owners
+
+    def test_build_is_reproducible(self):
+        first = Scenario("tiny", SimpleMap, 30).build(seed=4)
+        second = Scenario("tiny", SimpleMap, 30).build(seed=4)
+
+        assert first.spatial_map == second.spatial_map
+
+    def test_scenarios_fit_their_maps(self):
+        for scenario in SCENARIOS:
+            game_map = scenario.map_factory()
+            assert game_map.width * game_map.height - len(game_map.walls) >= scenario.entity_count
+
+
+class TestBenchmark:
+    def test_times_every_system(self):
+        result = benchmark_scenario(Scenario("tiny", SimpleMap, 20), ticks=2)
+
+        assert result["entities"] == 20
+        assert "RenderingSystem.draw" in result["systems"]
+        assert "FogOfWar.update" in result["systems"]
+        assert all(timing["median_ms"] >= 0 for timing in result["systems"].values())
+
+    def test_restores_entity_cap(self):
+        max_entities = config.MAX_ENTITIES
+
+        benchmark_scenario(Scenario("tiny", SimpleMap, 10), ticks=1)
+
+        assert config.MAX_ENTITIES == max_entities
+
+
+class TestCompare:
+    def test_flags_regressions_and_improvements(self):
+        assert compare(_results(2.0), _results(1.0))[0]["status"] == "regression"
+        assert compare(_results(0.5), _results(1.0))[0]["status"] == "improvement"
+        assert compare(_results(1.1), _results(1.0))[0]["status"] == "ok"
+
+    def test_reports_pairs_missing_from_baseline(self):
+        rows = compare(_results(1.0), {"scenarios": {}})
+
+        assert [(row["system"], row["status"], row["baseline_ms"]) for row in rows] == [("MovementSystem", "missing", None)]
+        assert "missing" in format_comparison(rows)
+
+    def test_baseline_covers_every_benchmarked_system(self):
+        systems = set(benchmark_scenario(Scenario("tiny", SimpleMap, 10), ticks=1)["systems"])
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+
+        for scenario in SCENARIOS:
+            assert set(baseline["scenarios"][scenario.name]["systems"]) == systems, "re-run with --save-baseline"
+
+
+def test_main_writes_results_and_fails_on_regression(tmp_path):
+    output = tmp_path / "results.json"
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"scenarios": {"simple_100": {"systems": {"HealthSystem": {"median_ms": 1e-9}}}}}))
+
+    exit_code = main(
+        [
+            "--scenario",
+            "simple_100",
+            "--ticks",
+            "1",
+            "--output",
+            str(output),
+            "--baseline",
+            str(baseline),
+            "--fail-on-regression",
+        ]
+    )
+
+    assert exit_code == 1
+    assert "simple_100" in json.loads(output.read_text())["scenarios"]
@@ -30,3 +30,19 @@ def game_state():
 
     game_map = SimpleMap()
     return GameState(game_map)
+
+
+@pytest.fixture
+def add_entity():
+    """
+    Returns a function that creates an entity on a GameState from the given
+    components and returns its ID.
+    """
+
+    def add(game_state, *components):
+        entity_id = game_state.create_entity()
+        for component in components:
+            game_state.add_component(entity_id, component)
+        return entity_id
+
+    return add
@@ -160,3 +160,43 @@ class TestProductionSystem(unittest.TestCase):
 
         self.system.update(self.game_state, 0.1)
         self.assertIn(unit_id, self.game_state.entities)
+
+    def test_production_when_unit_walks_onto_factory(self):
+        self.campaign_manager.is_unit_unlocked.return_value = True
+
+        factory_id = self.game_state.create_entity()
+        self.game_state.add_component(factory_id, Position(10, 10))
+        self.game_state.add_component(factory_id, Factory("chassis", "rover"))
+        self.game_state.add_component(factory_id, Player(1, True))
+
+        unit_id = self.game_state.create_entity()
+        self.game_state.add_component(unit_id, Position(9, 10))
+        self.game_state.add_component(unit_id, UnitIdentity("chassis"))
+        self.game_state.add_component(unit_id, Player(1, True))
+
+        with patch.dict(
+            "command_line_conflict.factories.UNIT_NAME_TO_FACTORY",
+            {"rover": MagicMock()},
+        ) as mock_dict:
+            self.system.update(self.game_state, 0.1)
+            self.assertIn(unit_id, self.game_state.entities)
+
+            self.game_state.update_entity_position(unit_id, 10.2, 10.0)
+            self.system.update(self.game_state, 0.1)
+
+            self.assertNotIn(unit_id, self.game_state.entities)
+            mock_dict["rover"].assert_called_once()
+
+    def test_removed_factory_stops_triggering(self):
+        self.campaign_manager.is_unit_unlocked.return_value = True
+
+        factory_id = self.game_state.create_entity()
+        self.game_state.add_component(factory_id, Position(10, 10))
+        self.game_state.add_component(factory_id, Factory("chassis", "rover"))
+        self.system.update(self.game_state, 0.1)
+        self.assertTrue(self.game_state.triggers.has((10, 10), "factory"))
+
+        self.game_state.remove_entity(factory_id)
+        self.system.update(self.game_state, 0.1)
+
+        self.assertNotIn((10, 10), self.game_state.triggers)
@@ -59,3 +59,19 @@ def test_map_draw_without_camera_bug(mock_scale):
     mock_scale.assert_called_once_with(mock_surface, (config.GRID_SIZE, config.GRID_SIZE))
     # We expect blit to be called with the scaled coordinates
     mock_surf.blit.assert_called_once_with(mock_scaled_surface, (expected_x, expected_y))
+
+
+def test_wall_changes_bump_epoch():
+    game_map = SimpleMap()
+    epoch = game_map.epoch
+
+    game_map.add_wall(1, 1)
+    assert game_map.epoch == epoch + 1
+
+    game_map.add_wall(-1, 1)  # Out of bounds: ignored
+    game_map.remove_wall(2, 2)  # Not a wall: ignored
+    assert game_map.epoch == epoch + 1
+
+    game_map.remove_wall(1, 1)
+    assert game_map.epoch == epoch + 2
+    assert not game_map.is_blocked(1, 1)
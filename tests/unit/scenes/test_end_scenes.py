@@ -0,0 +1,20 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from command_line_conflict.scenes.defeat import DefeatScene
+from command_line_conflict.scenes.victory import VictoryScene
+
+
+@pytest.mark.parametrize("scene_class", [VictoryScene, DefeatScene])
+def test_draw_reports_only_the_pulsing_instructions(scene_class):
+    game = MagicMock()
+    game.screen.get_width.return_value = 800
+    game.screen.get_height.return_value = 600
+    instruction_rect = MagicMock()
+    game.font.render.return_value.get_rect.return_value = instruction_rect
+    scene = scene_class(game)
+
+    dirty_rects = scene.draw(MagicMock())
+
+    assert dirty_rects == [instruction_rect]
@@ -9,8 +9,11 @@ from command_line_conflict.components.health import Health
 from command_line_conflict.components.player import Player
 from command_line_conflict.components.position import Position
 from command_line_conflict.components.selectable import Selectable
+from command_line_conflict.components.unit_identity import UnitIdentity
 from command_line_conflict.components.vision import Vision
+from command_line_conflict.maps import SimpleMap
 from command_line_conflict.scenes.game import GameScene
+from command_line_conflict.simulation import HeadlessSimulation
 
 
 @pytest.fixture
@@ -65,6 +68,36 @@ def game_scene(mock_game, mocker):
 
     mock_game_state_instance.get_entities_with_component.side_effect = get_entities_with_component_side_effect
 
+    # Mock count_units to count the Player + Health entities of self.entities
+    def count_units_side_effect(player_id=None, unit_type=None, is_human=None):
+        count = 0
+        for components in mock_game_state_instance.entities.values():
+            player = components.get(Player)
+            if not player or Health not in components:
+                continue
+            if player_id is not None and player.player_id != player_id:
+                continue
+            if is_human is not None and player.is_human != is_human:
+                continue
+            if unit_type is not None:
+                identity = components.get(UnitIdentity)
+                if not identity or identity.name != unit_type:
+                    continue
+            count += 1
+        return count
+
+    mock_game_state_instance.count_units.side_effect = count_units_side_effect
+
+    # Mock get_selected_entities to return the selected entities of self.entities
+    def get_selected_entities_side_effect():
+        return {
+            entity_id
+            for entity_id, components in mock_game_state_instance.entities.items()
+            if Selectable in components and components[Selectable].is_selected
+        }
+
+    mock_game_state_instance.get_selected_entities.side_effect = get_selected_entities_side_effect
+
     scene = GameScene(mock_game)
 
     # Attach mocked systems to the scene instance for assertion convenience
@@ -112,6 +145,22 @@ class TestGameSceneInit:
         assert game_scene.wander_system is not None
         assert game_scene.spawn_system is not None
 
+    def test_init_schedules_the_headless_simulation_then_presentation(self, game_scene):
+        simulation = HeadlessSimulation(SimpleMap(), create_initial_units=False)
+
+        def schedule(scheduler):
+            return [(system.name, system.interval, system.countdown) for system in scheduler.systems]
+
+        simulation_steps = schedule(simulation.scheduler)
+        scene_steps = schedule(game_scene.scheduler)
+        assert scene_steps[: len(simulation_steps)] == simulation_steps
+        assert [name for name, _, _ in scene_steps[len(simulation_steps) :]] == [
+            "SoundSystem",
+            "VisualEvents",
+            "FogOfWar",
+            "WinLossCheck",
+        ]
+
     def test_init_plays_music(self, game_scene, mock_game):
         mock_game.music_manager.play.assert_called_with("music/game_theme.ogg")
 
@@ -289,6 +338,38 @@ class TestGameSceneHandleEvent:
         game_scene.handle_event(event_f2)
         assert game_scene.cheats["god_mode"] is True
 
+    def test_handle_event_control_groups(self, game_scene, mocker):
+        game_scene.mock_chat_system.handle_event.return_value = False
+        event = MagicMock()
+        event.type = pygame.KEYDOWN
+        event.key = pygame.K_3
+
+        # Ctrl+3 assigns
+        mocker.patch("pygame.key.get_mods", return_value=pygame.KMOD_CTRL)
+        game_scene.handle_event(event)
+        game_scene.mock_selection_system.assign_control_group.assert_called_once_with(game_scene.game_state, 3, 1)
+
+        # 3 recalls
+        mocker.patch("pygame.key.get_mods", return_value=0)
+        game_scene.handle_event(event)
+        game_scene.mock_selection_system.recall_control_group.assert_called_once_with(game_scene.game_state, 3, False, 1)
+
+    def test_handle_event_ctrl_shift_digit_spawns_in_debug(self, game_scene, mocker):
+        game_scene.mock_chat_system.handle_event.return_value = False
+        mocker.patch("command_line_conflict.config.DEBUG", True)
+        mocker.patch("pygame.key.get_mods", return_value=pygame.KMOD_CTRL | pygame.KMOD_SHIFT)
+        mocker.patch("pygame.mouse.get_pos", return_value=(0, 0))
+        game_scene.camera.screen_to_grid = MagicMock(return_value=(5, 5))
+        create_chassis = mocker.patch("command_line_conflict.scenes.game.factories.create_chassis")
+        event = MagicMock()
+        event.type = pygame.KEYDOWN
+        event.key = pygame.K_2
+
+        game_scene.handle_event(event)
+
+        create_chassis.assert_called_once()
+        game_scene.mock_selection_system.assign_control_group.assert_not_called()
+
 
 class TestGameSceneUpdate:
     def test_update_paused(self, game_scene):
@@ -311,16 +392,42 @@ class TestGameSceneUpdate:
         game_scene.mock_chat_system.update.assert_called_with(game_scene.game_state, dt)
         game_scene.mock_health_system.update.assert_called_with(game_scene.game_state, dt)
         game_scene.mock_flee_system.update.assert_called_with(game_scene.game_state, dt)
-        game_scene.mock_ai_system.update.assert_called_with(game_scene.game_state)
+        game_scene.mock_ai_system.update.assert_called_with(game_scene.game_state, dt)
         game_scene.mock_wander_system.update.assert_called_with(game_scene.game_state, dt)
         game_scene.mock_combat_system.update.assert_called_with(game_scene.game_state, dt)
         game_scene.mock_confetti_system.update.assert_called_with(game_scene.game_state, dt)
         game_scene.mock_movement_system.update.assert_called_with(game_scene.game_state, dt)
         game_scene.mock_production_system.update.assert_called_with(game_scene.game_state, dt)
-        game_scene.mock_corpse_removal_system.update.assert_called_with(game_scene.game_state, dt)
         game_scene.mock_sound_system.update.assert_called_with(game_scene.game_state)
         game_scene.mock_spawn_system.update.assert_called_with(game_scene.game_state, dt)
 
+    def test_update_handles_simulation_events_in_the_same_tick(self, game_scene):
+        game_scene.paused = False
+        sound = {"type": "sound", "data": {"name": "spawn_unit"}}
+        text = {"type": "visual_effect", "subtype": "floating_text", "x": 1, "y": 2, "text": "+1", "color": (0, 255, 0)}
+        # SpawnSystem is the last simulation step; the presentation steps run after it.
+        game_scene.mock_spawn_system.update.side_effect = lambda game_state, dt: game_state.event_queue.extend([sound, text])
+        heard = []
+        game_scene.mock_sound_system.update.side_effect = lambda game_state: heard.extend(game_state.event_queue)
+
+        game_scene.update(0.1)
+
+        assert heard == [sound, text]
+        game_scene.ui_system.add_floating_text.assert_called_once_with(1, 2, "+1", (0, 255, 0), target_id=None)
+        assert game_scene.game_state.event_queue == []
+
+    def test_update_low_rate_systems_receive_accumulated_dt(self, game_scene):
+        game_scene.paused = False
+
+        # Corpse removal runs at 5 Hz with its first run 0.15s in.
+        for _ in range(20):
+            game_scene.update(0.01)
+
+        assert game_scene.mock_movement_system.update.call_count == 20
+        assert game_scene.mock_corpse_removal_system.update.call_count == 1
+        _, elapsed = game_scene.mock_corpse_removal_system.update.call_args.args
+        assert elapsed == pytest.approx(0.15, abs=0.011)
+
     def test_update_win_condition(self, game_scene, mock_game):
         # Setup no enemies
         game_scene.game_state.entities = {1: {Player: MagicMock(player_id=1, is_human=True), Health: MagicMock()}}
@@ -341,25 +448,15 @@ class TestGameSceneUpdate:
         mock_game.steam.unlock_achievement.assert_called_with("DEFEAT")
 
     def test_update_fog_of_war(self, game_scene):
-        # Setup units with vision
         game_scene.game_state.entities = {
-            1: {Position: MagicMock(x=10, y=10), Vision: MagicMock(vision_range=5), Player: MagicMock(is_human=True)},
-            2: {
-                Position: MagicMock(x=20, y=20),
-                Vision: MagicMock(vision_range=3),
-                Player: MagicMock(is_human=False),  # Should be ignored
-            },
+            1: {Position: MagicMock(x=10, y=10), Vision: MagicMock(vision_range=5), Player: MagicMock(player_id=1)},
         }
 
         game_scene.update(0.5)
 
-        # Verify fog of war updated with only human units
-        assert game_scene.mock_fog_of_war.update.call_count == 1
-        call_args = game_scene.mock_fog_of_war.update.call_args[0][0]
-        assert len(call_args) == 1
-        assert call_args[0].x == 10
-        assert call_args[0].y == 10
-        assert call_args[0].vision_range == 5
+        # The fog shows the current player's grid, maintained by the VisionSystem
+        game_scene.mock_game_state.get_visibility.assert_any_call(game_scene.current_player_id)
+        game_scene.mock_fog_of_war.sync.assert_called_once_with(game_scene.mock_game_state.get_visibility.return_value)
 
 
 class TestGameSceneDraw:
@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock
 
+import numpy as np
 import pygame
 
 from command_line_conflict import config
@@ -87,10 +88,9 @@ def test_right_click_enemy_issues_attack_command(mocker):
     # We need to check scene.ui_system.click_effects
     # The last effect should be red (255, 0, 0)
     assert len(scene.ui_system.click_effects) > 0
-    last_effect = scene.ui_system.click_effects[-1]
-    assert last_effect["color"] == (255, 0, 0), "Should show red ripple for attack command"
-    assert last_effect["x"] == 12
-    assert last_effect["y"] == 12
+    effects = scene.ui_system.click_effects
+    live = [(effects.data[slot], effects.x[slot], effects.y[slot]) for slot in np.flatnonzero(effects.alive)]
+    assert ((255, 0, 0), 12, 12) in live, "Should show red ripple for attack command"
 
 
 def test_right_click_ground_issues_move_command(mocker):
@@ -144,5 +144,6 @@ def test_right_click_ground_issues_move_command(mocker):
 
     # Verify visual feedback (Green ripple)
     assert len(scene.ui_system.click_effects) > 0
-    last_effect = scene.ui_system.click_effects[-1]
-    assert last_effect["color"] == (0, 255, 0), "Should show green ripple for move command"
+    effects = scene.ui_system.click_effects
+    live = [effects.data[slot] for slot in np.flatnonzero(effects.alive)]
+    assert (0, 255, 0) in live, "Should show green ripple for move command"
@@ -109,3 +109,25 @@ class TestMenuScene(unittest.TestCase):
         self.scene.handle_event(event)
 
         self.mock_game.scene_manager.switch_to.assert_called_with("editor")
+
+
+class TestMenuSceneDirtyRects(unittest.TestCase):
+    def setUp(self):
+        self.mock_game = MagicMock()
+        self.mock_game.screen.get_width.return_value = 800
+        self.mock_game.screen.get_height.return_value = 600
+        with patch("command_line_conflict.scenes.menu.SoundSystem"), patch(
+            "command_line_conflict.scenes.menu.CampaignManager"
+        ) as mock_campaign_manager:
+            mock_campaign_manager.return_value.completed_missions = []
+            self.scene = MenuScene(self.mock_game)
+
+    def test_draw_reports_options_from_this_and_last_frame(self):
+        first = self.scene.draw(MagicMock())
+        option_rects = [rect for rect, _ in self.scene.option_rects]
+        for rect in option_rects:
+            self.assertIn(rect, first)
+
+        second = self.scene.draw(MagicMock())
+        # Options as drawn now and as drawn last frame
+        self.assertEqual(len(second), 2 * len(first))
@@ -0,0 +1,140 @@
+# pylint: disable=redefined-outer-name
+from unittest.mock import MagicMock, Mock
+
+import pygame
+import pytest
+
+from command_line_conflict.engine import Game
+from command_line_conflict.scenes.editor import EditorScene
+from command_line_conflict.scenes.game import GameScene
+
+
+@pytest.fixture
+def display(mocker):
+    return Mock(flip=mocker.patch("pygame.display.flip"), update=mocker.patch("pygame.display.update"))
+
+
+@pytest.fixture
+def game(mocker, display):
+    mocker.patch("pygame.init")
+    mocker.patch("pygame.display.set_mode").return_value.get_size.return_value = (800, 600)
+    mocker.patch("pygame.mouse.get_pos", return_value=(400, 300))
+    mocker.patch("pygame.time.get_ticks", return_value=0)
+    game = Game()
+    game._present(None)  # Consume the initial full update
+    display.flip.reset_mock()
+    return game
+
+
+def _present_frame(game, scene, display):
+    """Draws a scene and presents it, returning what was drawn."""
+    display.flip.reset_mock()
+    display.update.reset_mock()
+    dirty_rects = scene.draw(game.screen)
+    game._present(dirty_rects)
+    return dirty_rects
+
+
+@pytest.fixture
+def editor(game, mocker):
+    mocker.patch("command_line_conflict.maps.base.Map.load_from_file", side_effect=FileNotFoundError)
+    mocker.patch("pygame.transform.scale")
+    game.screen.blit.return_value = pygame.Rect(10, 30, 300, 20)
+    scene = EditorScene(game)
+    scene.tooltip_font.render.return_value.get_rect.side_effect = lambda topleft: pygame.Rect(topleft, (50, 16))
+    return scene
+
+
+class TestEditorDirtyRects:
+    def test_idle_editor_presents_nothing(self, game, editor, display):
+        assert _present_frame(game, editor, display) is None
+        assert _present_frame(game, editor, display) == []
+
+        display.flip.assert_not_called()
+        display.update.assert_not_called()
+
+    def test_moving_tooltip_updates_only_its_areas(self, game, editor, display):
+        editor.hover_grid_pos = (3, 3)
+        _present_frame(game, editor, display)
+        editor.mouse_pos = (100, 100)
+
+        dirty_rects = _present_frame(game, editor, display)
+
+        assert dirty_rects == [pygame.Rect(11, 11, 58, 24), pygame.Rect(111, 111, 58, 24)]
+        display.update.assert_called_once_with(dirty_rects)
+        display.flip.assert_not_called()
+
+    def test_wall_toggle_updates_the_cell_and_status(self, game, editor, display, mocker):
+        _present_frame(game, editor, display)
+        editor.camera.screen_to_grid = mocker.Mock(return_value=(5, 5))
+        editor.handle_click((100, 100))
+
+        dirty_rects = _present_frame(game, editor, display)
+
+        assert dirty_rects == [pygame.Rect(100, 100, 21, 21), pygame.Rect(10, 30, 300, 20)]
+        display.update.assert_called_once_with(dirty_rects)
+
+    def test_camera_move_flips(self, game, editor, display):
+        _present_frame(game, editor, display)
+        editor.camera.move(1, 0)
+
+        assert _present_frame(game, editor, display) is None
+        display.flip.assert_called_once()
+
+
+@pytest.fixture
+def game_scene(game, mocker):
+    mocker.patch("command_line_conflict.scenes.game.GameState")
+    mocker.patch("command_line_conflict.scenes.game.FogOfWar")
+    mocker.patch("command_line_conflict.scenes.game.CampaignManager")
+    mocker.patch("command_line_conflict.scenes.game.RenderingSystem")
+    mocker.patch("command_line_conflict.scenes.game.MapRenderingSystem").return_value.draw.return_value = []
+    mocker.patch("command_line_conflict.scenes.game.ChatSystem").return_value.draw.return_value = []
+    mocker.patch("command_line_conflict.scenes.game.UISystem").return_value.draw.return_value = []
+    game.music_manager = MagicMock()
+    game.screen.get_rect.return_value = pygame.Rect(0, 0, 800, 600)
+    scene = GameScene(game)
+    scene.paused = True
+    scene.game_state.change_version = 0
+    return scene
+
+
+class TestGameSceneDirtyRects:
+    def test_paused_idle_game_presents_nothing(self, game, game_scene, display):
+        assert _present_frame(game, game_scene, display) is None
+        assert _present_frame(game, game_scene, display) == []
+
+        display.flip.assert_not_called()
+        display.update.assert_not_called()
+
+    def test_paused_game_updates_only_the_hovered_tooltip(self, game, game_scene, display, mocker):
+        _present_frame(game, game_scene, display)
+        game_scene.hovered_entity_id = 7
+        game_scene.ui_system.draw_tooltip.return_value = pygame.Rect(415, 315, 80, 40)
+
+        dirty_rects = _present_frame(game, game_scene, display)
+
+        assert dirty_rects == [pygame.Rect(415, 315, 80, 40)]
+        display.update.assert_called_once_with(dirty_rects)
+        display.flip.assert_not_called()
+
+    def test_selection_change_redraws_the_view(self, game, game_scene, display):
+        _present_frame(game, game_scene, display)
+        game_scene.game_state.change_version = 1
+
+        assert _present_frame(game, game_scene, display) == [pygame.Rect(0, 0, 800, 600)]
+        display.flip.assert_called_once()
+
+    def test_running_game_flips(self, game, game_scene, display):
+        game_scene.paused = False
+        _present_frame(game, game_scene, display)
+
+        assert _present_frame(game, game_scene, display) == [pygame.Rect(0, 0, 800, 600)]
+        display.flip.assert_called_once()
+
+    def test_camera_move_flips(self, game, game_scene, display):
+        _present_frame(game, game_scene, display)
+        game_scene.camera.move(0, 1)
+
+        assert _present_frame(game, game_scene, display) is None
+        display.flip.assert_called_once()
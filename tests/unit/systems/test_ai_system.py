@@ -100,3 +100,97 @@ class TestAISystem:
         ai_system.update(game_state)
 
         mock_find_closest_enemy.assert_not_called()
+
+    def _add_idle_unit(self, game_state, entity_id):
+        game_state.entities[entity_id] = {}
+        attack = Attack(attack_damage=10, attack_range=1, attack_speed=1)
+        game_state.add_component(entity_id, Player(1))
+        game_state.add_component(entity_id, attack)
+        game_state.add_component(entity_id, Vision(vision_range=5))
+        game_state.add_component(entity_id, Position(10, 10))
+        return attack
+
+    def test_idle_unit_thinks_once_per_interval(self, mocker):
+        mock_find_closest_enemy = mocker.patch(
+            "command_line_conflict.utils.targeting.Targeting.find_closest_enemy", return_value=None
+        )
+
+        game_state = GameState(Mock())
+        ai_system = AISystem(think_rate=10)
+        self._add_idle_unit(game_state, 1)
+
+        # 60 frames at 60 FPS is one second: ~10 searches instead of 60.
+        for _ in range(60):
+            ai_system.update(game_state, 1 / 60)
+
+        assert 10 <= mock_find_closest_enemy.call_count <= 11
+
+    def test_think_load_is_spread_across_frames(self, mocker):
+        calls_per_frame = []
+        mock_find_closest_enemy = mocker.patch(
+            "command_line_conflict.utils.targeting.Targeting.find_closest_enemy", return_value=None
+        )
+
+        game_state = GameState(Mock())
+        ai_system = AISystem(think_rate=6)
+        for entity_id in range(100):
+            self._add_idle_unit(game_state, entity_id)
+
+        # The first update thinks for every new unit; skip it.
+        ai_system.update(game_state, 1 / 60)
+        for _ in range(60):
+            mock_find_closest_enemy.reset_mock()
+            ai_system.update(game_state, 1 / 60)
+            calls_per_frame.append(mock_find_closest_enemy.call_count)
+
+        # 100 units at 6 Hz over 10 frames per interval is ~10 searches per frame.
+        assert max(calls_per_frame) <= 20
+        assert sum(calls_per_frame) >= 550
+
+    def test_zero_think_rate_disables_throttling(self, mocker):
+        mock_find_closest_enemy = mocker.patch(
+            "command_line_conflict.utils.targeting.Targeting.find_closest_enemy", return_value=None
+        )
+
+        game_state = GameState(Mock())
+        ai_system = AISystem(think_rate=0)
+        self._add_idle_unit(game_state, 1)
+
+        for _ in range(5):
+            ai_system.update(game_state, 1 / 60)
+
+        assert mock_find_closest_enemy.call_count == 5
+
+    def test_damage_wakes_unit_immediately(self, mocker):
+        from command_line_conflict.components.health import Health
+        from command_line_conflict.systems.combat_system import CombatSystem
+
+        mock_find_closest_enemy = mocker.patch(
+            "command_line_conflict.utils.targeting.Targeting.find_closest_enemy", return_value=None
+        )
+
+        game_state = GameState(Mock())
+        ai_system = AISystem(think_rate=1)
+        victim_attack = self._add_idle_unit(game_state, 1)
+        game_state.add_component(1, Health(hp=100, max_hp=100))
+        ai_system.update(game_state, 0.01)
+        assert mock_find_closest_enemy.call_count == 1
+
+        # Still inside the same think slot: no new search.
+        ai_system.update(game_state, 0.01)
+        assert mock_find_closest_enemy.call_count == 1
+
+        # The victim already has a target, so retaliation leaves it alone,
+        # but the hit must still wake it up for the next AI update.
+        victim_attack.attack_target = 99
+        game_state.entities[2] = {}
+        attacker_attack = Attack(attack_damage=10, attack_range=5, attack_speed=1)
+        attacker_attack.attack_target = 1
+        game_state.add_component(2, attacker_attack)
+        game_state.add_component(2, Position(11, 10))
+        CombatSystem().update(game_state, 0.01)
+        assert victim_attack.think_slot is None
+
+        victim_attack.attack_target = None
+        ai_system.update(game_state, 0.01)
+        assert mock_find_closest_enemy.call_count == 2
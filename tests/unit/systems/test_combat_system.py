@@ -1,5 +1,4 @@
 from command_line_conflict.components.attack import Attack
-from command_line_conflict.components.confetti import Confetti
 from command_line_conflict.components.health import Health
 from command_line_conflict.components.position import Position
 from command_line_conflict.game_state import GameState
@@ -26,12 +25,36 @@ def test_combat_system_creates_confetti_on_ranged_attack():
     combat_system.update(game_state, dt=1.0)
 
     # Assert
-    confetti_found = False
-    for entity_id, components in game_state.entities.items():
-        if components.get(Confetti):
-            confetti_found = True
-            confetti_pos = components.get(Position)
-            assert confetti_pos.x == 3
-            assert confetti_pos.y == 3
-            break
-    assert confetti_found, "Confetti should have been created"
+    assert len(game_state.particles) == 1, "Confetti should have been created"
+    assert (game_state.particles.x[0], game_state.particles.y[0]) == (3, 3)
+    # Confetti never becomes an entity
+    assert len(game_state.entities) == 2
+
+
+def test_attack_waits_for_cooldown_on_the_simulation_clock():
+    game_state = GameState(game_map=SimpleMap())
+    combat_system = CombatSystem()
+
+    attacker_id = game_state.create_entity()
+    game_state.add_component(attacker_id, Position(0, 0))
+    attack = Attack(attack_damage=10, attack_range=1, attack_speed=2.0)
+    game_state.add_component(attacker_id, attack)
+
+    target_id = game_state.create_entity()
+    game_state.add_component(target_id, Position(1, 0))
+    game_state.add_component(target_id, Health(hp=100, max_hp=100))
+    attack.attack_target = target_id
+    health = game_state.get_component(target_id, Health)
+
+    combat_system.update(game_state, dt=0.1)
+    assert health.hp == 90
+    assert attack.ready_at == 0.5
+
+    for _ in range(4):
+        game_state.timers.advance(0.1)
+        combat_system.update(game_state, dt=0.1)
+    assert health.hp == 90
+
+    game_state.timers.advance(0.1)
+    combat_system.update(game_state, dt=0.1)
+    assert health.hp == 80
@@ -1,7 +1,9 @@
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
+from command_line_conflict import config
 from command_line_conflict.components.attack import Attack
 from command_line_conflict.components.health import Health
 from command_line_conflict.components.movable import Movable
@@ -30,14 +32,17 @@ class TestFloatingText:
         with patch("pygame.time.get_ticks", return_value=1000):
             ui_system.add_floating_text(10, 20, "15", (255, 0, 0))
 
-        assert len(ui_system.floating_texts) == 1
-        item = ui_system.floating_texts[0]
-        assert item["x"] == 10
-        assert item["y"] == 20
-        assert item["text"] == "15"
-        assert item["color"] == (255, 0, 0)
-        assert item["start_time"] == 1000
-        assert item["duration"] == 1000
+        texts = ui_system.floating_texts
+        assert len(texts) == 1
+        (slot,) = np.flatnonzero(texts.alive)
+        assert texts.x[slot] == 10
+        assert texts.y[slot] == 20
+        text, color, surface = texts.data[slot]
+        assert text == "15"
+        assert color == (255, 0, 0)
+        assert surface is ui_system.small_font.render.return_value
+        assert texts.start_time[slot] == 1000
+        assert texts.duration_ms == 1000
 
     def test_draw_floating_texts_renders_and_expires(self, ui_system):
         # Setup: Add one active text and one that will expire
@@ -47,17 +52,46 @@ class TestFloatingText:
 
             # Manually expire the second one by setting start_time to 0
             # Current time will be 1500, so elapsed 1500 > 1000
-            ui_system.floating_texts[1]["start_time"] = 0
+            texts = ui_system.floating_texts
+            (expired,) = [slot for slot in np.flatnonzero(texts.alive) if texts.data[slot][0] == "Expired"]
+            texts.start_time[expired] = 0
 
         # Run draw with time = 1500 (500ms elapsed since add for "Active")
         with patch("pygame.time.get_ticks", return_value=1500):
             ui_system._draw_floating_texts()
 
-        assert len(ui_system.floating_texts) == 1
-        assert ui_system.floating_texts[0]["text"] == "Active"
+        texts = ui_system.floating_texts
+        assert len(texts) == 1
+        assert [texts.data[slot][0] for slot in texts.expire(1500)] == ["Active"]
 
-        # Verify blit was called for the active one
-        ui_system.screen.blit.assert_called()
+        # All texts of the frame are drawn in one call
+        ui_system.screen.blits.assert_called_once()
+        assert len(ui_system.screen.blits.call_args.args[0]) == 1
+
+    def test_damage_numbers_for_one_target_are_merged(self, ui_system):
+        with patch("pygame.time.get_ticks", return_value=1000):
+            ui_system.add_floating_text(10, 10, "10", (255, 50, 50), target_id=7)
+        with patch("pygame.time.get_ticks", return_value=1100):
+            ui_system.add_floating_text(10, 10, "5", (255, 50, 50), target_id=7)
+            ui_system.add_floating_text(12, 10, "5", (255, 50, 50), target_id=8)
+
+        texts = ui_system.floating_texts
+        assert len(texts) == 2
+        assert sorted(texts.data[slot][0] for slot in texts.expire(1100)) == ["15", "5"]
+
+        # Outside the window, a new number starts
+        with patch("pygame.time.get_ticks", return_value=1000 + config.DAMAGE_NUMBER_COALESCE_MS):
+            ui_system.add_floating_text(10, 10, "3", (255, 50, 50), target_id=7)
+        assert len(texts) == 3
+
+    def test_floating_text_pool_recycles_the_oldest(self, ui_system):
+        for i in range(config.MAX_FLOATING_TEXTS + 1):
+            with patch("pygame.time.get_ticks", return_value=1000 + i):
+                ui_system.add_floating_text(i, 0, f"t{i}")
+
+        texts = ui_system.floating_texts
+        assert len(texts) == config.MAX_FLOATING_TEXTS
+        assert texts.data[0][0] == f"t{config.MAX_FLOATING_TEXTS}"
 
     def test_combat_system_emits_visual_event(self, game_state):
         combat_system = CombatSystem()
@@ -91,3 +125,4 @@ class TestFloatingText:
         assert event["x"] == 11
         assert event["y"] == 10
         assert event["color"] == (255, 50, 50)
+        assert event["target"] == target
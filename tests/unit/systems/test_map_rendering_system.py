@@ -0,0 +1,226 @@
+from unittest.mock import Mock
+
+import pygame
+import pytest
+
+from command_line_conflict import config
+from command_line_conflict.camera import Camera
+from command_line_conflict.game_state import GameState
+from command_line_conflict.maps.base import Map
+from command_line_conflict.maps.simple_map import SimpleMap
+from command_line_conflict.systems.map_rendering_system import MapRenderingSystem
+
+
+@pytest.fixture(autouse=True)
+def mock_scale(mocker):
+    return mocker.patch("pygame.transform.scale")
+
+
+@pytest.fixture
+def screen():
+    screen = Mock()
+    screen.get_size.return_value = (800, 600)
+    return screen
+
+
+@pytest.fixture
+def surface_class(mocker):
+    return mocker.patch("pygame.Surface")
+
+
+def test_static_layer_is_blitted_at_camera_offset(screen, surface_class):
+    camera = Camera(x=2, y=3)
+    system = MapRenderingSystem(screen, Mock(), camera)
+
+    system.draw(SimpleMap())
+
+    grid_size = config.GRID_SIZE
+    screen.blit.assert_any_call(surface_class.return_value, (-2 * grid_size, -3 * grid_size))
+
+
+def test_static_layer_is_reused_between_frames(screen, surface_class):
+    game_map = SimpleMap()
+    game_map.add_wall(3, 3)
+    game_map.draw = Mock()
+    system = MapRenderingSystem(screen, Mock(), Camera())
+
+    system.draw(game_map)
+    system.draw(game_map)
+    system.draw(game_map)
+
+    game_map.draw.assert_called_once()
+    # Walls are baked into the layer, not drawn onto the screen.
+    assert game_map.draw.call_args.args[0] is surface_class.return_value
+
+
+def test_static_layer_rebuilds_on_wall_change(screen, surface_class):
+    game_map = SimpleMap()
+    game_map.draw = Mock()
+    system = MapRenderingSystem(screen, Mock(), Camera())
+
+    system.draw(game_map)
+    game_map.add_wall(5, 5)
+    system.draw(game_map)
+
+    assert game_map.draw.call_count == 2
+
+
+def test_static_layer_rebuilds_on_zoom_change(screen, surface_class):
+    game_map = SimpleMap()
+    camera = Camera()
+    system = MapRenderingSystem(screen, Mock(), camera)
+
+    system.draw(game_map)
+    camera.set_zoom(1.5)
+    system.draw(game_map)
+
+    grid_size = int(config.GRID_SIZE * 1.5)
+    layer_size = (game_map.width * grid_size + 1, game_map.height * grid_size + 1)
+    assert ((layer_size,),) in surface_class.call_args_list
+
+
+def test_large_map_blits_only_the_chunks_in_view(screen, surface_class):
+    game_map = Map(width=256, height=256)
+    game_map.draw = Mock()
+    camera = Camera(x=100, y=60)
+    system = MapRenderingSystem(screen, Mock(), camera)
+
+    system.draw(game_map)
+    system.draw(game_map)
+
+    # An 800x600 view at zoom 1.0 spans chunks (1..2, 0..1) of 64 cells.
+    assert list(system._chunks) == [(1, 0), (2, 0), (1, 1), (2, 1)]
+    assert game_map.draw.call_count == 4
+    chunk_px = MapRenderingSystem.CHUNK_CELLS * config.GRID_SIZE
+    screen.blit.assert_any_call(surface_class.return_value, (chunk_px - 100 * config.GRID_SIZE, -60 * config.GRID_SIZE))
+
+
+def test_least_recently_drawn_chunks_are_dropped_over_budget(screen, surface_class, mocker):
+    chunk_px = MapRenderingSystem.CHUNK_CELLS * config.GRID_SIZE
+    mocker.patch.object(config, "MAX_STATIC_MAP_LAYER_PIXELS", 2 * chunk_px * chunk_px)
+    surface_class.return_value.get_size.return_value = (chunk_px, chunk_px)
+    screen.get_size.return_value = (chunk_px, chunk_px)
+    game_map = Map(width=256, height=256)
+    camera = Camera()
+    system = MapRenderingSystem(screen, Mock(), camera)
+
+    for x in (0, 64, 128):
+        camera.x = x
+        system.draw(game_map)
+
+    assert list(system._chunks) == [(1, 0), (2, 0)]
+
+
+def test_ocean_is_a_single_blit(screen, surface_class, mocker):
+    mocker.patch("pygame.time.get_ticks", return_value=0)
+    system = MapRenderingSystem(screen, Mock(), Camera(x=-0.5, y=0))
+
+    system.draw(SimpleMap())
+
+    # The ocean sheet and the map layer
+    assert screen.blit.call_count == 2
+    screen.blit.assert_any_call(surface_class.return_value, (-config.GRID_SIZE // 2, 0))
+
+
+def test_ocean_sheets_follow_the_wave_pattern(screen, surface_class, mocker):
+    get_ticks = mocker.patch("pygame.time.get_ticks", return_value=0)
+    system = MapRenderingSystem(screen, Mock(), Camera())
+    wave_surface = mocker.patch.object(system, "_get_wave_surface")
+
+    system.draw(SimpleMap())
+    # Same frame: the cached sheet is reused
+    system.draw(SimpleMap())
+    assert wave_surface.call_count == 16
+    assert [c.args[0] for c in wave_surface.call_args_list[:4]] == [0, 1, 2, 3]
+
+    # Next animation frame shifts the pattern by one
+    get_ticks.return_value = 400
+    system.draw(SimpleMap())
+    assert wave_surface.call_count == 32
+    assert [c.args[0] for c in wave_surface.call_args_list[16:20]] == [1, 2, 3, 0]
+
+
+def test_ocean_sheets_reset_on_zoom_change(screen, surface_class, mocker):
+    mocker.patch("pygame.time.get_ticks", return_value=0)
+    camera = Camera()
+    system = MapRenderingSystem(screen, Mock(), camera)
+
+    system.draw(SimpleMap())
+    camera.set_zoom(0.5)
+    system.draw(SimpleMap())
+
+    assert list(system._ocean_sheets) == [0]
+    assert system._ocean_sheets_key[0] == int(config.GRID_SIZE * 0.5)
+
+
+def test_corpses_are_baked_into_the_static_layer(screen, surface_class, mock_scale, mocker):
+    mock_scale.side_effect = lambda surf, size: Mock()
+    mock_rect = mocker.patch("pygame.draw.rect")
+    game_state = GameState(SimpleMap())
+    system = MapRenderingSystem(screen, Mock(), Camera())
+    layer = surface_class.return_value
+
+    system.draw(game_state.map, game_state.corpses)
+    game_state.corpses.add(2, 3, "c")
+    system.draw(game_state.map, game_state.corpses)
+    system.draw(game_state.map, game_state.corpses)
+
+    grid_size = config.GRID_SIZE
+    glyph = system._get_corpse_glyph("c", 0, grid_size)
+    corpse_blits = [c for c in layer.blit.call_args_list if c.args[0] is glyph]
+    assert corpse_blits == [mocker.call(glyph, (2 * grid_size, 3 * grid_size))]
+    # Nothing on the screen itself but the ocean and the layer
+    assert all(c.args[0] is not glyph for c in screen.blit.call_args_list)
+    rect_calls = mock_rect.call_count
+
+    # Fading redraws the cell's floor under the corpse's next glyph
+    game_state.corpses.update(2.5, lifetime=5.0)
+    system.draw(game_state.map, game_state.corpses)
+    assert mock_rect.call_count == rect_calls + 1
+    assert mock_rect.call_args.args[2] == pygame.Rect(2 * grid_size, 3 * grid_size, grid_size, grid_size)
+    faded = system._get_corpse_glyph("c", 2, grid_size)
+    faded.set_alpha.assert_called_with(127)
+    layer.blit.assert_called_with(faded, (2 * grid_size, 3 * grid_size))
+
+
+def test_expired_corpses_leave_bare_floor(screen, surface_class, mocker):
+    mock_rect = mocker.patch("pygame.draw.rect")
+    game_state = GameState(SimpleMap())
+    system = MapRenderingSystem(screen, Mock(), Camera())
+    game_state.corpses.add(2, 3, "c")
+    system.draw(game_state.map, game_state.corpses)
+    blits = surface_class.return_value.blit.call_count
+
+    game_state.corpses.update(5.0, lifetime=5.0)
+    system.draw(game_state.map, game_state.corpses)
+
+    grid_size = config.GRID_SIZE
+    assert mock_rect.call_args.args[2] == pygame.Rect(2 * grid_size, 3 * grid_size, grid_size, grid_size)
+    assert surface_class.return_value.blit.call_count == blits
+    assert system._baked_corpses == {}
+
+
+def test_corpses_are_restamped_after_a_rebuild(screen, surface_class):
+    game_state = GameState(SimpleMap())
+    system = MapRenderingSystem(screen, Mock(), Camera())
+    game_state.corpses.add(2, 3, "c")
+    system.draw(game_state.map, game_state.corpses)
+
+    game_state.map.add_wall(10, 10)
+    surface_class.return_value.blit.reset_mock()
+    system.draw(game_state.map, game_state.corpses)
+
+    glyph = system._get_corpse_glyph("c", 0, config.GRID_SIZE)
+    surface_class.return_value.blit.assert_any_call(glyph, (2 * config.GRID_SIZE, 3 * config.GRID_SIZE))
+
+
+def test_new_wave_frame_reports_only_the_ocean(screen, surface_class, mocker):
+    get_ticks = mocker.patch("pygame.time.get_ticks", return_value=0)
+    game_map = SimpleMap()
+    system = MapRenderingSystem(screen, Mock(), Camera(x=-5, y=0))
+    system.draw(game_map)
+
+    assert system.draw(game_map) == []
+    get_ticks.return_value = 400
+    # The map covers the screen right of its 5 columns of ocean.
+    assert system.draw(game_map) == [pygame.Rect(0, 0, 5 * config.GRID_SIZE, 600)]
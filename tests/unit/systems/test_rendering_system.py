@@ -1,8 +1,12 @@
 from unittest.mock import Mock, call, patch
 
+import pygame
+
 from command_line_conflict import config
 from command_line_conflict.camera import Camera
+from command_line_conflict.components.health import Health
 from command_line_conflict.components.movable import Movable
+from command_line_conflict.components.player import Player
 from command_line_conflict.components.position import Position
 from command_line_conflict.components.renderable import Renderable
 from command_line_conflict.game_state import GameState
@@ -93,5 +97,152 @@ def test_draw_entities_are_affected_by_camera(mock_scale):
     grid_size = int(config.GRID_SIZE * camera.zoom)
     mock_scale.assert_any_call(mock_surface, (grid_size, grid_size))
 
-    # Check that screen.blit was called with the transformed coordinates
-    mock_screen.blit.assert_any_call(mock_scaled_surface, (expected_x, expected_y))
+    # Check that the glyph was drawn from the atlas at the transformed coordinates
+    page, area = rendering_system.glyph_atlas.get("E", (255, 255, 255), grid_size)
+    page.blit.assert_any_call(mock_scaled_surface, area.topleft, special_flags=pygame.BLEND_RGBA_MAX)
+    mock_screen.blits.assert_called_once_with([(page, (expected_x, expected_y), area)], doreturn=False)
+
+
+@patch("pygame.transform.scale")
+def test_draw_skips_enemies_the_viewer_cannot_see(mock_scale):
+    mock_screen = Mock()
+    mock_screen.get_width.return_value = 800
+    mock_screen.get_height.return_value = 600
+    rendering_system = RenderingSystem(screen=mock_screen, font=Mock(), camera=Camera())
+
+    mock_map = Mock()
+    mock_map.width = 40
+    mock_map.height = 30
+    game_state = GameState(game_map=mock_map)
+    for x, player_id in ((2, 1), (3, 2), (20, 2)):
+        entity_id = game_state.create_entity()
+        game_state.add_component(entity_id, Position(x=x, y=2))
+        game_state.add_component(entity_id, Renderable(icon="E"))
+        game_state.add_component(entity_id, Player(player_id))
+    game_state.get_visibility(1).update([(2, 2, 3)])
+
+    rendering_system.draw(game_state, paused=False, viewer_id=1)
+    # The enemy at (20, 2) is under fog
+    assert [dest for _, dest, _ in mock_screen.blits.call_args.args[0]] == [
+        (2 * config.GRID_SIZE, 2 * config.GRID_SIZE),
+        (3 * config.GRID_SIZE, 2 * config.GRID_SIZE),
+    ]
+
+    rendering_system.draw(game_state, paused=False)
+    assert len(mock_screen.blits.call_args.args[0]) == 3
+
+
+@patch("pygame.draw.rect")
+@patch("pygame.transform.scale")
+def test_draw_shows_only_last_seen_buildings_on_explored_cells(mock_scale, mock_rect):
+    mock_screen = Mock()
+    mock_screen.get_width.return_value = 800
+    mock_screen.get_height.return_value = 600
+    rendering_system = RenderingSystem(screen=mock_screen, font=Mock(), camera=Camera())
+
+    mock_map = Mock()
+    mock_map.width = 40
+    mock_map.height = 30
+    game_state = GameState(game_map=mock_map)
+    building = game_state.create_entity()
+    game_state.add_component(building, Position(x=5, y=5))
+    game_state.add_component(building, Renderable(icon="F"))
+    game_state.add_component(building, Health(hp=10, max_hp=20))
+    unit = game_state.create_entity()
+    game_state.add_component(unit, Position(x=6, y=5))
+    game_state.add_component(unit, Renderable(icon="R"))
+    game_state.add_component(unit, Movable(speed=1.0))
+
+    visibility = game_state.get_visibility(1)
+    visibility.update([(5, 5, 2)])
+    visibility.update([(30, 20, 2)])
+    assert visibility.grid[5][5] == visibility.EXPLORED
+
+    rendering_system.draw(game_state, paused=False, viewer_id=1)
+
+    assert [dest for _, dest, _ in mock_screen.blits.call_args.args[0]] == [(5 * config.GRID_SIZE, 5 * config.GRID_SIZE)]
+    mock_rect.assert_not_called()
+
+
+@patch("pygame.transform.scale")
+def test_draw_particles_only_on_visible_cells(mock_scale):
+    mock_screen = Mock()
+    mock_screen.get_width.return_value = 800
+    mock_screen.get_height.return_value = 600
+    rendering_system = RenderingSystem(screen=mock_screen, font=Mock(), camera=Camera())
+
+    mock_map = Mock()
+    mock_map.width = 40
+    mock_map.height = 30
+    game_state = GameState(game_map=mock_map)
+    game_state.particles.emit(2.5, 2, lifetime=1.0)
+    game_state.particles.emit(20, 2, lifetime=1.0)
+    game_state.get_visibility(1).update([(2, 2, 3)])
+
+    rendering_system.draw(game_state, paused=False, viewer_id=1)
+    # The particle at (20, 2) is under fog
+    blits = mock_screen.blits.call_args.args[0]
+    assert [dest for _, dest, _ in blits] == [(2 * config.GRID_SIZE, 2 * config.GRID_SIZE)]
+    colors = RenderingSystem.CONFETTI_COLORS
+    page, area = rendering_system.glyph_atlas.get(RenderingSystem.CONFETTI_ICON, colors[0], config.GRID_SIZE)
+    assert blits[0] == (page, (2 * config.GRID_SIZE, 2 * config.GRID_SIZE), area)
+
+    rendering_system.draw(game_state, paused=False)
+    assert len(mock_screen.blits.call_args.args[0]) == 2
+
+
+@patch("pygame.transform.scale")
+def test_draw_scrap_under_the_entities_on_seen_cells(mock_scale):
+    mock_screen = Mock()
+    mock_screen.get_width.return_value = 800
+    mock_screen.get_height.return_value = 600
+    rendering_system = RenderingSystem(screen=mock_screen, font=Mock(), camera=Camera())
+
+    mock_map = Mock()
+    mock_map.width = 40
+    mock_map.height = 30
+    game_state = GameState(game_map=mock_map)
+    entity_id = game_state.create_entity()
+    game_state.add_component(entity_id, Position(x=2, y=2))
+    game_state.add_component(entity_id, Renderable(icon="E"))
+    game_state.add_scrap(2, 2, 50)
+    game_state.add_scrap(20, 2, 50)
+    game_state.get_visibility(1).update([(2, 2, 3)])
+
+    rendering_system.draw(game_state, paused=False, viewer_id=1)
+
+    scrap_page, scrap_area = rendering_system.glyph_atlas.get("$", RenderingSystem.SCRAP_COLOR, config.GRID_SIZE)
+    blits = mock_screen.blits.call_args.args[0]
+    # The pile at (20, 2) is under fog, the other one is drawn first
+    assert len(blits) == 2
+    assert blits[0] == (scrap_page, (2 * config.GRID_SIZE, 2 * config.GRID_SIZE), scrap_area)
+
+
+class _UnscannableScrap(dict):
+    def __iter__(self):
+        raise AssertionError("scrap piles were scanned")
+
+
+@patch("pygame.transform.scale")
+def test_draw_walks_the_view_when_scrap_outnumbers_its_cells(mock_scale):
+    mock_screen = Mock()
+    mock_screen.get_width.return_value = 200
+    mock_screen.get_height.return_value = 100
+    rendering_system = RenderingSystem(screen=mock_screen, font=Mock(), camera=Camera())
+
+    mock_map = Mock()
+    mock_map.width = 100
+    mock_map.height = 100
+    game_state = GameState(game_map=mock_map)
+    for x in range(100):
+        for y in range(100):
+            game_state.add_scrap(x, y, 1)
+    game_state.scrap = _UnscannableScrap(game_state.scrap)
+    game_state.get_visibility(1).update([(0, 0, 200)])
+
+    rendering_system.draw(game_state, paused=False, viewer_id=1)
+
+    # The view covers 10x5 tiles plus a margin of one on the right and bottom
+    # (the top and left are clipped to the map)
+    blits = mock_screen.blits.call_args.args[0]
+    assert len(blits) == 12 * 7
@@ -0,0 +1,15 @@
+from command_line_conflict.game_state import GameState
+from command_line_conflict.maps.simple_map import SimpleMap
+from command_line_conflict.systems.spawn_system import SpawnSystem
+
+
+def test_spawns_once_per_interval_of_simulation_time(mocker):
+    game_state = GameState(SimpleMap())
+    system = SpawnSystem(spawn_interval=1.0)
+    spawn = mocker.patch.object(system, "spawn_wildlife")
+
+    for _ in range(25):
+        game_state.timers.advance(0.1)
+        system.update(game_state, 0.1)
+
+    assert spawn.call_count == 2
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 import pygame
 import pytest
 
+from command_line_conflict import config
 from command_line_conflict.camera import Camera
 from command_line_conflict.components.attack import Attack
 from command_line_conflict.components.detection import Detection
@@ -100,3 +101,63 @@ def test_draw_observer_detection_range(mock_draw_rect, ui_system, game_state):
 
     # Optimization check
     assert mock_draw_rect.call_count < 20
+
+
+def _select(game_state, entity_id, x, y, attack_range=0, detection_range=0):
+    game_state.entities[entity_id] = {}
+    game_state.add_component(entity_id, Position(x, y))
+    if attack_range:
+        game_state.add_component(entity_id, Attack(attack_damage=1, attack_range=attack_range, attack_speed=1))
+    if detection_range:
+        game_state.add_component(entity_id, Detection(detection_range=detection_range))
+    selectable = Selectable()
+    selectable.is_selected = True
+    game_state.add_component(entity_id, selectable)
+
+
+def test_range_overlay_is_rebuilt_only_when_selection_cells_change(ui_system, mocker):
+    game_state = GameState(MagicMock(spec=Map))
+    _select(game_state, 1, 10, 10, attack_range=3)
+    _select(game_state, 2, 12, 10, attack_range=2)
+    build = mocker.patch.object(UISystem, "_build_range_overlay", return_value=(MagicMock(), None, (7, 7)))
+
+    ui_system.draw(game_state, paused=False)
+    # Moving within a tile keeps the overlay
+    game_state.update_entity_position(1, 10.6, 10.2)
+    ui_system.draw(game_state, paused=False)
+    assert build.call_count == 1
+    ui_system.screen.blit.assert_any_call(build.return_value[0], (7 * config.GRID_SIZE, 7 * config.GRID_SIZE))
+
+    game_state.update_entity_position(1, 11, 10)
+    ui_system.draw(game_state, paused=False)
+    assert build.call_count == 2
+
+    game_state.get_component(2, Selectable).is_selected = False
+    ui_system.draw(game_state, paused=False)
+    assert build.call_count == 3
+
+
+def test_build_range_overlay_covers_the_union_of_circles(mocker):
+    mocker.patch("pygame.Surface", new=pygame.surface.Surface)
+
+    overlay, mask, origin = UISystem._build_range_overlay(frozenset({(10, 10, 2), (13, 10, 1)}), 4, (255, 0, 0, 30))
+
+    assert origin == (8, 8)
+    assert mask.shape == (5, 7)
+    assert overlay.get_size() == (7 * 4, 5 * 4)
+    # Tile (10, 10) is covered, tile (8, 8) is outside both circles
+    assert overlay.get_at((2 * 4 + 1, 2 * 4 + 1)) == (255, 0, 0, 30)
+    assert overlay.get_at((1, 1)).a == 0
+    assert int(mask.sum()) == 13 + 5 - 1
+
+
+def test_range_overlay_falls_back_to_tiles_when_too_large(ui_system, mocker):
+    mocker.patch("command_line_conflict.config.MAX_STATIC_MAP_LAYER_PIXELS", 0)
+    game_state = GameState(MagicMock(spec=Map))
+    _select(game_state, 1, 10, 10, detection_range=1)
+    range_surface = mocker.patch.object(UISystem, "_get_range_surface")
+
+    ui_system._draw_aggregate_detection_range(game_state, [1])
+
+    assert ui_system.screen.blit.call_count == 5
+    ui_system.screen.blit.assert_any_call(range_surface.return_value, (10 * config.GRID_SIZE, 10 * config.GRID_SIZE))
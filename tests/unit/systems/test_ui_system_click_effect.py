@@ -31,7 +31,7 @@ def test_click_effect(mock_get_ticks, mock_draw_circle, ui_system):
 
     # Assert added
     assert len(ui_system.click_effects) == 1
-    assert ui_system.click_effects[0]["x"] == 10
+    assert ui_system.click_effects.x[ui_system.click_effects.alive].tolist() == [10]
 
     # Draw (simulate time passing)
     mock_get_ticks.return_value = 1100  # 100ms passed
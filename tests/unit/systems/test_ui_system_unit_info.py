@@ -47,6 +47,8 @@ def test_draw_unit_name_with_identity(ui_system, game_state):
         }
     }
     game_state.component_index = {Selectable: {1}}
+    # Built by hand, so the selection is tracked directly
+    selectable.track(game_state, 1)
 
     # Mock the font.render method to capture what is being rendered
     ui_system.font.render = MagicMock()
@@ -81,6 +83,7 @@ def test_draw_unit_name_fallback_to_icon(ui_system, game_state):
         }
     }
     game_state.component_index = {Selectable: {1}}
+    selectable.track(game_state, 1)
 
     ui_system.font.render = MagicMock()
     ui_system.draw(game_state, paused=False)
@@ -117,6 +120,7 @@ def test_draw_rover_factory_production_info(ui_system, game_state):
         }
     }
     game_state.component_index = {Selectable: {1}, UnitIdentity: {1}}
+    selectable.track(game_state, 1)
 
     # Mock the fonts
     ui_system.font.render = MagicMock()
@@ -155,6 +159,7 @@ def test_draw_arachnotron_factory_production_info(ui_system, game_state):
         }
     }
     game_state.component_index = {Selectable: {factory_id}, UnitIdentity: {factory_id}}
+    selectable.track(game_state, factory_id)
 
     # Also add an adjacent friendly Rover
     rover_id = 2
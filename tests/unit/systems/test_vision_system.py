@@ -0,0 +1,101 @@
+from unittest.mock import Mock
+
+from command_line_conflict.components.player import Player
+from command_line_conflict.components.position import Position
+from command_line_conflict.components.vision import Vision
+from command_line_conflict.game_state import GameState
+from command_line_conflict.systems.vision_system import VisionSystem
+
+
+def _game_state():
+    mock_map = Mock()
+    mock_map.width = 30
+    mock_map.height = 30
+    return GameState(game_map=mock_map)
+
+
+def _add_unit(game_state, x, y, player_id, vision_range=2):
+    entity_id = game_state.create_entity()
+    game_state.add_component(entity_id, Position(x, y))
+    game_state.add_component(entity_id, Player(player_id))
+    game_state.add_component(entity_id, Vision(vision_range))
+    return entity_id
+
+
+def test_vision_system_builds_a_grid_per_player():
+    game_state = _game_state()
+    _add_unit(game_state, 5, 5, player_id=1)
+    _add_unit(game_state, 20, 20, player_id=2)
+
+    VisionSystem().update(game_state, 0.1)
+
+    assert game_state.get_visibility(1).is_visible(5, 5)
+    assert not game_state.get_visibility(1).is_visible(20, 20)
+    assert game_state.get_visibility(2).is_visible(20, 20)
+    assert not game_state.get_visibility(2).is_visible(5, 5)
+
+
+def test_vision_system_follows_movement_and_death():
+    game_state = _game_state()
+    system = VisionSystem()
+    entity_id = _add_unit(game_state, 5, 5, player_id=1)
+    system.update(game_state, 0.1)
+
+    game_state.update_entity_position(entity_id, 10, 5)
+    system.update(game_state, 0.1)
+    visibility = game_state.get_visibility(1)
+    assert visibility.is_visible(10, 5)
+    assert visibility.grid[5][5] == visibility.EXPLORED
+
+    game_state.remove_entity(entity_id)
+    system.update(game_state, 0.1)
+    assert not visibility.is_visible(10, 5)
+
+
+def test_vision_system_follows_ownership_changes():
+    game_state = _game_state()
+    system = VisionSystem()
+    entity_id = _add_unit(game_state, 5, 5, player_id=1)
+    system.update(game_state, 0.1)
+
+    game_state.get_component(entity_id, Player).player_id = 2
+    system.update(game_state, 0.1)
+
+    assert not game_state.get_visibility(1).is_visible(5, 5)
+    assert game_state.get_visibility(2).is_visible(5, 5)
+
+
+def test_vision_system_only_restamps_changed_units(mocker):
+    game_state = _game_state()
+    system = VisionSystem()
+    moving_id = _add_unit(game_state, 5, 5, player_id=1)
+    _add_unit(game_state, 20, 20, player_id=1)
+    system.update(game_state, 0.1)
+    move_sources = mocker.spy(game_state.get_visibility(1), "move_sources")
+
+    # Moving within a cell changes nothing.
+    game_state.update_entity_position(moving_id, 5.5, 5.5)
+    system.update(game_state, 0.1)
+    move_sources.assert_not_called()
+
+    game_state.update_entity_position(moving_id, 6.0, 5.5)
+    system.update(game_state, 0.1)
+    move_sources.assert_called_once_with([(5, 5, 2)], [(6, 5, 2)])
+    assert game_state.get_visibility(1).is_visible(8, 5)
+
+
+def test_vision_system_rebuilds_when_the_change_records_are_forgotten(mocker):
+    mocker.patch("command_line_conflict.config.MAX_CHANGE_RECORDS", 2)
+    game_state = _game_state()
+    system = VisionSystem()
+    moving_id = _add_unit(game_state, 5, 5, player_id=1)
+    system.update(game_state, 0.1)
+
+    game_state.update_entity_position(moving_id, 10, 5)
+    for x in range(3):
+        _add_unit(game_state, 20 + x, 20, player_id=2)
+    system.update(game_state, 0.1)
+
+    assert game_state.get_visibility(1).is_visible(10, 5)
+    assert not game_state.get_visibility(1).is_visible(5, 5)
+    assert game_state.get_visibility(2).is_visible(22, 20)
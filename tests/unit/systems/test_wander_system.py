@@ -0,0 +1,97 @@
+from command_line_conflict.components.movable import Movable
+from command_line_conflict.components.position import Position
+from command_line_conflict.components.wander import Wander
+from command_line_conflict.game_state import GameState
+from command_line_conflict.maps.simple_map import SimpleMap
+from command_line_conflict.systems.wander_system import WanderSystem
+
+
+def _add_wanderer(game_state, move_interval=1.0):
+    entity_id = game_state.create_entity()
+    game_state.add_component(entity_id, Position(10, 10))
+    game_state.add_component(entity_id, Movable(speed=1))
+    game_state.add_component(entity_id, Wander(wander_radius=3, move_interval=move_interval))
+    return entity_id
+
+
+def _run(game_state, system, seconds, dt=0.2):
+    for _ in range(round(seconds / dt)):
+        game_state.timers.advance(dt)
+        system.update(game_state, dt)
+
+
+def test_wanderer_rests_for_its_interval_before_moving(mocker):
+    game_state = GameState(SimpleMap())
+    mocker.patch.object(game_state.map, "find_path", return_value=[(11, 10)])
+    system = WanderSystem()
+    entity_id = _add_wanderer(game_state)
+    movable = game_state.get_component(entity_id, Movable)
+
+    _run(game_state, system, 0.8)
+    assert movable.path == []
+
+    _run(game_state, system, 1.2)
+    assert movable.path == [(11, 10)]
+    assert (movable.target_x, movable.target_y) == (11, 10)
+
+
+def test_only_wanderers_whose_timer_expired_are_visited(mocker):
+    game_state = GameState(SimpleMap())
+    find_path = mocker.patch.object(game_state.map, "find_path", return_value=[(11, 10)])
+    system = WanderSystem()
+    _add_wanderer(game_state, move_interval=1.0)
+    _add_wanderer(game_state, move_interval=5.0)
+
+    _run(game_state, system, 1.2)
+    assert find_path.call_count == 1
+
+
+def test_moving_wanderer_waits_another_interval(mocker):
+    game_state = GameState(SimpleMap())
+    find_path = mocker.patch.object(game_state.map, "find_path", return_value=[(11, 10)])
+    system = WanderSystem()
+    entity_id = _add_wanderer(game_state)
+    game_state.get_component(entity_id, Movable).path = [(12, 10)]
+
+    _run(game_state, system, 1.6)
+    find_path.assert_not_called()
+
+
+def test_unreachable_target_is_retried_soon(mocker):
+    game_state = GameState(SimpleMap())
+    find_path = mocker.patch.object(game_state.map, "find_path", return_value=[])
+    system = WanderSystem()
+    _add_wanderer(game_state)
+
+    _run(game_state, system, 1.2)
+    calls = find_path.call_count
+    _run(game_state, system, WanderSystem.RETRY_DELAY * 2)
+    assert find_path.call_count > calls
+
+
+def test_removed_wanderer_is_forgotten(mocker):
+    game_state = GameState(SimpleMap())
+    find_path = mocker.patch.object(game_state.map, "find_path", return_value=[(11, 10)])
+    system = WanderSystem()
+    entity_id = _add_wanderer(game_state)
+    _run(game_state, system, 0.2)
+
+    game_state.remove_entity(entity_id)
+    _run(game_state, system, 2.0)
+
+    find_path.assert_not_called()
+    assert entity_id not in game_state.timers.scheduled("wander")
+
+
+def test_wander_timer_follows_the_component(mocker):
+    game_state = GameState(SimpleMap())
+    entity_id = _add_wanderer(game_state)
+    assert entity_id in game_state.timers.scheduled("wander")
+
+    game_state.remove_component(entity_id, Wander)
+    assert entity_id not in game_state.timers.scheduled("wander")
+
+    # The system never scans the wanderers for missing timers.
+    get_entities = mocker.spy(game_state, "get_entities_with_component")
+    _run(game_state, WanderSystem(), 2.0)
+    get_entities.assert_not_called()
@@ -0,0 +1,124 @@
+from unittest.mock import Mock
+
+from command_line_conflict.components.health import Health
+from command_line_conflict.components.movable import Movable
+from command_line_conflict.components.position import Position
+from command_line_conflict.game_state import GameState
+from command_line_conflict.maps.simple_map import SimpleMap
+from command_line_conflict.systems.movement_system import MovementSystem
+
+
+def test_health_is_active_while_dead_or_regenerating(add_entity):
+    game_state = GameState(Mock())
+    health = Health(hp=10, max_hp=10, health_regen_rate=1.0)
+    entity_id = add_entity(game_state, health)
+    active = game_state.get_active_entities("health")
+    assert entity_id not in active
+
+    health.hp -= 3
+    assert entity_id in active
+    health.hp = 10
+    assert entity_id not in active
+
+
+def test_damaged_health_without_regeneration_is_only_active_once_dead(add_entity):
+    game_state = GameState(Mock())
+    health = Health(hp=10, max_hp=10)
+    entity_id = add_entity(game_state, health)
+    active = game_state.get_active_entities("health")
+
+    health.hp -= 3
+    assert entity_id not in active
+    health.hp -= 7
+    assert entity_id in active
+
+
+def test_regeneration_and_max_hp_changes_update_the_set(add_entity):
+    game_state = GameState(Mock())
+    health = Health(hp=5, max_hp=10)
+    entity_id = add_entity(game_state, health)
+    active = game_state.get_active_entities("health")
+    assert entity_id not in active
+
+    health.health_regen_rate = 1.0
+    assert entity_id in active
+
+    health.max_hp = 5
+    assert entity_id not in active
+
+
+def test_components_created_active_join_the_set_when_added(add_entity):
+    game_state = GameState(Mock())
+    entity_id = add_entity(game_state, Health(hp=0, max_hp=10))
+
+    assert game_state.get_active_entities("health") == {entity_id}
+
+
+def test_movable_is_active_with_a_target_or_a_path(add_entity):
+    game_state = GameState(Mock())
+    movable = Movable(speed=1)
+    entity_id = add_entity(game_state, Position(0, 0), movable)
+    active = game_state.get_active_entities("movement")
+    assert entity_id not in active
+
+    movable.target_x = 3
+    assert entity_id not in active
+    movable.target_y = 4
+    assert entity_id in active
+    movable.target_x = movable.target_y = None
+    assert entity_id not in active
+
+    movable.path = [(1, 0)]
+    assert entity_id in active
+
+
+def test_removed_components_and_entities_leave_the_sets(add_entity):
+    game_state = GameState(Mock())
+    health = Health(hp=0, max_hp=10)
+    movable = Movable(speed=1)
+    movable.path = [(1, 0)]
+    entity_id = add_entity(game_state, Position(0, 0), health, movable)
+
+    game_state.remove_component(entity_id, Movable)
+    assert not game_state.get_active_entities("movement")
+    game_state.remove_entity(entity_id)
+    assert not game_state.get_active_entities("health")
+
+    # Detached components no longer report to the sets.
+    health.hp = -5
+    movable.path = [(2, 0)]
+    assert not game_state.get_active_entities("health")
+    assert not game_state.get_active_entities("movement")
+
+
+def test_replaced_component_stops_reporting(add_entity):
+    game_state = GameState(Mock())
+    old_health = Health(hp=0, max_hp=10)
+    entity_id = add_entity(game_state, old_health)
+
+    game_state.add_component(entity_id, Health(hp=10, max_hp=10))
+    assert not game_state.get_active_entities("health")
+    old_health.hp = -1
+    assert not game_state.get_active_entities("health")
+
+
+def test_movement_system_drops_units_that_arrived(add_entity):
+    game_state = GameState(SimpleMap())
+    system = MovementSystem()
+    entity_id = add_entity(game_state, Position(5, 5), Movable(speed=10))
+    system.set_target(game_state, entity_id, 7, 5)
+    active = game_state.get_active_entities("movement")
+    assert entity_id in active
+
+    for _ in range(10):
+        system.update(game_state, 0.1)
+
+    movable = game_state.get_component(entity_id, Movable)
+    assert game_state.get_component(entity_id, Position).x == 7
+    assert movable.arrived
+    assert entity_id not in active
+
+    # A new target clears the arrival through the component.
+    movable.target_x = 9
+    assert not movable.arrived
+    assert entity_id in active
@@ -0,0 +1,55 @@
+from unittest.mock import Mock
+
+from command_line_conflict import factories
+from command_line_conflict.components.health import Health
+from command_line_conflict.components.player import Player
+from command_line_conflict.game_state import GameState
+from command_line_conflict.maps.simple_map import SimpleMap
+from command_line_conflict.systems.health_system import HealthSystem
+
+
+def test_factories_count_their_units():
+    game_state = GameState(SimpleMap())
+    factories.create_chassis(game_state, 1, 1, player_id=1, is_human=True)
+    factories.create_chassis(game_state, 2, 1, player_id=1, is_human=True)
+    factories.create_rover(game_state, 3, 1, player_id=2, is_human=False)
+
+    assert game_state.count_units(player_id=1, unit_type="chassis") == 2
+    assert game_state.count_units(player_id=2, unit_type="chassis") == 0
+    assert game_state.count_units(is_human=False) == 1
+    assert game_state.count_units() == 3
+
+
+def test_only_entities_with_player_and_health_are_units():
+    game_state = GameState(Mock())
+    entity_id = game_state.create_entity()
+    game_state.add_component(entity_id, Player(1))
+    assert game_state.count_units() == 0
+
+    game_state.add_component(entity_id, Health(hp=10, max_hp=10))
+    assert game_state.count_units(player_id=1, unit_type=None) == 1
+
+    game_state.remove_component(entity_id, Health)
+    assert game_state.count_units() == 0
+    assert game_state.census == {}
+
+
+def test_ownership_changes_move_the_unit():
+    game_state = GameState(SimpleMap())
+    rover_id = factories.create_rover(game_state, 3, 1, player_id=2, is_human=False)
+
+    game_state.get_component(rover_id, Player).player_id = 1
+
+    assert game_state.count_units(player_id=2) == 0
+    assert game_state.count_units(player_id=1, unit_type="rover") == 1
+
+
+def test_dead_units_leave_the_census():
+    game_state = GameState(SimpleMap())
+    rover_id = factories.create_rover(game_state, 3, 1, player_id=2, is_human=False)
+    factories.create_rover(game_state, 5, 1, player_id=2, is_human=False)
+
+    game_state.get_component(rover_id, Health).hp = 0
+    HealthSystem().update(game_state, 0.1)
+
+    assert game_state.count_units(player_id=2, unit_type="rover") == 1
@@ -0,0 +1,92 @@
+from unittest.mock import Mock
+
+from command_line_conflict.components.health import Health
+from command_line_conflict.components.player import Player
+from command_line_conflict.components.position import Position
+from command_line_conflict.components.selectable import Selectable
+from command_line_conflict.game_state import GameState
+
+
+def test_changed_since_lists_each_entity_once_oldest_change_first():
+    game_state = GameState(Mock())
+    version = game_state.change_version
+
+    game_state.mark_changed("a", 1)
+    game_state.mark_changed("a", 2)
+    game_state.mark_changed("b", 3)
+    game_state.mark_changed("a", 1)
+
+    assert game_state.changed_since("a", version) == [2, 1]
+    assert game_state.changed_since("b", version) == [3]
+    assert game_state.changed_since("a", game_state.change_version) == []
+    assert game_state.changed_since("unknown", version) == []
+
+
+def test_channels_forget_their_oldest_records(mocker):
+    mocker.patch("command_line_conflict.config.MAX_CHANGE_RECORDS", 4)
+    game_state = GameState(Mock())
+    version = game_state.change_version
+
+    for entity_id in range(5):
+        game_state.mark_changed("a", entity_id)
+
+    assert game_state.changed_since("a", version) is None
+    assert game_state.changed_since("a", 2) == [2, 3, 4]
+    assert game_state.changed_since("b", version) == []
+
+
+def test_position_records_cell_changes_only(add_entity):
+    game_state = GameState(Mock())
+    entity_id = add_entity(game_state, Position(1.0, 1.0))
+    version = game_state.change_version
+
+    game_state.update_entity_position(entity_id, 1.5, 1.5)
+    assert game_state.changed_since("position", version) == []
+
+    game_state.update_entity_position(entity_id, 2.0, 1.5)
+    assert game_state.changed_since("position", version) == [entity_id]
+
+
+def test_tracked_fields_record_writes_that_change_them(add_entity):
+    game_state = GameState(Mock())
+    health = Health(hp=10, max_hp=10)
+    selectable = Selectable()
+    player = Player(1)
+    entity_id = add_entity(game_state, health, selectable, player)
+    version = game_state.change_version
+
+    health.hp = 10
+    selectable.is_selected = False
+    player.player_id = 1
+    assert not any(game_state.changed_since(c, version) for c in ("health", "selection", "owner"))
+
+    health.hp = 4
+    selectable.is_selected = True
+    player.player_id = 2
+    for channel in ("health", "selection", "owner"):
+        assert game_state.changed_since(channel, version) == [entity_id]
+
+
+def test_adding_and_removing_components_are_changes(add_entity):
+    game_state = GameState(Mock())
+    version = game_state.change_version
+    entity_id = add_entity(game_state, Position(0, 0), Player(1))
+    other_id = add_entity(game_state, Position(1, 0), Player(2))
+    assert game_state.changed_since("owner", version) == [entity_id, other_id]
+
+    version = game_state.change_version
+    game_state.remove_component(entity_id, Player)
+    game_state.remove_entity(other_id)
+    assert game_state.changed_since("owner", version) == [entity_id, other_id]
+    assert game_state.changed_since("position", version) == [other_id]
+
+
+def test_detached_components_stop_recording(add_entity):
+    game_state = GameState(Mock())
+    health = Health(hp=10, max_hp=10)
+    entity_id = add_entity(game_state, health)
+    game_state.remove_entity(entity_id)
+    version = game_state.change_version
+
+    health.hp = 1
+    assert game_state.changed_since("health", version) == []
@@ -0,0 +1,46 @@
+from command_line_conflict.corpses import CorpseLayer
+
+
+def test_add_records_the_cell_and_glyph():
+    corpses = CorpseLayer(capacity=4)
+
+    corpses.add(2.7, 3.1, "c")
+
+    assert len(corpses) == 1
+    assert corpses.entries() == [(2, 3, "c", 0)]
+    assert corpses.version == 1
+
+
+def test_add_recycles_the_oldest_corpse_when_full():
+    corpses = CorpseLayer(capacity=2)
+    corpses.add(1, 1, "a")
+    corpses.add(2, 2, "b")
+
+    corpses.add(3, 3, "c")
+
+    assert [entry[2] for entry in corpses.entries()] == ["b", "c"]
+
+
+def test_update_only_bumps_the_version_on_visible_changes():
+    corpses = CorpseLayer(capacity=4)
+    corpses.add(1, 1, "a")
+    version = corpses.version
+
+    corpses.update(0.5, lifetime=4.0)
+    assert corpses.version == version
+
+    corpses.update(0.5, lifetime=4.0)
+    assert corpses.stage[0] == 1
+    assert corpses.version == version + 1
+
+
+def test_update_removes_expired_corpses_in_order():
+    corpses = CorpseLayer(capacity=4)
+    corpses.add(1, 1, "a")
+    corpses.update(3.0, lifetime=4.0)
+    corpses.add(2, 2, "b")
+    corpses.add(3, 3, "c")
+
+    corpses.update(1.0, lifetime=4.0)
+
+    assert corpses.entries() == [(2, 2, "b", 1), (3, 3, "c", 1)]
@@ -1,5 +1,7 @@
 from unittest.mock import Mock
 
+import pytest
+
 from command_line_conflict.engine import Game, SceneManager
 from command_line_conflict.scenes.game import GameScene
 from command_line_conflict.scenes.menu import MenuScene
@@ -77,13 +79,24 @@ class TestSceneManager:
     def test_update(self):
         mock_game = Mock()
         manager = SceneManager(mock_game)
-        manager.current_scene = Mock()
+        manager.current_scene = Mock(FIXED_STEP=True)
 
         dt = 0.016
         manager.update(dt)
 
         manager.current_scene.update.assert_called_once_with(dt)
 
+    def test_scenes_that_are_not_simulations_update_every_frame(self):
+        mock_game = Mock()
+        manager = SceneManager(mock_game)
+        menu = manager.current_scene = Mock(spec=["update", "draw", "handle_event"])
+
+        manager.update(1 / 30)
+        menu.update.assert_not_called()
+
+        manager.frame_update(0.007)
+        menu.update.assert_called_once_with(0.007)
+
     def test_draw(self):
         mock_game = Mock()
         manager = SceneManager(mock_game)
@@ -94,6 +107,42 @@ class TestSceneManager:
 
         manager.current_scene.draw.assert_called_once_with(screen)
 
+    def test_draw_passes_interpolation_alpha(self):
+        mock_game = Mock()
+        manager = SceneManager(mock_game)
+        manager.current_scene = Mock()
+
+        manager.draw(Mock(), 0.25)
+
+        assert manager.current_scene.interpolation_alpha == 0.25
+
+    def test_draw_returns_scene_dirty_rects(self):
+        mock_game = Mock()
+        manager = SceneManager(mock_game)
+        manager.current_scene = Mock()
+        rects = [Mock()]
+        manager.current_scene.draw.return_value = rects
+
+        # The first frame of a scene always needs a full update
+        assert manager.draw(Mock()) is None
+        assert manager.draw(Mock()) is rects
+
+        manager.current_scene = Mock()
+        assert manager.draw(Mock()) is None
+
+    def test_frame_update_skips_simulations_without_hook(self):
+        mock_game = Mock()
+        manager = SceneManager(mock_game)
+        manager.current_scene = Mock(spec=["update", "draw", "handle_event", "FIXED_STEP"], FIXED_STEP=True)
+
+        manager.frame_update(0.016)  # Must not raise
+        manager.current_scene.update.assert_not_called()
+
+        manager.current_scene = Mock(FIXED_STEP=True)
+        manager.frame_update(0.016)
+        manager.current_scene.frame_update.assert_called_once_with(0.016)
+        manager.current_scene.update.assert_not_called()
+
 
 class TestGame:
     def test_initialization(self, mocker):
@@ -112,7 +161,7 @@ class TestGame:
         import pygame
 
         # Mock pygame stuff
-        mocker.patch("pygame.display.set_mode")
+        mocker.patch("pygame.display.set_mode").return_value.get_size.return_value = (800, 600)
         mocker.patch("pygame.init")
         mocker.patch("pygame.font.Font")
         mocker.patch("pygame.display.flip")
@@ -134,8 +183,9 @@ class TestGame:
 
         game = Game()
 
-        # Mock scene manager
+        # Mock scene manager; None asks for a full display update
         game.scene_manager = Mock()
+        game.scene_manager.draw.return_value = None
 
         # Mock clock.tick to avoid waiting
         # We need to mock the clock object itself or its tick method properly.
@@ -145,7 +195,8 @@ class TestGame:
 
         # However, we can also overwrite game.clock with a Mock object since python allows that.
         game.clock = Mock()
-        game.clock.tick.return_value = 16
+        # Longer than one fixed simulation step, so every frame runs a tick.
+        game.clock.tick.return_value = 50
 
         game.run()
 
@@ -155,3 +206,114 @@ class TestGame:
         assert game.scene_manager.draw.call_count >= 1
 
         assert game.running is False
+
+    def _run_frames(self, mocker, frame_times_ms):
+        import pygame
+
+        mocker.patch("pygame.display.set_mode").return_value.get_size.return_value = (800, 600)
+        mocker.patch("pygame.init")
+        mocker.patch("pygame.font.Font")
+        mocker.patch("pygame.display.flip")
+        mocker.patch("pygame.quit")
+
+        quit_event = Mock()
+        quit_event.type = pygame.QUIT
+        mocker.patch("pygame.event.get", side_effect=[[]] * (len(frame_times_ms) - 1) + [[quit_event]])
+
+        game = Game()
+        game.scene_manager = Mock()
+        game.scene_manager.draw.return_value = None
+        game.clock = Mock()
+        game.clock.tick.side_effect = frame_times_ms
+        game.run()
+        return game
+
+    def test_run_uses_fixed_simulation_steps(self, mocker):
+        from command_line_conflict import config
+
+        mocker.patch.object(config, "SIMULATION_TICK_RATE", 20)
+        # Four 25ms frames = 100ms = two 50ms simulation ticks.
+        game = self._run_frames(mocker, [25, 25, 25, 25])
+
+        assert game.scene_manager.update.call_count == 2
+        for call in game.scene_manager.update.call_args_list:
+            assert call.args[0] == 0.05
+        assert game.scene_manager.frame_update.call_count == 4
+        assert game.scene_manager.draw.call_count == 4
+
+        # Render alpha reflects the leftover fraction of a tick.
+        alphas = [c.args[1] for c in game.scene_manager.draw.call_args_list]
+        assert alphas[0] == pytest.approx(0.5)
+        assert alphas[1] == pytest.approx(0.0, abs=1e-9)
+
+    def test_run_caps_catch_up_steps(self, mocker):
+        from command_line_conflict import config
+
+        mocker.patch.object(config, "SIMULATION_TICK_RATE", 20)
+        mocker.patch.object(config, "MAX_SIMULATION_STEPS_PER_FRAME", 3)
+        # A 1s stall would need 20 ticks; only 3 run and the rest is dropped.
+        game = self._run_frames(mocker, [1010, 25])
+
+        assert game.scene_manager.update.call_count == 3
+
+
+class TestPresent:
+    @pytest.fixture
+    def game(self, mocker, display):
+        mocker.patch("pygame.init")
+        mocker.patch("pygame.font.Font")
+        mocker.patch("pygame.display.set_mode").return_value.get_size.return_value = (800, 600)
+        game = Game()
+        game._present(None)  # Consume the initial full update
+        display.flip.reset_mock()
+        return game
+
+    @pytest.fixture
+    def display(self, mocker):
+        return Mock(flip=mocker.patch("pygame.display.flip"), update=mocker.patch("pygame.display.update"))
+
+    def test_small_dirty_area_updates_only_those_rects(self, game, display):
+        import pygame
+
+        rects = [pygame.Rect(0, 0, 100, 50)]
+        game._present(rects)
+
+        display.update.assert_called_once_with(rects)
+        display.flip.assert_not_called()
+
+    def test_large_dirty_area_flips(self, game, display):
+        import pygame
+
+        game._present([pygame.Rect(0, 0, 800, 500)])
+
+        display.flip.assert_called_once()
+        display.update.assert_not_called()
+
+    def test_full_redraw_flips(self, game, display):
+        game._present(None)
+
+        display.flip.assert_called_once()
+
+    def test_nothing_changed_presents_nothing(self, game, display):
+        game._present([])
+
+        display.flip.assert_not_called()
+        display.update.assert_not_called()
+
+    def test_pending_full_update_flips_once(self, game, display):
+        import pygame
+
+        game.full_update_pending = True
+        game._present([pygame.Rect(0, 0, 10, 10)])
+        game._present([pygame.Rect(0, 0, 10, 10)])
+
+        display.flip.assert_called_once()
+        display.update.assert_called_once()
+
+    def test_screen_resize_flips(self, game, display):
+        import pygame
+
+        game.screen.get_size.return_value = (1024, 768)
+        game._present([pygame.Rect(0, 0, 10, 10)])
+
+        display.flip.assert_called_once()
@@ -1,6 +1,7 @@
-from types import SimpleNamespace
 from unittest.mock import Mock
 
+import pygame
+
 from command_line_conflict.fog_of_war import FogOfWar
 
 
@@ -31,8 +32,8 @@ class TestFogOfWar:
         width, height = 10, 10
         fog = FogOfWar(width, height)
 
-        # Create a mock unit
-        unit = SimpleNamespace(x=5, y=5, vision_range=2)
+        # A vision source: (x, y, vision_range)
+        unit = (5, 5, 2)
 
         # Initial state: all hidden
         assert fog.grid[5][5] == FogOfWar.HIDDEN
@@ -53,14 +54,14 @@ class TestFogOfWar:
         width, height = 10, 10
         fog = FogOfWar(width, height)
 
-        unit1 = SimpleNamespace(x=5, y=5, vision_range=1)
+        unit1 = (5, 5, 1)
 
         # First update: make some tiles visible
         fog.update([unit1])
         assert fog.grid[5][5] == FogOfWar.VISIBLE
 
         # Move unit away
-        unit2 = SimpleNamespace(x=0, y=0, vision_range=1)
+        unit2 = (0, 0, 1)
 
         # Update with new position
         fog.update([unit2])
@@ -142,9 +143,136 @@ class TestFogOfWar:
         # Should call subsurface
         fog.fog_texture.subsurface.assert_called()
 
-        # Should call smoothscale on subsurface
-        args, _ = mock_smoothscale.call_args
-        assert args[0] == mock_subsurface
+        # Should scale the view and a margin around it
+        fog.fog_texture.subsurface.assert_called_with((2, 2, 58, 48))
+        mock_smoothscale.assert_called_with(mock_subsurface, (1160, 960))
 
-        # Should blit
-        screen.blit.assert_called_with(mock_scaled_surf, (0, 0))
+        # Should blit the part under the camera
+        screen.blit.assert_called_with(mock_scaled_surf, (0, 0), pygame.Rect(160, 160, 840, 640))
+
+    def _camera(self, x=10, y=10, zoom=1.0):
+        camera = Mock()
+        camera.x = x
+        camera.y = y
+        camera.zoom = zoom
+        return camera
+
+    def test_draw_reuses_scaled_overlay(self, mocker):
+        mock_smoothscale = mocker.patch("pygame.transform.smoothscale")
+        fog = FogOfWar(100, 100)
+        screen = Mock()
+        screen.get_size.return_value = (800, 600)
+
+        fog.draw(screen, self._camera(x=10.2))
+        # Panning within the margin, across tile boundaries, keeps the overlay
+        fog.draw(screen, self._camera(x=10.7))
+        fog.draw(screen, self._camera(x=13.5, y=7))
+
+        mock_smoothscale.assert_called_once()
+        assert screen.blit.call_count == 3
+        assert screen.blit.call_args.args[0] is mock_smoothscale.return_value
+        assert screen.blit.call_args.args[1] == (-10, 0)
+        assert screen.blit.call_args.args[2] == pygame.Rect(220, 100, 840, 640)
+
+    def test_draw_rescales_when_window_zoom_or_fog_changes(self, mocker):
+        mock_smoothscale = mocker.patch("pygame.transform.smoothscale")
+        mocker.patch("pygame.PixelArray")
+        fog = FogOfWar(100, 100)
+        screen = Mock()
+        screen.get_size.return_value = (800, 600)
+
+        fog.draw(screen, self._camera())
+        fog.draw(screen, self._camera(x=11))
+        assert mock_smoothscale.call_count == 1
+        # Leaving the margin
+        fog.draw(screen, self._camera(x=11 + FogOfWar.OVERLAY_MARGIN))
+        assert mock_smoothscale.call_count == 2
+
+        fog.draw(screen, self._camera(x=11, zoom=1.5))
+        assert mock_smoothscale.call_count == 3
+
+        fog.update([(12, 12, 2)])
+        fog.draw(screen, self._camera(x=11, zoom=1.5))
+        assert mock_smoothscale.call_count == 4
+
+    def test_unchanged_update_keeps_version(self, mocker):
+        mocker.patch("pygame.PixelArray")
+        fog = FogOfWar(10, 10)
+        unit = (5, 5, 2)
+
+        fog.update([unit])
+        version = fog.version
+        fog.update([unit])
+
+        assert fog.version == version
+
+    def test_update_clips_vision_at_map_edges(self):
+        fog = FogOfWar(10, 8)
+
+        fog.update([(0, 7, 3), (-5, -5, 2)])
+
+        assert fog.grid[7][0] == FogOfWar.VISIBLE
+        assert fog.grid[4][0] == FogOfWar.VISIBLE
+        assert fog.grid[7][3] == FogOfWar.VISIBLE
+        assert fog.grid[5][2] == FogOfWar.VISIBLE
+        assert fog.grid[4][3] == FogOfWar.HIDDEN
+        assert int(fog.visible.sum()) == int((fog.grid == FogOfWar.VISIBLE).sum())
+
+    def test_update_writes_texture_alpha(self):
+        import pygame
+
+        fog = FogOfWar(10, 10)
+        fog.fog_texture = pygame.surface.Surface((10, 10), pygame.SRCALPHA)
+        fog.fog_texture.fill(FogOfWar.COLOR_HIDDEN)
+
+        fog.update([(2, 2, 1)])
+        fog.update([(7, 7, 1)])
+
+        assert fog.fog_texture.get_at((7, 7)) == FogOfWar.COLOR_VISIBLE
+        assert fog.fog_texture.get_at((2, 2)) == FogOfWar.COLOR_EXPLORED
+        assert fog.fog_texture.get_at((0, 9)) == FogOfWar.COLOR_HIDDEN
+
+    def test_sync_shows_a_shared_visibility_grid(self):
+        import pygame
+
+        from command_line_conflict.visibility import VisibilityGrid
+
+        fog = FogOfWar(10, 10)
+        fog.fog_texture = pygame.surface.Surface((10, 10), pygame.SRCALPHA)
+        fog.fog_texture.fill(FogOfWar.COLOR_HIDDEN)
+        shared = VisibilityGrid(10, 10)
+        shared.update([(2, 2, 1)])
+
+        fog.sync(shared)
+        assert fog.grid is shared.grid
+        assert fog.fog_texture.get_at((2, 2)) == FogOfWar.COLOR_VISIBLE
+        version = fog.version
+
+        fog.sync(shared)
+        assert fog.version == version
+
+        shared.update([(7, 7, 1)])
+        fog.sync()
+        assert fog.fog_texture.get_at((2, 2)) == FogOfWar.COLOR_EXPLORED
+        assert fog.fog_texture.get_at((7, 7)) == FogOfWar.COLOR_VISIBLE
+
+    def test_sync_rewrites_only_the_areas_changed_since_the_last_sync(self):
+        import pygame
+
+        from command_line_conflict.visibility import VisibilityGrid
+
+        fog = FogOfWar(20, 10)
+        fog.fog_texture = pygame.surface.Surface((20, 10), pygame.SRCALPHA)
+        fog.fog_texture.fill(FogOfWar.COLOR_HIDDEN)
+        shared = VisibilityGrid(20, 10)
+        fog.sync(shared)
+        # A pixel outside every change, which a full upload would overwrite
+        fog.fog_texture.set_at((19, 0), (0, 0, 0, 7))
+
+        shared.update([(2, 2, 1)])
+        shared.update([(2, 2, 1), (7, 7, 1)])
+        fog.sync()
+
+        assert fog.fog_texture.get_at((2, 2)) == FogOfWar.COLOR_VISIBLE
+        assert fog.fog_texture.get_at((7, 7)) == FogOfWar.COLOR_VISIBLE
+        assert fog.fog_texture.get_at((19, 0)) == (0, 0, 0, 7)
@@ -0,0 +1,40 @@
+from unittest.mock import MagicMock
+
+from command_line_conflict.components.position import Position
+from command_line_conflict.game_state import GameState
+
+
+class TestGameStatePreviousPositions:
+    def _make_entity(self, game_state, x, y):
+        entity_id = game_state.create_entity()
+        game_state.add_component(entity_id, Position(x, y))
+        return entity_id
+
+    def test_records_position_at_start_of_tick(self):
+        game_state = GameState(MagicMock())
+        entity_id = self._make_entity(game_state, 1.0, 1.0)
+
+        game_state.begin_tick()
+        game_state.update_entity_position(entity_id, 1.5, 1.0)
+        game_state.update_entity_position(entity_id, 2.0, 1.0)
+
+        # Only the first move of the tick is remembered.
+        assert game_state.previous_positions[entity_id] == (1.0, 1.0)
+
+    def test_begin_tick_clears_previous_positions(self):
+        game_state = GameState(MagicMock())
+        entity_id = self._make_entity(game_state, 1.0, 1.0)
+        game_state.update_entity_position(entity_id, 2.0, 1.0)
+
+        game_state.begin_tick()
+
+        assert entity_id not in game_state.previous_positions
+
+    def test_remove_entity_forgets_previous_position(self):
+        game_state = GameState(MagicMock())
+        entity_id = self._make_entity(game_state, 1.0, 1.0)
+        game_state.update_entity_position(entity_id, 2.0, 1.0)
+
+        game_state.remove_entity(entity_id)
+
+        assert entity_id not in game_state.previous_positions
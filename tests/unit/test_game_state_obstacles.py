@@ -1,7 +1,6 @@
 from unittest.mock import MagicMock
 
-from command_line_conflict.components.dead import Dead
-from command_line_conflict.components.resource_deposit import ResourceDeposit
+from command_line_conflict.components.position import Position
 from command_line_conflict.game_state import GameState
 
 
@@ -9,31 +8,25 @@ class TestGameStateObstacles:
     def test_get_blocking_obstacles(self):
         mock_map = MagicMock()
         game_state = GameState(mock_map)
-
-        # Setup spatial map with various entities
-        game_state.spatial_map = {
-            (0, 0): {1},  # 1 is Dead -> no blocking
-            (1, 1): {2},  # 2 is ResourceDeposit -> no blocking
-            (2, 2): {3},  # 3 is neither -> blocking
-            (3, 3): {4, 5},  # 4 is Dead, 5 is neither -> blocking
-            (4, 4): {6, 7},  # 6 is Dead, 7 is ResourceDeposit -> no blocking
-        }
-
-        # Mock get_component to simulate entity properties
-        def mock_get_component(eid, component_type):
-            components = {
-                1: {Dead: MagicMock()},
-                2: {ResourceDeposit: MagicMock()},
-                3: {},
-                4: {Dead: MagicMock()},
-                5: {},
-                6: {Dead: MagicMock()},
-                7: {ResourceDeposit: MagicMock()},
-            }
-            return components.get(eid, {}).get(component_type, None)
-
-        game_state.get_component = mock_get_component
+        for x, y in ((2, 2), (3, 3), (3, 3)):
+            game_state.add_component(game_state.create_entity(), Position(x, y))
+        # Scrap does not block
+        game_state.add_scrap(1, 1, 50)
 
         result = game_state.get_blocking_obstacles()
 
-        assert result == {(2, 2): {3}, (3, 3): {4, 5}}
+        assert result == {(2, 2): {0}, (3, 3): {1, 2}}
+
+    def test_is_position_occupied_excludes_the_moving_entity(self):
+        game_state = GameState(MagicMock())
+        entity_id = game_state.create_entity()
+        game_state.add_component(entity_id, Position(2, 2))
+        game_state.add_scrap(4, 4, 50)
+
+        assert game_state.is_position_occupied(2, 2)
+        assert not game_state.is_position_occupied(2, 2, exclude_entity_id=entity_id)
+        assert not game_state.is_position_occupied(4, 4)
+
+        other_id = game_state.create_entity()
+        game_state.add_component(other_id, Position(2, 2))
+        assert game_state.is_position_occupied(2, 2, exclude_entity_id=entity_id)
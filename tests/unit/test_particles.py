@@ -0,0 +1,48 @@
+from command_line_conflict.particles import ParticleEmitter
+
+
+def test_emit_drops_particles_when_full():
+    particles = ParticleEmitter(capacity=2)
+
+    assert particles.emit(1, 1, 0.5)
+    assert particles.emit(2, 2, 0.5)
+    assert not particles.emit(3, 3, 0.5)
+    assert len(particles) == 2
+
+
+def test_emit_cycles_through_the_palette():
+    particles = ParticleEmitter(capacity=3)
+    for i in range(3):
+        particles.emit(i, 0, 0.5)
+
+    assert particles.color[:3].tolist() == [0, 1, 2]
+
+
+def test_update_compacts_the_live_particles():
+    particles = ParticleEmitter(capacity=4)
+    particles.emit(1, 1, 0.2)
+    particles.emit(2, 2, 1.0)
+    particles.emit(3, 3, 0.2)
+    particles.emit(4, 4, 1.0)
+
+    particles.update(0.5)
+
+    assert len(particles) == 2
+    assert particles.x[:2].tolist() == [2, 4]
+    assert particles.y[:2].tolist() == [2, 4]
+    assert particles.color[:2].tolist() == [1, 3]
+    assert particles.lifetime[:2].tolist() == [0.5, 0.5]
+    # Freed slots are reused
+    assert particles.emit(5, 5, 1.0)
+    assert particles.emit(6, 6, 1.0)
+    assert not particles.emit(7, 7, 1.0)
+
+
+def test_update_keeps_particles_that_have_not_expired():
+    particles = ParticleEmitter(capacity=4)
+    particles.emit(1, 1, 1.0)
+
+    particles.update(0.25)
+
+    assert len(particles) == 1
+    assert particles.lifetime[0] == 0.75
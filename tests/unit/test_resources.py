@@ -1,8 +1,5 @@
 from command_line_conflict import factories
-from command_line_conflict.components.dead import Dead
 from command_line_conflict.components.health import Health
-from command_line_conflict.components.position import Position
-from command_line_conflict.components.resource_deposit import ResourceDeposit
 from command_line_conflict.components.unit_identity import UnitIdentity
 from command_line_conflict.systems.health_system import HealthSystem
 from command_line_conflict.systems.resource_system import ResourceSystem
@@ -15,26 +12,18 @@ def test_game_state_resources_initialization(game_state):
     assert game_state.resources[2] == 0
 
 
-def test_create_scrap(game_state):
-    """Verify that create_scrap creates an entity with expected components."""
-    scrap_id = factories.create_scrap(game_state, 10.0, 15.0, amount=75)
+def test_add_scrap_stacks_piles_on_a_cell(game_state):
+    """Verify that scrap is kept per cell, outside the entity tables."""
+    game_state.add_scrap(10.7, 15.2, amount=75)
+    game_state.add_scrap(10.0, 15.0, amount=25)
 
-    pos = game_state.get_component(scrap_id, Position)
-    assert pos is not None
-    assert pos.x == 10.0
-    assert pos.y == 15.0
-
-    identity = game_state.get_component(scrap_id, UnitIdentity)
-    assert identity is not None
-    assert identity.name == "scrap"
-
-    deposit = game_state.get_component(scrap_id, ResourceDeposit)
-    assert deposit is not None
-    assert deposit.amount == 75
+    assert game_state.scrap == {(10, 15): 100}
+    assert not game_state.entities
+    assert not game_state.spatial_map
 
 
 def test_neutral_death_spawns_scrap(game_state):
-    """Verify that when a neutral unit dies, a scrap entity is spawned at its location."""
+    """Verify that when a neutral unit dies, scrap is dropped at its location."""
     # Create neutral unit (Player 0)
     neutral_id = factories.create_wildlife(game_state, 5.0, 5.0)
 
@@ -48,26 +37,16 @@ def test_neutral_death_spawns_scrap(game_state):
     health_system = HealthSystem()
     health_system.update(game_state, 0.1)
 
-    # Verify that the neutral unit is now marked dead
-    assert game_state.get_component(neutral_id, Dead) is not None
-
-    # Verify that a scrap entity was created at (5.0, 5.0)
-    scrap_entities = game_state.get_entities_with_component(ResourceDeposit)
-    assert len(scrap_entities) == 1
+    # Verify that the neutral unit is gone
+    assert neutral_id not in game_state.entities
 
-    scrap_id = list(scrap_entities)[0]
-    pos = game_state.get_component(scrap_id, Position)
-    assert pos.x == 5.0
-    assert pos.y == 5.0
-
-    deposit = game_state.get_component(scrap_id, ResourceDeposit)
-    assert deposit.amount == 50
+    # Verify that scrap was dropped at (5, 5)
+    assert game_state.scrap == {(5, 5): 50}
 
 
 def test_resource_system_collects_scrap(game_state):
     """Verify that player units occupying the same cell collect scrap resources."""
-    # Create a scrap entity at (3.0, 4.0)
-    scrap_id = factories.create_scrap(game_state, 3.0, 4.0, amount=50)
+    game_state.add_scrap(3.0, 4.0, amount=50)
 
     # Create a player unit at (3.0, 4.0)
     factories.create_chassis(game_state, 3.0, 4.0, player_id=1, is_human=True)
@@ -76,33 +55,49 @@ def test_resource_system_collects_scrap(game_state):
     resource_system = ResourceSystem()
     resource_system.update(game_state, 0.1)
 
-    # Verify scrap entity was removed/consumed
-    assert scrap_id not in game_state.entities
+    # Verify scrap was removed/consumed
+    assert not game_state.scrap
 
     # Verify resources updated for Player 1
     assert game_state.resources[1] == 50
 
 
-def test_resource_system_ignores_dead_units(game_state):
-    """Verify that dead player units do not collect scrap."""
-    scrap_id = factories.create_scrap(game_state, 3.0, 4.0, amount=50)
-
-    # Create a dead player unit at (3.0, 4.0)
-    player_unit_id = factories.create_chassis(game_state, 3.0, 4.0, player_id=1, is_human=True)
-    game_state.add_component(player_unit_id, Dead())
-
-    # Run ResourceSystem
+def test_resource_system_collects_scrap_when_a_unit_steps_on_it(game_state):
+    """Verify that harvesting is triggered by moving onto a scrap cell."""
+    game_state.add_scrap(3.0, 4.0, amount=50)
+    unit_id = factories.create_chassis(game_state, 2.0, 4.0, player_id=1, is_human=True)
     resource_system = ResourceSystem()
+
     resource_system.update(game_state, 0.1)
+    assert game_state.resources[1] == 0
 
-    # Verify scrap entity was not consumed
-    assert scrap_id in game_state.entities
+    # Moving within the same cell does not reach the pile
+    game_state.update_entity_position(unit_id, 2.9, 4.0)
+    resource_system.update(game_state, 0.1)
     assert game_state.resources[1] == 0
 
+    game_state.update_entity_position(unit_id, 3.1, 4.0)
+    resource_system.update(game_state, 0.1)
+    assert game_state.resources[1] == 50
+    assert not game_state.scrap
+    assert not game_state.pop_trigger_events("scrap")
+
+
+def test_resource_system_collects_scrap_dropped_under_a_unit(game_state):
+    """Verify that scrap dropped under a standing unit is collected."""
+    factories.create_chassis(game_state, 3.0, 4.0, player_id=2, is_human=False)
+
+    game_state.add_scrap(3.5, 4.5, amount=50)
+    ResourceSystem().update(game_state, 0.1)
+
+    assert game_state.resources[2] == 50
+    events = [e for e in game_state.event_queue if e.get("subtype") == "floating_text"]
+    assert events[0]["text"] == "+50 Scrap"
+
 
 def test_resource_system_ignores_neutral_units(game_state):
     """Verify that neutral units (Player 0) do not collect scrap."""
-    scrap_id = factories.create_scrap(game_state, 3.0, 4.0, amount=50)
+    game_state.add_scrap(3.0, 4.0, amount=50)
 
     # Create a neutral unit (Player 0) at (3.0, 4.0)
     factories.create_wildlife(game_state, 3.0, 4.0)
@@ -111,8 +106,8 @@ def test_resource_system_ignores_neutral_units(game_state):
     resource_system = ResourceSystem()
     resource_system.update(game_state, 0.1)
 
-    # Verify scrap entity was not consumed
-    assert scrap_id in game_state.entities
+    # Verify scrap was not consumed
+    assert game_state.scrap == {(3, 4): 50}
 
 
 class MockGame:
@@ -0,0 +1,83 @@
+from command_line_conflict import factories
+from command_line_conflict.components.selectable import Selectable
+from command_line_conflict.game_state import GameState
+from command_line_conflict.maps.simple_map import SimpleMap
+from command_line_conflict.systems.selection_system import SelectionSystem
+
+
+def test_selected_set_follows_is_selected():
+    game_state = GameState(SimpleMap())
+    unit_id = factories.create_chassis(game_state, 1, 1, player_id=1, is_human=True)
+    selectable = game_state.get_component(unit_id, Selectable)
+    assert game_state.get_selected_entities() == set()
+
+    selectable.is_selected = True
+    assert game_state.get_selected_entities() == {unit_id}
+
+    selectable.is_selected = False
+    assert game_state.get_selected_entities() == set()
+
+
+def test_removed_entities_leave_the_selected_set():
+    game_state = GameState(SimpleMap())
+    unit_id = factories.create_chassis(game_state, 1, 1, player_id=1, is_human=True)
+    game_state.get_component(unit_id, Selectable).is_selected = True
+
+    game_state.remove_entity(unit_id)
+    assert game_state.get_selected_entities() == set()
+
+
+def test_entities_in_rect_are_the_same_whichever_side_is_walked():
+    game_state = GameState(SimpleMap())
+    inside = {
+        factories.create_chassis(game_state, 2, 3, player_id=1, is_human=True),
+        factories.create_chassis(game_state, 4, 5, player_id=1, is_human=True),
+    }
+    factories.create_chassis(game_state, 5, 5, player_id=1, is_human=True)
+    factories.create_chassis(game_state, 3, 6, player_id=1, is_human=True)
+
+    # A small rectangle walks its cells, a large one the occupied cells.
+    assert set(game_state.get_entities_in_rect(4, 5, 2, 3)) == inside
+    for entity_id in range(100, 200):
+        game_state.spatial_map[(entity_id, 50)] = {entity_id}
+    assert set(game_state.get_entities_in_rect(2, 3, 4, 5)) == inside
+
+
+def test_control_groups_are_recalled_without_dead_units():
+    game_state = GameState(SimpleMap())
+    selection_system = SelectionSystem()
+    first = factories.create_chassis(game_state, 1, 1, player_id=1, is_human=True)
+    second = factories.create_chassis(game_state, 2, 1, player_id=1, is_human=True)
+    other = factories.create_chassis(game_state, 3, 1, player_id=1, is_human=True)
+    enemy = factories.create_chassis(game_state, 4, 1, player_id=2, is_human=False)
+    for entity_id in (first, second, enemy):
+        game_state.get_component(entity_id, Selectable).is_selected = True
+
+    selection_system.assign_control_group(game_state, 1, current_player_id=1)
+    assert game_state.control_groups[(1, 1)] == {first, second}
+
+    selection_system.clear_selection(game_state)
+    game_state.get_component(other, Selectable).is_selected = True
+    game_state.remove_entity(second)
+    selection_system.recall_control_group(game_state, 1, current_player_id=1)
+
+    assert game_state.get_selected_entities() == {first}
+    assert game_state.control_groups[(1, 1)] == {first}
+
+
+def test_shift_recall_adds_the_group_to_the_selection():
+    game_state = GameState(SimpleMap())
+    selection_system = SelectionSystem()
+    first = factories.create_chassis(game_state, 1, 1, player_id=1, is_human=True)
+    second = factories.create_chassis(game_state, 2, 1, player_id=1, is_human=True)
+    game_state.get_component(first, Selectable).is_selected = True
+    selection_system.assign_control_group(game_state, 2, current_player_id=1)
+    selection_system.clear_selection(game_state)
+
+    game_state.get_component(second, Selectable).is_selected = True
+    selection_system.recall_control_group(game_state, 2, shift_pressed=True, current_player_id=1)
+    assert game_state.get_selected_entities() == {first, second}
+
+    # An unassigned group leaves the selection alone.
+    selection_system.recall_control_group(game_state, 3, current_player_id=1)
+    assert game_state.get_selected_entities() == {first, second}
@@ -0,0 +1,79 @@
+import pytest
+
+from command_line_conflict.components.health import Health
+from command_line_conflict.maps import SimpleMap
+from command_line_conflict.simulation import HeadlessSimulation, SimulationReport, main
+
+
+class TestHeadlessSimulation:
+    def test_runs_without_a_display(self, mocker):
+        set_mode = mocker.patch("pygame.display.set_mode")
+        font = mocker.patch("pygame.font.Font")
+
+        simulation = HeadlessSimulation()
+        simulation.run(30)
+
+        set_mode.assert_not_called()
+        font.assert_not_called()
+        assert simulation.ticks == 30
+
+    def test_creates_map_starting_units(self):
+        simulation = HeadlessSimulation()
+
+        assert simulation.game_state.get_entities_with_component(Health)
+
+    def test_empty_simulation(self):
+        simulation = HeadlessSimulation(SimpleMap(), create_initial_units=False)
+
+        report = simulation.run(10)
+
+        assert report.entity_count == 0
+
+    def test_step_uses_fixed_dt(self, mocker):
+        simulation = HeadlessSimulation(SimpleMap(), tick_rate=20)
+        update = mocker.patch.object(simulation.scheduler, "update")
+
+        simulation.step()
+        simulation.step()
+
+        assert [c.args[0] for c in update.call_args_list] == [0.05, 0.05]
+
+    def test_steps_advance_the_simulation_clock(self):
+        simulation = HeadlessSimulation(SimpleMap(), tick_rate=20, create_initial_units=False)
+
+        simulation.run(10)
+
+        assert simulation.game_state.timers.now == pytest.approx(0.5)
+
+    def test_step_drains_event_queue(self):
+        simulation = HeadlessSimulation(SimpleMap())
+        simulation.game_state.add_event({"type": "sound", "data": {"name": "spawn_unit"}})
+
+        simulation.step()
+
+        assert simulation.game_state.event_queue == []
+
+    def test_campaign_is_isolated_from_save_file(self, mocker):
+        save_progress = mocker.patch("command_line_conflict.campaign_manager.CampaignManager.save_progress")
+
+        simulation = HeadlessSimulation()
+        simulation.run(5)
+
+        assert simulation.campaign_manager.completed_missions == []
+        save_progress.assert_not_called()
+
+
+class TestSimulationReport:
+    def test_rates(self):
+        report = SimulationReport(ticks=300, sim_seconds=10.0, wall_seconds=0.5, entity_count=12)
+
+        assert report.ticks_per_second == 600
+        assert report.speedup == 20
+        assert "600.0 ticks/s" in str(report)
+
+
+def test_main_runs_requested_ticks(capsys):
+    report = main(["--ticks", "15", "--map", "wall", "--seed", "3"])
+
+    assert report.ticks == 15
+    assert "ticks/s" in capsys.readouterr().out
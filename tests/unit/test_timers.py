@@ -0,0 +1,106 @@
+import random
+
+from command_line_conflict.timers import TimerWheel
+
+
+def test_timer_expires_on_the_first_tick_at_or_after_its_due_time():
+    timers = TimerWheel(0.1)
+    timers.schedule(0.25, "a", 1)
+
+    timers.advance(0.2)
+    assert timers.pop("a") == []
+    timers.advance(0.1)
+    assert timers.pop("a") == [1]
+    assert timers.pop("a") == []
+    assert 1 not in timers.scheduled("a")
+
+
+def test_zero_delay_expires_on_the_next_tick():
+    timers = TimerWheel(0.1)
+    timers.schedule(0.0, "a", 1)
+    assert timers.pop("a") == []
+
+    timers.advance(0.1)
+    assert timers.pop("a") == [1]
+
+
+def test_timers_are_popped_by_type():
+    timers = TimerWheel(0.1)
+    timers.schedule(0.1, "a", 1)
+    timers.schedule(0.1, "b", 2)
+
+    timers.advance(0.1)
+    assert timers.pop("b") == [2]
+    assert timers.pop("a") == [1]
+
+
+def test_rescheduling_moves_the_timer():
+    timers = TimerWheel(0.1)
+    timers.schedule(0.1, "a", 1)
+    timers.schedule(0.5, "a", 1)
+
+    timers.advance(0.4)
+    assert timers.pop("a") == []
+    timers.advance(0.1)
+    assert timers.pop("a") == [1]
+
+
+def test_cancelled_timer_never_expires():
+    timers = TimerWheel(0.1)
+    timers.schedule(0.1, "a", 1)
+    timers.cancel("a", 1)
+    timers.cancel("a", 2)
+
+    timers.advance(1.0)
+    assert timers.pop("a") == []
+
+
+class _SmallWheel(TimerWheel):
+    SLOTS = 4
+    LEVELS = 3
+
+
+def test_far_timers_cascade_through_every_ring():
+    timers = _SmallWheel(1.0)
+    # Past the 4**3 ticks the rings span, timers wait in the overflow list.
+    for delay in range(1, 150):
+        timers.schedule(delay, "a", delay)
+
+    for tick in range(1, 150):
+        timers.advance(1.0)
+        assert timers.pop("a") == [tick]
+
+
+def test_timers_scheduled_mid_turn_expire_on_time():
+    timers = _SmallWheel(1.0)
+    timers.advance(7.0)
+    for delay in (1, 3, 4, 9, 16, 17, 63, 64, 70):
+        timers.schedule(delay, "a", delay)
+
+    expired = {}
+    for _ in range(80):
+        timers.advance(1.0)
+        for key in timers.pop("a"):
+            expired[key] = timers.tick - 7
+
+    assert expired == {delay: delay for delay in (1, 3, 4, 9, 16, 17, 63, 64, 70)}
+
+
+def test_random_timers_expire_in_order():
+    rng = random.Random(0)
+    timers = TimerWheel(1 / 30)
+    due = {}
+    for key in range(500):
+        delay = rng.uniform(0, 200)
+        timers.schedule(delay, "a", key)
+        due[key] = delay
+
+    expired = []
+    while len(expired) < len(due):
+        timers.advance(1 / 30)
+        for key in timers.pop("a"):
+            # Expired on the first tick at or after the due time
+            assert due[key] <= timers.now + 1e-6 < due[key] + 1 / 30 + 1e-6
+            expired.append(key)
+
+    assert sorted(expired) == list(range(500))
@@ -0,0 +1,73 @@
+from unittest.mock import Mock
+
+from command_line_conflict.components.position import Position
+from command_line_conflict.game_state import GameState
+from command_line_conflict.triggers import TriggerEvent, TriggerZones
+
+
+def test_zones_are_reference_counted_per_event_type():
+    triggers = TriggerZones()
+    triggers.add((1, 1), "a")
+    triggers.add((1, 1), "a")
+    triggers.add((1, 1), "b")
+
+    triggers.remove((1, 1), "a")
+    assert triggers.has((1, 1), "a")
+    triggers.remove((1, 1), "a")
+    assert not triggers.has((1, 1), "a")
+    assert (1, 1) in triggers
+
+    triggers.remove((1, 1), "b")
+    assert (1, 1) not in triggers
+
+
+def test_fire_raises_an_event_per_registered_type():
+    triggers = TriggerZones()
+    triggers.add((1, 1), "a")
+    triggers.add((1, 1), "b")
+
+    triggers.fire(TriggerZones.ENTER, 7, (1, 1))
+    triggers.fire(TriggerZones.ENTER, 8, (2, 2))
+
+    assert triggers.pop("a") == [TriggerEvent("enter", 7, (1, 1))]
+    assert triggers.pop("b") == [TriggerEvent("enter", 7, (1, 1))]
+    assert triggers.pop("a") == []
+
+
+def test_moving_across_a_zone_raises_enter_and_leave(add_entity):
+    game_state = GameState(Mock())
+    entity_id = add_entity(game_state, Position(1, 1))
+    game_state.add_trigger(2, 1, "zone")
+
+    # Moving within a cell raises nothing
+    game_state.update_entity_position(entity_id, 1.9, 1)
+    assert game_state.pop_trigger_events("zone") == []
+
+    game_state.update_entity_position(entity_id, 2.1, 1)
+    game_state.update_entity_position(entity_id, 2.9, 1)
+    game_state.update_entity_position(entity_id, 3.0, 1)
+
+    assert game_state.pop_trigger_events("zone") == [
+        TriggerEvent(TriggerZones.ENTER, entity_id, (2, 1)),
+        TriggerEvent(TriggerZones.LEAVE, entity_id, (2, 1)),
+    ]
+
+
+def test_placement_registration_and_removal_raise_events(add_entity):
+    game_state = GameState(Mock())
+    standing_id = add_entity(game_state, Position(4, 4))
+
+    # Entities already in the cell enter it when it is registered
+    game_state.add_trigger(4, 4, "zone")
+    placed_id = add_entity(game_state, Position(4.5, 4.5))
+    game_state.remove_entity(standing_id)
+
+    assert game_state.pop_trigger_events("zone") == [
+        TriggerEvent(TriggerZones.ENTER, standing_id, (4, 4)),
+        TriggerEvent(TriggerZones.ENTER, placed_id, (4, 4)),
+        TriggerEvent(TriggerZones.LEAVE, standing_id, (4, 4)),
+    ]
+
+    game_state.remove_trigger(4, 4, "zone")
+    game_state.remove_entity(placed_id)
+    assert game_state.pop_trigger_events("zone") == []
@@ -0,0 +1,104 @@
+from command_line_conflict.visibility import VisibilityGrid
+
+
+class TestVisibilityGrid:
+    def test_vision_mask_is_a_disc(self):
+        mask = VisibilityGrid.get_mask(2)
+
+        assert mask.shape == (5, 5)
+        assert mask[2, 2] and mask[0, 2] and mask[2, 4]
+        assert not mask[0, 0] and not mask[4, 4]
+        assert VisibilityGrid.get_mask(2) is mask
+
+    def test_update_reports_changes(self):
+        grid = VisibilityGrid(10, 10)
+
+        assert grid.update([(5, 5, 1)])
+        assert grid.version == 1
+        assert grid.changed_area == (4, 4, 7, 7)
+        assert not grid.update([(5.5, 5.2, 1)])
+        assert grid.version == 1
+
+    def test_changed_area_since_spans_every_missed_change(self):
+        grid = VisibilityGrid(40, 10)
+        grid.update([(5, 5, 1)])
+        version = grid.version
+        grid.update([(5, 5, 1), (10, 5, 1)])
+        grid.update([(5, 5, 1), (10, 5, 1), (20, 2, 1)])
+
+        assert grid.changed_area_since(version) == (9, 1, 22, 7)
+        assert grid.changed_area_since(grid.version) == (0, 0, 0, 0)
+
+        for x in range(VisibilityGrid.HISTORY):
+            grid.update([(x, 5, 1)])
+        assert grid.changed_area_since(version) is None
+        assert grid.changed_area_since(grid.version - 1) == grid.changed_area
+
+    def test_is_visible_is_false_off_the_map(self):
+        grid = VisibilityGrid(10, 10)
+        grid.update([(0, 0, 2)])
+
+        assert grid.is_visible(0, 0)
+        assert grid.is_visible(2, 0)
+        assert not grid.is_visible(-1, 0)
+        assert not grid.is_visible(0, 10)
+        assert not grid.is_visible(5, 5)
+
+    def test_cell_stays_visible_while_any_viewer_remains(self):
+        grid = VisibilityGrid(20, 20)
+
+        # Two units on the same cell, plus an overlapping one
+        grid.update([(5, 5, 2), (5, 5, 2), (7, 5, 2)])
+        assert grid.viewers[5][5] == 3
+
+        grid.update([(5, 5, 2), (15, 15, 2), (7, 5, 2)])
+        assert grid.viewers[5][5] == 2
+        assert grid.grid[5][5] == VisibilityGrid.VISIBLE
+
+        grid.update([(15, 15, 2), (15, 15, 2), (12, 12, 1)])
+        assert grid.viewers[5][5] == 0
+        assert grid.grid[5][5] == VisibilityGrid.EXPLORED
+        assert grid.grid[5][7] == VisibilityGrid.EXPLORED
+
+    def test_incremental_update_matches_full_recompute(self):
+        import random
+
+        rng = random.Random(3)
+        grid = VisibilityGrid(30, 20)
+        sources = [(rng.randrange(30), rng.randrange(20), rng.randrange(1, 6)) for _ in range(12)]
+        seen = set()
+        for _ in range(20):
+            moved = rng.randrange(len(sources))
+            x, y, r = sources[moved]
+            sources[moved] = (x + rng.choice((-1, 0, 1)), y + rng.choice((-1, 0, 1)), r)
+            grid.update(sources)
+
+            expected = VisibilityGrid(30, 20)
+            expected.update(sources)
+            seen |= {(x, y) for x in range(30) for y in range(20) if expected.visible[y][x]}
+
+            assert (grid.visible == expected.visible).all()
+            for y in range(20):
+                for x in range(30):
+                    if grid.visible[y][x]:
+                        assert grid.grid[y][x] == VisibilityGrid.VISIBLE
+                    elif (x, y) in seen:
+                        assert grid.grid[y][x] == VisibilityGrid.EXPLORED
+
+    def test_move_sources_matches_update(self):
+        grid = VisibilityGrid(20, 20)
+        expected = VisibilityGrid(20, 20)
+        grid.move_sources([], [(5, 5, 2), (5, 5, 2), (10, 10, 3)])
+        expected.update([(5, 5, 2), (5, 5, 2), (10, 10, 3)])
+
+        assert grid.move_sources([(5, 5, 2), (10, 10, 3)], [(6, 5, 2), (10, 10, 3)])
+        assert expected.update([(5, 5, 2), (6, 5, 2), (10, 10, 3)])
+        assert (grid.visible == expected.visible).all()
+        assert (grid.grid == expected.grid).all()
+
+        # Sources that stay where they were change nothing.
+        version = grid.version
+        assert not grid.move_sources([(6, 5, 2)], [(6, 5, 2)])
+        assert grid.version == version
+        # The grid remembers its sources, so update still sees no change.
+        assert not grid.update([(5, 5, 2), (6, 5, 2), (10, 10, 3)])
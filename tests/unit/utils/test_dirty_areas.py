@@ -0,0 +1,19 @@
+import pygame
+
+from command_line_conflict.utils.dirty_areas import DirtyAreas
+
+
+def test_unchanged_layer_adds_nothing():
+    areas = DirtyAreas()
+    assert areas.track("tooltip", (1, 2), [pygame.Rect(0, 0, 5, 5)]) == [pygame.Rect(0, 0, 5, 5)]
+    assert areas.track("tooltip", (1, 2), [pygame.Rect(0, 0, 5, 5)]) == []
+
+
+def test_changed_layer_reports_its_old_and_new_areas():
+    areas = DirtyAreas()
+    areas.track("tooltip", (1, 2), [pygame.Rect(0, 0, 5, 5)])
+
+    assert areas.track("tooltip", (3, 4), [pygame.Rect(10, 0, 5, 5)]) == [pygame.Rect(0, 0, 5, 5), pygame.Rect(10, 0, 5, 5)]
+    # Gone: only the old area needs repainting.
+    assert areas.track("tooltip", None) == [pygame.Rect(10, 0, 5, 5)]
+    assert areas.track("tooltip", None) == []
@@ -0,0 +1,36 @@
+from command_line_conflict.utils.effect_pool import EffectPool
+
+
+def test_expire_retires_finished_effects():
+    pool = EffectPool(4, duration_ms=100)
+    pool.spawn(1, 2, now=0, data="a")
+    pool.spawn(3, 4, now=50, data="b")
+
+    assert pool.expire(99).tolist() == [0, 1]
+    assert pool.expire(100).tolist() == [1]
+    assert pool.data[0] is None
+    assert len(pool) == 1
+    assert pool.progress(pool.expire(100), 100).tolist() == [0.5]
+
+
+def test_full_pool_recycles_the_oldest_and_forgets_its_key():
+    pool = EffectPool(2, duration_ms=1000)
+    pool.spawn(0, 0, now=10, data="a", key="target")
+    pool.spawn(0, 0, now=20, data="b")
+    assert pool.find("target") == 0
+
+    slot = pool.spawn(0, 0, now=30, data="c")
+
+    assert slot == 0
+    assert pool.data[0] == "c"
+    assert pool.find("target") is None
+    assert len(pool) == 2
+
+
+def test_find_ignores_expired_effects():
+    pool = EffectPool(2, duration_ms=100)
+    pool.spawn(0, 0, now=0, data="a", key="k")
+
+    pool.expire(200)
+
+    assert pool.find("k") is None
@@ -0,0 +1,76 @@
+from unittest.mock import Mock
+
+import pygame
+import pytest
+
+from command_line_conflict.utils.glyph_atlas import GlyphAtlas
+
+
+@pytest.fixture
+def atlas(mocker):
+    mocker.patch("pygame.transform.scale")
+    # Distinct pages so tests can tell them apart
+    mocker.patch("pygame.Surface", side_effect=lambda *args, **kwargs: Mock())
+    return GlyphAtlas(Mock())
+
+
+class TestGlyphAtlas:
+    def test_glyph_is_rendered_once(self, atlas):
+        first = atlas.get("A", (255, 0, 0), 20)
+        second = atlas.get("A", (255, 0, 0), 20)
+
+        assert first == second
+        atlas.font.render.assert_called_once_with("A", True, (255, 0, 0))
+        assert len(atlas) == 1
+
+    def test_glyphs_of_a_size_share_a_page(self, atlas):
+        page_a, area_a = atlas.get("A", (255, 0, 0), 20)
+        page_b, area_b = atlas.get("B", (255, 0, 0), 20)
+
+        assert page_a is page_b
+        assert area_a == pygame.Rect(0, 0, 20, 20)
+        assert area_b == pygame.Rect(20, 0, 20, 20)
+
+    def test_sizes_use_separate_pages(self, atlas):
+        page_small, _ = atlas.get("A", (255, 0, 0), 20)
+        page_large, area = atlas.get("A", (255, 0, 0), 30)
+
+        assert page_small is not page_large
+        assert area == pygame.Rect(0, 0, 30, 30)
+
+    def test_full_page_starts_a_new_one(self, atlas):
+        slots = GlyphAtlas.SLOTS_PER_ROW * GlyphAtlas.SLOTS_PER_ROW
+        first_page, _ = atlas.get("0", (0, 0, 0), 10)
+        for i in range(1, slots):
+            atlas.get(str(i), (0, 0, 0), 10)
+
+        next_page, area = atlas.get("overflow", (0, 0, 0), 10)
+
+        assert next_page is not first_page
+        assert area.topleft == (0, 0)
+
+    def test_only_the_most_recent_sizes_are_kept(self, atlas):
+        atlas.get("A", (255, 0, 0), 20)
+        atlas.get("A", (255, 0, 0), 30)
+        atlas.get("B", (255, 0, 0), 20)
+        atlas.font.render.reset_mock()
+
+        # A third size evicts the least recently used one, 30px.
+        atlas.get("A", (255, 0, 0), 40)
+        assert len(atlas) == 3
+        atlas.get("A", (255, 0, 0), 20)
+        atlas.font.render.assert_called_once()
+        atlas.get("A", (255, 0, 0), 30)
+        assert atlas.font.render.call_count == 2
+
+    def test_a_full_size_starts_over_with_bounded_pages(self, atlas):
+        slots = GlyphAtlas.SLOTS_PER_ROW * GlyphAtlas.SLOTS_PER_ROW * GlyphAtlas.MAX_PAGES_PER_SIZE
+        pages = [atlas.get(str(i), (0, 0, 0), 10)[0] for i in range(slots)]
+        assert len({id(page) for page in pages}) == GlyphAtlas.MAX_PAGES_PER_SIZE
+        assert len(atlas) == slots
+
+        page, area = atlas.get("overflow", (0, 0, 0), 10)
+
+        assert all(page is not old_page for old_page in pages)
+        assert area.topleft == (0, 0)
+        assert len(atlas) == 1
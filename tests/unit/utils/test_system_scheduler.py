@@ -0,0 +1,81 @@
+from unittest.mock import Mock
+
+import pytest
+
+from command_line_conflict.utils.profiler import profiler
+from command_line_conflict.utils.system_scheduler import SystemScheduler
+
+
+class TestSystemScheduler:
+    def test_every_tick_system_receives_frame_dt(self):
+        scheduler = SystemScheduler()
+        callback = Mock()
+        scheduler.register("movement", callback)
+
+        scheduler.update(0.016)
+        scheduler.update(0.02)
+
+        assert [c.args[0] for c in callback.call_args_list] == [0.016, 0.02]
+
+    def test_systems_run_in_registration_order(self):
+        scheduler = SystemScheduler()
+        order = []
+        scheduler.register("first", lambda dt: order.append("first"))
+        scheduler.register("second", lambda dt: order.append("second"))
+
+        scheduler.update(0.1)
+
+        assert order == ["first", "second"]
+
+    def test_low_rate_system_receives_accumulated_dt(self):
+        scheduler = SystemScheduler()
+        callback = Mock()
+        scheduler.register("fog", callback, rate=2)
+
+        # Phase 0 runs on the first tick, then every 0.5s.
+        for _ in range(60):
+            scheduler.update(1 / 60)
+
+        assert callback.call_count == 2
+        assert callback.call_args_list[0].args[0] == pytest.approx(1 / 60)
+        assert callback.call_args_list[1].args[0] == pytest.approx(0.5)
+
+    def test_phase_offsets_first_run(self):
+        scheduler = SystemScheduler()
+        early = Mock()
+        late = Mock()
+        scheduler.register("early", early, rate=5)
+        scheduler.register("late", late, rate=5, phase=0.5)
+
+        scheduler.update(0.05)
+        assert early.call_count == 1
+        assert late.call_count == 0
+
+        scheduler.update(0.05)
+        assert late.call_count == 1
+        assert late.call_args.args[0] == pytest.approx(0.1)
+
+    def test_long_stall_runs_once_and_resynchronizes(self):
+        scheduler = SystemScheduler()
+        callback = Mock()
+        scheduler.register("spawn", callback, rate=10)
+
+        scheduler.update(0.01)
+        scheduler.update(2.0)
+        assert callback.call_count == 2
+        assert callback.call_args.args[0] == pytest.approx(2.0)
+
+        # The next run is a full interval later, not an immediate catch-up.
+        scheduler.update(0.05)
+        assert callback.call_count == 2
+
+    def test_records_system_time_in_profiler(self, mocker):
+        mocker.patch.object(profiler, "enabled", True)
+        log_metric = mocker.patch.object(profiler, "log_metric")
+        scheduler = SystemScheduler()
+        scheduler.register("CombatSystem", Mock())
+
+        scheduler.update(0.016)
+
+        log_metric.assert_called_once()
+        assert log_metric.call_args.args[0] == "CombatSystem"
@@ -122,3 +122,21 @@ class TestTargeting:
         # Verify logic
         target = Targeting.find_closest_enemy(my_id, my_pos, my_player, vision, game_state)
         assert target == target_id
+
+    def test_find_closest_enemy_skips_cells_the_player_cannot_see(self, game_state):
+        my_id = 1
+        my_pos = Position(10, 10)
+        my_player = Player(1)
+        vision = Vision(5)
+        self.create_unit(game_state, 2, 12, 10, 2)
+        self.create_unit(game_state, 3, 14, 10, 2)
+
+        # The player only sees a small area around (10, 10)
+        game_state.get_visibility(1).update([(10, 10, 3)])
+
+        target = Targeting.find_closest_enemy(my_id, my_pos, my_player, vision, game_state)
+        assert target == 2
+
+        game_state.get_visibility(1).update([(10, 10, 1)])
+        target = Targeting.find_closest_enemy(my_id, my_pos, my_player, vision, game_state)
+        assert target is None